@@ -3,16 +3,19 @@ import asyncio
 import logging
 from datetime import timedelta
 from pathlib import Path
+from time import monotonic
+from types import MappingProxyType
 from typing import Final
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_SCAN_INTERVAL, CONF_TYPE, CONF_NAME, CONF_USERNAME, CONF_PASSWORD
-from homeassistant.core import HomeAssistant, Event
+from homeassistant.const import CONF_HOST, CONF_SCAN_INTERVAL, CONF_TYPE, CONF_NAME, CONF_USERNAME, CONF_PASSWORD, \
+    EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import HomeAssistant, Event, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import entity_registry, config_validation as config_val, device_registry as device_reg
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity import EntityDescription
-from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.helpers.storage import STORAGE_DIR, Store
 from homeassistant.helpers.typing import UNDEFINED
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.loader import async_get_integration
@@ -58,7 +61,19 @@ from .const import (
     CONF_SYSTYPE_INVERTER,
     CONF_SYSTYPE_WEB,
     CONF_IGNORE_SYSTEM_STATE,
+    CONF_LALA_MAX_PARALLEL_REQUESTS,
+    CONF_LALA_MEDIUM_INTERVAL,
+    CONF_LALA_SLOW_INTERVAL,
+    CONF_LALA_HISTORY_DEPTH,
+    DEFAULT_LALA_MAX_PARALLEL_REQUESTS,
+    DEFAULT_LALA_MEDIUM_INTERVAL,
+    DEFAULT_LALA_SLOW_INTERVAL,
+    DEFAULT_LALA_HISTORY_DEPTH,
+    ENERGY_STORE_VERSION,
+    ENERGY_STORE_SAVE_INTERVAL,
     CONF_INCLUDE_WALLBOX_IN_HOUSE_CONSUMPTION,
+    CONF_APP_MAX_PARALLEL_REQUESTS,
+    DEFAULT_APP_MAX_PARALLEL_REQUESTS,
     CONF_TOTP_ALREADY_USED,
     CONF_MUST_START_POST_MIGRATION_PROCESS,
 
@@ -78,6 +93,11 @@ from .const import (
     QUERY_SPARE_CAPACITY_KEY,
     QUERY_PEAK_SHAVING_KEY,
     IGNORE_SYSTEM_STATE_KEY,
+    QUERY_FIELDS_KEY,
+    LALA_MAX_PARALLEL_REQUESTS_KEY,
+    LALA_MEDIUM_INTERVAL_KEY,
+    LALA_SLOW_INTERVAL_KEY,
+    LALA_HISTORY_DEPTH_KEY,
     SERVICE_SET_PEAKSHAVING,
     CONFIG_VERSION,
     CONFIG_MINOR_VERSION,
@@ -207,7 +227,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     asyncio.create_task(check_device_registry(hass, config_entry.entry_id))
 
     log_scan_interval = timedelta(seconds=config_entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL_SENECV2))
-    _LOGGER.info(f"Starting SENEC.Home Integration '{config_entry.data.get(CONF_NAME)}' with interval:{log_scan_interval} - ConfigEntry: {util.mask_map(dict(config_entry.as_dict()))}")
+    _LOGGER.info("Starting SENEC.Home Integration '%s' with interval:%s - ConfigEntry: %s", config_entry.data.get(CONF_NAME), log_scan_interval, util.lazy_mask_map(dict(config_entry.as_dict())))
 
     # check if we have a valid manifest_version
     coordinator = SenecDataUpdateCoordinator(hass, config_entry, intg_version)
@@ -220,7 +240,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
         # we need to log in into the SenecApp and authenticate the user via the web-portal
         try:
             await coordinator.senec.authenticate_all()
-            _LOGGER.info(f"authenticate_all() completed -> main data: {util.mask_map(coordinator.senec.get_debug_login_data())}")
+            _LOGGER.info("authenticate_all() completed -> main data: %s", util.lazy_mask_map(coordinator.senec.get_debug_login_data()))
         except ReConfigurationRequired:
             _LOGGER.warning("ReConfigurationRequired - we need to re-authenticate the user")
             # we will not do this here, but let the HomeAssistant handle this for us
@@ -245,6 +265,13 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
         # after the refresh, we should know if the lala.cgi return STATISTIC data
         # or not...
         coordinator._statistics_available = coordinator.senec.grid_total_export is not None
+        if not coordinator._statistics_available:
+            # NPU 2408+: the energy totals will be integrated from the power values
+            await coordinator.async_restore_energy_totals()
+            # the totals are saved only every ENERGY_STORE_SAVE_INTERVAL - so the latest values must be
+            # written when HA stops
+            config_entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE,
+                                                                    coordinator.async_final_write_energy_totals))
         await coordinator.senec.update_version()
 
         coordinator._device_type = SYSTYPE_NAME_SENEC
@@ -255,6 +282,10 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
         coordinator._device_serial = f"S{coordinator.senec.device_id}"
         coordinator._device_version = coordinator.senec.versions
 
+        # enabling/disabling entities will update the requested lala.cgi data without the need of a reload
+        config_entry.async_on_unload(hass.bus.async_listen(entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+                                                           coordinator.async_local_entity_registry_updated))
+
         # Search the (optional) sibling SenecOnline for this SenecLocal via serialnumber and connect them
         for a_other_coord in hass.data[DOMAIN].values():
           if isinstance(a_other_coord, SenecDataUpdateCoordinator) and isinstance(a_other_coord.senec, SenecOnline):
@@ -288,6 +319,10 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
         # we launch the check_for_migration_tasks worker...
         hass.async_create_task(coordinator.check_for_post_migration_tasks(hass))
 
+        # a pending (delayed) write of the totals cache file must not get lost when HA stops
+        config_entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE,
+                                                                coordinator.async_app_flush_storage))
+
         # Search the (optional) sibling SenecLocal for this SenecOnline via serialnumber and connect them
         for a_other_coord in hass.data[DOMAIN].values():
           if isinstance(a_other_coord, SenecDataUpdateCoordinator) and isinstance(a_other_coord.senec, SenecLocal):
@@ -396,6 +431,68 @@ LOCAL_SECTION_MAPPING: Final = {
     SENEC_SECTION_FAN_SPEED:(QUERY_FANDATA_KEY, "***** QUERY_FAN-DATA ********"),
     SENEC_SECTION_SOCKETS:  (QUERY_SOCKETS_KEY, "***** QUERY_SOCKET-DATA ********")
 }
+LOCAL_DEFAULT_QUERY_OPTIONS: Final = {
+    QUERY_PV1_KEY: False,
+    QUERY_PM1OBJ1_KEY: False,
+    QUERY_PM1OBJ2_KEY: False,
+    QUERY_BMS_KEY: False,
+    QUERY_BMS_CELLS_KEY: False,
+    QUERY_WALLBOX_KEY: False,
+    QUERY_FANDATA_KEY: False,
+    QUERY_SOCKETS_KEY: False,
+    QUERY_FIELDS_KEY: None
+}
+
+def get_local_query_options(hass: HomeAssistant, config_entry: ConfigEntry) -> dict | None:
+    registry = entity_registry.async_get(hass)
+    if registry is None:
+        return None
+
+    all_local_entities = entity_registry.async_entries_for_config_entry(registry, config_entry.entry_id)
+    if len(all_local_entities) == 0:
+        return None
+
+    opt = {**LOCAL_DEFAULT_QUERY_OPTIONS}
+    # the lala.cgi fields per section that are required by the enabled entities ('None' = the complete section)
+    query_fields = {}
+    _LOGGER.debug(f"all entities for config_entry {config_entry.entry_id} [{config_entry.title}] fetched - total number is: {len(all_local_entities)}")
+    for a_entity in all_local_entities:
+        if a_entity.disabled_by is None:
+            a_id = a_entity.entity_id
+            _LOGGER.debug(f"Entity '{a_id}' is enabled for {config_entry.title}")
+            # check if the entity is a sensor, binary_sensor, switch, number or select
+            a_entity_platform = a_id.split(".")[0]
+            if a_entity_platform in LOCAL_PLATFORM_MAPPING:
+                for a_entity_desc in LOCAL_PLATFORM_MAPPING[a_entity_platform]:
+                    # truncating the stupid possible existing _2, _3 ... _10
+                    # simplest solution, first right trim all digits, then trim the _
+                    if not(a_id.endswith("_p1") or a_id.endswith("_p2") or a_id.endswith("_p3")):
+                        a_id = a_id.rstrip("0123456789").rstrip("_")
+                    if a_id.endswith(a_entity_desc.key):
+                        if hasattr(a_entity_desc, "senec_lala_section"):
+                            a_lala_section  = a_entity_desc.senec_lala_section
+                            if a_lala_section in LOCAL_SECTION_MAPPING:
+                                query_option_key, a_log_msg = LOCAL_SECTION_MAPPING[a_lala_section]
+                                if not opt[query_option_key]:
+                                    opt[query_option_key] = True
+                                    _LOGGER.info(a_log_msg)
+
+                                # the BMS cell data is part of the BMS section
+                                a_fields_section = SENEC_SECTION_BMS if a_lala_section == SENEC_SECTION_BMS_CELLS else a_lala_section
+                                a_lala_fields = getattr(a_entity_desc, "senec_lala_fields", None)
+                                if a_lala_fields is None:
+                                    query_fields[a_fields_section] = None
+                                elif a_fields_section not in query_fields:
+                                    query_fields[a_fields_section] = set(a_lala_fields)
+                                elif query_fields[a_fields_section] is not None:
+                                    query_fields[a_fields_section].update(a_lala_fields)
+
+                        _LOGGER.debug(f"Found a EntityDescription for '{a_id}' key: {a_entity_desc.key}")
+                        break
+
+    opt[QUERY_FIELDS_KEY] = {a_section: frozenset(a_fields) for a_section, a_fields in query_fields.items() if a_fields is not None}
+    return opt
+
 
 class SenecDataUpdateCoordinator(DataUpdateCoordinator):
     """Define an object to hold Senec data."""
@@ -405,6 +502,14 @@ class SenecDataUpdateCoordinator(DataUpdateCoordinator):
         self._config_entry_id = config_entry.entry_id
         self._integration_version = intg_version
         self._total_increasing_sensors = []
+        # the changed lala.cgi fields of the last refresh (None = all entities must be updated)
+        self._lala_changes = None
+        # the api values of all added entities will be resolved once per refresh: (attr, args) -> value
+        self._value_sources = {}
+        self._value_snapshot = MappingProxyType({})
+        # the locally integrated energy totals (only used, when the lala.cgi does not provide STATISTIC data)
+        self._energy_store = None
+        self._energy_store_ts = 0
 
         """Initialize."""
         # Build-In INVERTER
@@ -418,6 +523,7 @@ class SenecDataUpdateCoordinator(DataUpdateCoordinator):
             self._host = "mein-senec.de"
             config_entry_serial_number = config_entry.data.get(CONF_DEV_SERIAL, None)
             include_wallbox_in_house_consumption = config_entry.data.get(CONF_INCLUDE_WALLBOX_IN_HOUSE_CONSUMPTION, True)
+            app_max_parallel_requests = config_entry.data.get(CONF_APP_MAX_PARALLEL_REQUESTS, DEFAULT_APP_MAX_PARALLEL_REQUESTS)
 
             # user & pwd can be changed via the options...
             user = config_entry.data[CONF_USERNAME]
@@ -444,7 +550,8 @@ class SenecDataUpdateCoordinator(DataUpdateCoordinator):
                 QUERY_TOTALS_KEY: False,
                 QUERY_SYSTEM_DETAILS_KEY: False,
                 QUERY_SGREADY_KEY: False,
-                CONF_INCLUDE_WALLBOX_IN_HOUSE_CONSUMPTION: include_wallbox_in_house_consumption
+                CONF_INCLUDE_WALLBOX_IN_HOUSE_CONSUMPTION: include_wallbox_in_house_consumption,
+                CONF_APP_MAX_PARALLEL_REQUESTS: app_max_parallel_requests
             }
 
             if hass is not None and config_entry.entry_id is not None and config_entry.title is not None:
@@ -575,56 +682,26 @@ class SenecDataUpdateCoordinator(DataUpdateCoordinator):
 
             opt = {
                 IGNORE_SYSTEM_STATE_KEY: config_entry.data.get(CONF_IGNORE_SYSTEM_STATE, False),
-                QUERY_PV1_KEY: False,
-                QUERY_PM1OBJ1_KEY: False,
-                QUERY_PM1OBJ2_KEY: False,
-                QUERY_BMS_KEY: False,
-                QUERY_BMS_CELLS_KEY: False,
-                QUERY_WALLBOX_KEY: False,
-                QUERY_FANDATA_KEY: False,
-                QUERY_SOCKETS_KEY: False
+                LALA_MAX_PARALLEL_REQUESTS_KEY: config_entry.data.get(CONF_LALA_MAX_PARALLEL_REQUESTS, DEFAULT_LALA_MAX_PARALLEL_REQUESTS),
+                LALA_MEDIUM_INTERVAL_KEY: config_entry.data.get(CONF_LALA_MEDIUM_INTERVAL, DEFAULT_LALA_MEDIUM_INTERVAL),
+                LALA_SLOW_INTERVAL_KEY: config_entry.data.get(CONF_LALA_SLOW_INTERVAL, DEFAULT_LALA_SLOW_INTERVAL),
+                LALA_HISTORY_DEPTH_KEY: config_entry.data.get(CONF_LALA_HISTORY_DEPTH, DEFAULT_LALA_HISTORY_DEPTH)
             }
 
             # check if any of the wallbox-sensors is enabled... and only THEN
             # we will include the 'WALLBOX' in our POST to the lala.cgi
-            use_defaults = True
+            query_opt = None
             if hass is not None and config_entry.entry_id is not None and config_entry.title is not None:
-                registry = entity_registry.async_get(hass)
-                if registry is not None:
-                    all_local_entities = entity_registry.async_entries_for_config_entry(registry, config_entry.entry_id)
-                    if len(all_local_entities) > 0:
-                        use_defaults = False
-                        _LOGGER.debug(f"all entities for config_entry {config_entry.entry_id} [{config_entry.title}] fetched - total number is: {len(all_local_entities)}")
-                        for a_entity in all_local_entities:
-                            if a_entity.disabled_by is None:
-                                a_id = a_entity.entity_id
-                                _LOGGER.debug(f"Entity '{a_id}' is enabled for {config_entry.title}")
-                                # check if the entity is a sensor, binary_sensor, switch, number or select
-                                a_entity_platform = a_id.split(".")[0]
-                                if a_entity_platform in LOCAL_PLATFORM_MAPPING:
-                                    for a_entity_desc in LOCAL_PLATFORM_MAPPING[a_entity_platform]:
-                                        # truncating the stupid possible existing _2, _3 ... _10
-                                        # simplest solution, first right trim all digits, then trim the _
-                                        if not(a_id.endswith("_p1") or a_id.endswith("_p2") or a_id.endswith("_p3")):
-                                            a_id = a_id.rstrip("0123456789").rstrip("_")
-                                        if a_id.endswith(a_entity_desc.key):
-                                            if hasattr(a_entity_desc, "senec_lala_section"):
-                                                a_lala_section  = a_entity_desc.senec_lala_section
-                                                if a_lala_section in LOCAL_SECTION_MAPPING:
-                                                    query_option_key, a_log_msg = LOCAL_SECTION_MAPPING[a_lala_section]
-                                                    if not opt[query_option_key]:
-                                                        opt[query_option_key] = True
-                                                        _LOGGER.info(a_log_msg)
-
-                                            _LOGGER.debug(f"Found a EntityDescription for '{a_id}' key: {a_entity_desc.key}")
-                                            break
-
-            if use_defaults:
+                query_opt = get_local_query_options(hass, config_entry)
+
+            if query_opt is None:
                 # if there are no entities yet... we slightly adjust our defaults!
                 _LOGGER.info(f"NO entities for config_entry fetched! Using default options")
-                opt[QUERY_PV1_KEY] = True
-                opt[QUERY_PM1OBJ1_KEY] = True
-                opt[QUERY_BMS_KEY] = True
+                query_opt = {**LOCAL_DEFAULT_QUERY_OPTIONS,
+                             QUERY_PV1_KEY: True,
+                             QUERY_PM1OBJ1_KEY: True,
+                             QUERY_BMS_KEY: True}
+            opt.update(query_opt)
 
             self.senec = SenecLocal(host=self._host, use_https=self._use_https, lala_session=async_get_clientsession(hass, verify_ssl=False),
                                     lang=hass.config.language.lower(), options=opt,
@@ -650,6 +727,26 @@ class SenecDataUpdateCoordinator(DataUpdateCoordinator):
         _LOGGER.warning(str(evt))
         return True
 
+    @callback
+    def async_local_entity_registry_updated(self, evt: Event) -> None:
+        # when an entity of this (local) config_entry has been enabled/disabled we update the lala.cgi
+        # query options (sections & fields) of our SenecLocal instance right away
+        if evt.data.get("action") != "update" or "disabled_by" not in evt.data.get("changes", {}):
+            return
+        a_entry = entity_registry.async_get(self.hass).async_get(evt.data.get("entity_id"))
+        if a_entry is None or a_entry.config_entry_id != self._config_entry_id:
+            return
+
+        query_opt = get_local_query_options(self.hass, self._config_entry)
+        if query_opt is not None and isinstance(self.senec, SenecLocal):
+            _LOGGER.debug(f"async_local_entity_registry_updated(): '{a_entry.entity_id}' changed - update query options")
+            self.senec.update_query_options(query_opt)
+
+    async def async_app_flush_storage(self, evt: Event) -> None:
+        if isinstance(self.senec, SenecOnline):
+            self.senec.app_cancel_token_refresh(reset_valid_till=False)
+            await self.senec.app_flush_storage()
+
     async def check_for_post_migration_tasks(self, hass: HomeAssistant):
         _LOGGER.debug(f"check_for_post_migration_tasks() called")
         if CONF_MUST_START_POST_MIGRATION_PROCESS in self._config_entry.data:
@@ -683,8 +780,14 @@ class SenecDataUpdateCoordinator(DataUpdateCoordinator):
         _LOGGER.debug(f"_async_update_data called")
         try:
             await self.senec.update()
+            if isinstance(self.senec, SenecLocal):
+                # after a failed refresh all entities must be updated (availability)
+                a_changes = self.senec.pop_lala_changes()
+                self._lala_changes = a_changes if self.last_update_success else None
+            self.refresh_value_snapshot()
+            self._schedule_energy_totals_save()
             data = self.senec.dict_data();
-            _LOGGER.debug(f"read: {util.mask_map(data)}")
+            _LOGGER.debug("read: %s", util.lazy_mask_map(data))
             return data
         except UpdateFailed as exception:
             _LOGGER.warning(f"UpdateFailed: {exception}")
@@ -693,9 +796,34 @@ class SenecDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.warning(f"Exception (fatal): {type(fatal).__name__} {fatal}")
             raise UpdateFailed() from fatal
 
+    def lala_values_unchanged(self, description: EntityDescription) -> bool:
+        # True, when none of the lala.cgi fields the entity depends on has changed with the last refresh
+        if self._lala_changes is None or description is None:
+            return False
+        a_lala_section = getattr(description, "senec_lala_section", None)
+        if a_lala_section is None:
+            return False
+
+        # the BMS cell data is part of the BMS section
+        if a_lala_section == SENEC_SECTION_BMS_CELLS:
+            a_lala_section = SENEC_SECTION_BMS
+        if a_lala_section in self._lala_changes:
+            a_changed_fields = self._lala_changes[a_lala_section]
+            a_lala_fields = getattr(description, "senec_lala_fields", None)
+            if a_changed_fields is None or a_lala_fields is None or not a_changed_fields.isdisjoint(a_lala_fields):
+                return False
+
+        a_extra_sections = getattr(description, "senec_lala_extra_sections", None)
+        if a_extra_sections is not None:
+            for a_extra_section in a_extra_sections:
+                if a_extra_section in self._lala_changes:
+                    return False
+        return True
+
     async def _async_switch_to_state(self, switch_key, state):
         try:
             await self.senec.switch(switch_key, state)
+            self.refresh_value_snapshot()
             return self.senec.dict_data()
         except UpdateFailed as exception:
             _LOGGER.warning(f"UpdateFailed: {exception}")
@@ -707,6 +835,7 @@ class SenecDataUpdateCoordinator(DataUpdateCoordinator):
     async def _async_switch_array_to_state(self, switch_array_key, array_pos, state):
         try:
             await self.senec.switch_array(switch_array_key, array_pos, state)
+            self.refresh_value_snapshot()
             return self.senec.dict_data()
         except UpdateFailed as exception:
             _LOGGER.warning(f"UpdateFailed: {exception}")
@@ -718,6 +847,7 @@ class SenecDataUpdateCoordinator(DataUpdateCoordinator):
     async def _async_set_string_value(self, set_str_key, value: str):
         try:
             await self.senec.set_string_value(set_str_key, value)
+            self.refresh_value_snapshot()
             return self.senec.dict_data()
         except UpdateFailed as exception:
             _LOGGER.warning(f"UpdateFailed: {exception}")
@@ -729,6 +859,7 @@ class SenecDataUpdateCoordinator(DataUpdateCoordinator):
     async def _async_trigger_button(self, trigger_key:str, payload: str):
         try:
             await self.senec._trigger_button(trigger_key, payload)
+            self.refresh_value_snapshot()
             return self.senec.dict_data()
         except UpdateFailed as exception:
             _LOGGER.warning(f"UpdateFailed: {exception}")
@@ -737,6 +868,46 @@ class SenecDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.warning(f"Exception (fatal): {type(fatal).__name__} {fatal}")
             raise UpdateFailed() from fatal
 
+    def add_value_source(self, source: tuple):
+        self._value_sources[source] = self._value_sources.get(source, 0) + 1
+
+    def remove_value_source(self, source: tuple):
+        a_count = self._value_sources.get(source, 0) - 1
+        if a_count > 0:
+            self._value_sources[source] = a_count
+        else:
+            self._value_sources.pop(source, None)
+
+    def refresh_value_snapshot(self):
+        self._value_snapshot = util.snapshot(self.senec, self._value_sources)
+
+    def get_value(self, source: tuple):
+        # entities that have been added after the last refresh will be resolved live
+        if source in self._value_snapshot:
+            return self._value_snapshot[source]
+        return util.get_value(self.senec, *source)
+
+    async def async_restore_energy_totals(self):
+        self._energy_store = Store(self.hass, ENERGY_STORE_VERSION, f"{DOMAIN}.{self._config_entry_id}.energy")
+        try:
+            self.senec.restore_energy_checkpoint(await self._energy_store.async_load())
+        except Exception as exc:
+            _LOGGER.warning(f"async_restore_energy_totals(): could not load the stored energy totals - {type(exc).__name__}: {exc}")
+        self._energy_store_ts = monotonic()
+
+    def _schedule_energy_totals_save(self):
+        if self._energy_store is not None and monotonic() - self._energy_store_ts >= ENERGY_STORE_SAVE_INTERVAL:
+            self._energy_store_ts = monotonic()
+            # the data will be collected when the store is written
+            self._energy_store.async_delay_save(self.senec.energy_checkpoint, 1)
+
+    async def async_save_energy_totals(self):
+        if self._energy_store is not None:
+            await self._energy_store.async_save(self.senec.energy_checkpoint())
+
+    async def async_final_write_energy_totals(self, evt: Event) -> None:
+        await self.async_save_energy_totals()
+
     def add_total_increasing_sensor(self, sensor):
         self._total_increasing_sensors.append(sensor)
         _LOGGER.debug(f"Added total increasing sensor: {sensor.entity_description.key} to coordinator")
@@ -759,11 +930,15 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry):
         if DOMAIN in hass.data and config_entry.entry_id in hass.data[DOMAIN]:
             try:
                 the_unload_coordinator = hass.data[DOMAIN][config_entry.entry_id]
+                await the_unload_coordinator.async_save_energy_totals()
 
                 # we must find all other (still present) coordinator's where this
                 # SenecLocal (or SenecOnline) is referred as 'self._bridge_to_senec_...'
                 is_local = isinstance(the_unload_coordinator.senec, SenecLocal)
                 is_online  = isinstance(the_unload_coordinator.senec, SenecOnline)
+                if is_online:
+                    the_unload_coordinator.senec.app_cancel_token_refresh()
+                    await the_unload_coordinator.senec.app_flush_storage()
                 if is_local or is_online:
                     for a_other_coord in hass.data[DOMAIN].values():
                         if isinstance(a_other_coord, SenecDataUpdateCoordinator):
@@ -799,6 +974,11 @@ class SenecEntity(CustomFriendlyNameEntity):
     """Defines a base Senec entity."""
 
     _attr_has_entity_name = True
+    # when True, the state will be only written when (at least) one of the lala.cgi fields of the entity
+    # has changed with the last refresh
+    _skip_unchanged_lala_updates = False
+    # when True, the api value of the entity will be part of the per refresh value snapshot
+    _has_api_value = True
 
     def __init__(
             self, coordinator: SenecDataUpdateCoordinator, description: EntityDescription
@@ -808,6 +988,37 @@ class SenecEntity(CustomFriendlyNameEntity):
         self.entity_description = description
         self._name = coordinator._config_entry.title
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if self._skip_unchanged_lala_updates and self.coordinator.lala_values_unchanged(self.entity_description):
+            return
+        super()._handle_coordinator_update()
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if self._has_api_value:
+            self.coordinator.add_value_source(self._value_source)
+
+    async def async_will_remove_from_hass(self) -> None:
+        if self._has_api_value:
+            self.coordinator.remove_value_source(self._value_source)
+        await super().async_will_remove_from_hass()
+
+    @property
+    def _value_source(self) -> tuple:
+        # the (attr, args) of the api value of this entity - SENEC.Connect entities are calling a method, the
+        # array entities are sharing the complete array
+        a_system_id = getattr(self, "system_id", None)
+        if a_system_id is not None:
+            return self.entity_description.key, (a_system_id, getattr(self, "wallbox_id", None))
+        a_array_key = getattr(self.entity_description, "array_key", None)
+        if a_array_key is not None:
+            return a_array_key, None
+        return self.entity_description.key, None
+
+    def _api_value(self):
+        return self.coordinator.get_value(self._value_source)
+
     @property
     def device_info(self) -> dict:
         """Return info for device registry."""
@@ -70,6 +70,8 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
 
 
 class SenecBinarySensor(SenecEntity, BinarySensorEntity):
+    _skip_unchanged_lala_updates = True
+
     def __init__(
             self,
             a_coordinator: SenecDataUpdateCoordinator,
@@ -114,15 +116,15 @@ class SenecBinarySensor(SenecEntity, BinarySensorEntity):
 
         try:
             if self.system_id is not None:
-                value = getattr(self.coordinator.senec, self.entity_description.key)(self.system_id, self.wallbox_id)
+                value = self._api_value()
             elif self.entity_description.array_key is not None:
-                data = getattr(self.coordinator.senec, self.entity_description.array_key)
+                data = self._api_value()
                 if data is not None and len(data) > self.entity_description.array_pos:
                     value = data[self.entity_description.array_pos] in on_vals
                 else:
                     value = None
             else:
-                value = getattr(self.coordinator.senec, self.entity_description.key)
+                value = self._api_value()
                 if isinstance(value, int):
                     value = value in on_vals
 
@@ -62,6 +62,8 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, add_
 
 
 class SenecButton(SenecEntity, ButtonEntity):
+    _has_api_value = False
+
     def __init__(self, coordinator: SenecDataUpdateCoordinator, description: ExtButtonEntityDescription):
         super().__init__(coordinator=coordinator, description=description)
         if (hasattr(self.entity_description, 'entity_registry_enabled_default')):
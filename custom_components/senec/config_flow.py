@@ -65,9 +65,19 @@ from .const import (
     CONF_SYSTYPE_WEB,
     CONF_SYSTYPE_SENECCONNECT,
     CONF_IGNORE_SYSTEM_STATE,
+    CONF_LALA_MAX_PARALLEL_REQUESTS,
+    CONF_LALA_MEDIUM_INTERVAL,
+    CONF_LALA_SLOW_INTERVAL,
+    CONF_LALA_HISTORY_DEPTH,
+    DEFAULT_LALA_MAX_PARALLEL_REQUESTS,
+    DEFAULT_LALA_MEDIUM_INTERVAL,
+    DEFAULT_LALA_SLOW_INTERVAL,
+    DEFAULT_LALA_HISTORY_DEPTH,
     CONFIG_VERSION,
     CONFIG_MINOR_VERSION,
     CONF_INCLUDE_WALLBOX_IN_HOUSE_CONSUMPTION,
+    CONF_APP_MAX_PARALLEL_REQUESTS,
+    DEFAULT_APP_MAX_PARALLEL_REQUESTS,
     WEBAPI_TYPES,
     WEBAPI_PUBLIC,
     WEBAPI_PRIVATE,
@@ -142,11 +152,16 @@ class SenecConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # local/inverter defaults
         self._default_host = None
         self._default_ignore_system_state = False
+        self._default_lala_max_parallel_requests = DEFAULT_LALA_MAX_PARALLEL_REQUESTS
+        self._default_lala_medium_interval = DEFAULT_LALA_MEDIUM_INTERVAL
+        self._default_lala_slow_interval = DEFAULT_LALA_SLOW_INTERVAL
+        self._default_lala_history_depth = DEFAULT_LALA_HISTORY_DEPTH
         # web-api defaults
         self._default_user = None
         self._default_pwd = None
         self._default_totp = None
         self._default_include_wallbox_in_house_consumption = True
+        self._default_app_max_parallel_requests = DEFAULT_APP_MAX_PARALLEL_REQUESTS
         self._default_serial = None
         # SENEC.connect
         self._default_senecconnectkey = ""
@@ -182,6 +197,10 @@ class SenecConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._default_interval  = entry_data[CONF_SCAN_INTERVAL]
             self._default_host      = entry_data[CONF_HOST]
             self._default_ignore_system_state = entry_data.get(CONF_IGNORE_SYSTEM_STATE, False)
+            self._default_lala_max_parallel_requests = entry_data.get(CONF_LALA_MAX_PARALLEL_REQUESTS, DEFAULT_LALA_MAX_PARALLEL_REQUESTS)
+            self._default_lala_medium_interval = entry_data.get(CONF_LALA_MEDIUM_INTERVAL, DEFAULT_LALA_MEDIUM_INTERVAL)
+            self._default_lala_slow_interval = entry_data.get(CONF_LALA_SLOW_INTERVAL, DEFAULT_LALA_SLOW_INTERVAL)
+            self._default_lala_history_depth = entry_data.get(CONF_LALA_HISTORY_DEPTH, DEFAULT_LALA_HISTORY_DEPTH)
             return await self.async_step_localsystem()
 
         elif self._selected_system == CONF_SYSTYPE_WEB:
@@ -191,6 +210,7 @@ class SenecConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._default_pwd       = entry_data[CONF_PASSWORD]
             self._default_totp      = entry_data.get(CONF_TOTP_URL, entry_data.get(CONF_TOTP_SECRET, "")) # TOTP can be empty!!!
             self._default_include_wallbox_in_house_consumption = entry_data.get(CONF_INCLUDE_WALLBOX_IN_HOUSE_CONSUMPTION, True)
+            self._default_app_max_parallel_requests = entry_data.get(CONF_APP_MAX_PARALLEL_REQUESTS, DEFAULT_APP_MAX_PARALLEL_REQUESTS)
             if CONF_DEV_SERIAL in entry_data:
                 self._default_serial= entry_data[CONF_DEV_SERIAL]
             else:
@@ -475,6 +495,10 @@ class SenecConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         CONF_HOST: host_entry,
                         CONF_SCAN_INTERVAL: max(user_input[CONF_SCAN_INTERVAL], DEFAULT_MIN_SCAN_INTERVAL),
                         CONF_IGNORE_SYSTEM_STATE: user_input[CONF_IGNORE_SYSTEM_STATE],
+                        CONF_LALA_MAX_PARALLEL_REQUESTS: max(user_input.get(CONF_LALA_MAX_PARALLEL_REQUESTS, DEFAULT_LALA_MAX_PARALLEL_REQUESTS), 1),
+                        CONF_LALA_MEDIUM_INTERVAL: max(user_input.get(CONF_LALA_MEDIUM_INTERVAL, DEFAULT_LALA_MEDIUM_INTERVAL), 0),
+                        CONF_LALA_SLOW_INTERVAL: max(user_input.get(CONF_LALA_SLOW_INTERVAL, DEFAULT_LALA_SLOW_INTERVAL), 0),
+                        CONF_LALA_HISTORY_DEPTH: max(user_input.get(CONF_LALA_HISTORY_DEPTH, DEFAULT_LALA_HISTORY_DEPTH), 0),
                         CONF_USE_HTTPS: self._use_https,
                         CONF_DEV_TYPE_INT: self._device_type_internal,
                         CONF_DEV_TYPE: self._device_type,
@@ -509,7 +533,11 @@ class SenecConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         else:
             user_input = {
-                CONF_IGNORE_SYSTEM_STATE: self._default_ignore_system_state
+                CONF_IGNORE_SYSTEM_STATE: self._default_ignore_system_state,
+                CONF_LALA_MAX_PARALLEL_REQUESTS: self._default_lala_max_parallel_requests,
+                CONF_LALA_MEDIUM_INTERVAL: self._default_lala_medium_interval,
+                CONF_LALA_SLOW_INTERVAL: self._default_lala_slow_interval,
+                CONF_LALA_HISTORY_DEPTH: self._default_lala_history_depth
             }
 
             if all(x is not None for x in [self._default_name, self._default_host]):
@@ -536,7 +564,11 @@ class SenecConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     vol.Required(CONF_NAME, default=user_input[CONF_NAME]): str,
                     vol.Required(CONF_HOST, default=user_input[CONF_HOST]): str,
                     vol.Required(CONF_SCAN_INTERVAL, default=user_input[CONF_SCAN_INTERVAL]): int,
-                    vol.Required(CONF_IGNORE_SYSTEM_STATE, default=user_input[CONF_IGNORE_SYSTEM_STATE]): bool}
+                    vol.Required(CONF_IGNORE_SYSTEM_STATE, default=user_input[CONF_IGNORE_SYSTEM_STATE]): bool,
+                    vol.Required(CONF_LALA_MAX_PARALLEL_REQUESTS, default=user_input[CONF_LALA_MAX_PARALLEL_REQUESTS]): vol.All(int, vol.Range(min=1, max=8)),
+                    vol.Required(CONF_LALA_MEDIUM_INTERVAL, default=user_input[CONF_LALA_MEDIUM_INTERVAL]): vol.All(int, vol.Range(min=0)),
+                    vol.Required(CONF_LALA_SLOW_INTERVAL, default=user_input[CONF_LALA_SLOW_INTERVAL]): vol.All(int, vol.Range(min=0)),
+                    vol.Required(CONF_LALA_HISTORY_DEPTH, default=user_input[CONF_LALA_HISTORY_DEPTH]): vol.All(int, vol.Range(min=0, max=3600))}
                 )
             else:
                 a_schema = vol.Schema({
@@ -654,6 +686,7 @@ class SenecConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             totp_entry = user_input[key_creden][CONF_TOTP_SECRET]
             totp_url_entry = None
             include_wallbox_in_house_consumption = user_input[key_expert][CONF_INCLUDE_WALLBOX_IN_HOUSE_CONSUMPTION]
+            app_max_parallel_requests = max(user_input[key_expert].get(CONF_APP_MAX_PARALLEL_REQUESTS, DEFAULT_APP_MAX_PARALLEL_REQUESTS), 1)
 
             if totp_entry is not None:
                 if len(totp_entry) == 0:
@@ -709,7 +742,8 @@ class SenecConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                        CONF_TOTP_SECRET: totp_entry,
                        CONF_TOTP_URL: totp_url_entry,
                        CONF_SCAN_INTERVAL: scan_entry,
-                       CONF_INCLUDE_WALLBOX_IN_HOUSE_CONSUMPTION: include_wallbox_in_house_consumption
+                       CONF_INCLUDE_WALLBOX_IN_HOUSE_CONSUMPTION: include_wallbox_in_house_consumption,
+                       CONF_APP_MAX_PARALLEL_REQUESTS: app_max_parallel_requests
                    }
                    return await self.async_step_selectserial()
                 else:
@@ -724,6 +758,7 @@ class SenecConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                             CONF_TOTP_URL: totp_url_entry,
                             CONF_SCAN_INTERVAL: scan_entry,
                             CONF_INCLUDE_WALLBOX_IN_HOUSE_CONSUMPTION: include_wallbox_in_house_consumption,
+                            CONF_APP_MAX_PARALLEL_REQUESTS: app_max_parallel_requests,
                             CONF_DEV_TYPE_INT: self._device_type_internal, # must check what function this has for 'online' systems
                             CONF_DEV_TYPE: self._device_type,
                             CONF_DEV_MODEL: self._device_model,
@@ -755,7 +790,8 @@ class SenecConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         CONF_TOTP_SECRET: self._default_totp
                     },
                     key_expert: {
-                        CONF_INCLUDE_WALLBOX_IN_HOUSE_CONSUMPTION: self._default_include_wallbox_in_house_consumption
+                        CONF_INCLUDE_WALLBOX_IN_HOUSE_CONSUMPTION: self._default_include_wallbox_in_house_consumption,
+                        CONF_APP_MAX_PARALLEL_REQUESTS: self._default_app_max_parallel_requests
                     }
                 }
             else:
@@ -768,7 +804,8 @@ class SenecConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         CONF_TOTP_SECRET: ""
                     },
                     key_expert: {
-                        CONF_INCLUDE_WALLBOX_IN_HOUSE_CONSUMPTION: True
+                        CONF_INCLUDE_WALLBOX_IN_HOUSE_CONSUMPTION: True,
+                        CONF_APP_MAX_PARALLEL_REQUESTS: DEFAULT_APP_MAX_PARALLEL_REQUESTS
                     }
                 }
 
@@ -794,6 +831,7 @@ class SenecConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     vol.Optional(key_expert): section(
                         vol.Schema({
                             vol.Required(CONF_INCLUDE_WALLBOX_IN_HOUSE_CONSUMPTION, default=user_input[key_expert][CONF_INCLUDE_WALLBOX_IN_HOUSE_CONSUMPTION]): bool,
+                            vol.Required(CONF_APP_MAX_PARALLEL_REQUESTS, default=user_input[key_expert][CONF_APP_MAX_PARALLEL_REQUESTS]): vol.All(int, vol.Range(min=1, max=8)),
                             # WE don't show the (configured) serial - user should not EDIT it!
                             #vol.Optional(CONF_DEV_SERIAL, default=user_input[key_expert][CONF_DEV_SERIAL]): str,
                         }),
@@ -868,6 +906,7 @@ class SenecConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._default_pwd       = self.reauth_entry.data[CONF_PASSWORD]
             self._default_totp      = self.reauth_entry.data.get(CONF_TOTP_URL, self.reauth_entry.data.get(CONF_TOTP_SECRET, "")) # TOTP can be empty!!!
             self._default_include_wallbox_in_house_consumption = self.reauth_entry.data.get(CONF_INCLUDE_WALLBOX_IN_HOUSE_CONSUMPTION, True)
+            self._default_app_max_parallel_requests = self.reauth_entry.data.get(CONF_APP_MAX_PARALLEL_REQUESTS, DEFAULT_APP_MAX_PARALLEL_REQUESTS)
             if CONF_DEV_SERIAL in self.reauth_entry.data:
                 self._default_serial = self.reauth_entry.data[CONF_DEV_SERIAL]
             else:
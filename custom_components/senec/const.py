@@ -98,7 +98,12 @@ CONF_TOTP_URL: Final = "totp_url"
 CONF_USE_HTTPS: Final = "use_https"
 CONF_SUPPORT_BDC: Final = "has_bdc_support"
 CONF_IGNORE_SYSTEM_STATE: Final = "ignore_system_state"
+CONF_LALA_MAX_PARALLEL_REQUESTS: Final = "lala_max_parallel_requests"
+CONF_LALA_MEDIUM_INTERVAL: Final = "lala_medium_interval"
+CONF_LALA_SLOW_INTERVAL: Final = "lala_slow_interval"
+CONF_LALA_HISTORY_DEPTH: Final = "lala_history_depth"
 CONF_INCLUDE_WALLBOX_IN_HOUSE_CONSUMPTION: Final = "include_wallbox_in_house_consumption"
+CONF_APP_MAX_PARALLEL_REQUESTS: Final = "app_max_parallel_requests"
 
 CONF_DEV_TYPE: Final = "dtype"
 CONF_DEV_MODEL: Final = "dname"
@@ -143,6 +148,33 @@ DEFAULT_SCAN_INTERVAL_SENECV2: Final = 60
 DEFAULT_SCAN_INTERVAL_WEB: Final = 300
 DEFAULT_SCAN_INTERVAL_WEB_SENECV4: Final = 60
 DEFAULT_MIN_SCAN_INTERVAL_WEB: Final = 20
+# number of SENEC cloud requests that can be in flight at the same time during an update (1 = sequential)
+DEFAULT_APP_MAX_PARALLEL_REQUESTS: Final = 3
+# min distance (in seconds) between the start of two historic (backfill) requests to the SENEC cloud
+APP_BACKFILL_REQUEST_SPACING: Final = 0.25
+# time (in seconds) a SENEC cloud GET response can be shared with other callers of the same url
+APP_GET_CACHE_TTL: Final = 10
+# number of urls for which the validators (ETag/Last-Modified/body hash) & the last response will be kept
+APP_GET_VALIDATORS_MAX: Final = 32
+# the access token will be refreshed (in the background) this number of seconds before it expires
+APP_TOKEN_REFRESH_AHEAD: Final = 120
+# changes of the (historic) totals cache file will be written (at most) every 30 seconds
+APP_TOTALS_WRITE_DELAY: Final = 30
+# number of lala.cgi chunk-requests that can be in flight at the same time (1 = sequential)
+DEFAULT_LALA_MAX_PARALLEL_REQUESTS: Final = 2
+# refresh intervals (in seconds) of the slow-changing lala.cgi data (0 = with every poll)
+DEFAULT_LALA_MEDIUM_INTERVAL: Final = 60
+DEFAULT_LALA_SLOW_INTERVAL: Final = 300
+# number of polls that will be kept in memory for the rolling values (0 = disabled)
+DEFAULT_LALA_HISTORY_DEPTH: Final = 60
+# the window (in seconds) of the rolling average sensors
+LALA_HISTORY_AVG_WINDOW: Final = 300
+# the locally integrated energy totals will be stored (at most) every 5 minutes
+ENERGY_STORE_VERSION: Final = 1
+ENERGY_STORE_SAVE_INTERVAL: Final = 300
+# the deadband (in W and as fraction of the last written value) of the jittering power sensors
+POWER_DEADBAND: Final = 5.0
+POWER_DEADBAND_RELATIVE: Final = 0.01
 
 QUERY_BMS_KEY: Final = "query_bms_data"
 QUERY_BMS_CELLS_KEY: Final = "query_bms_cells_data"
@@ -157,8 +189,13 @@ QUERY_PEAK_SHAVING_KEY: Final = "query_peak_shaving"
 QUERY_TOTALS_KEY: Final = "query_totals"
 QUERY_SYSTEM_DETAILS_KEY: Final = "query_system_details"
 QUERY_SGREADY_KEY: Final = "query_sgready"
+QUERY_FIELDS_KEY: Final = "query_fields"
 
 IGNORE_SYSTEM_STATE_KEY: Final = CONF_IGNORE_SYSTEM_STATE
+LALA_MAX_PARALLEL_REQUESTS_KEY: Final = CONF_LALA_MAX_PARALLEL_REQUESTS
+LALA_MEDIUM_INTERVAL_KEY: Final = CONF_LALA_MEDIUM_INTERVAL
+LALA_SLOW_INTERVAL_KEY: Final = CONF_LALA_SLOW_INTERVAL
+LALA_HISTORY_DEPTH_KEY: Final = CONF_LALA_HISTORY_DEPTH
 
 # Peak Shaving Options
 PEAK_SHAVING_OPTIONS: Final = ["deactivated", "manual", "auto"]
@@ -241,6 +278,17 @@ class StaticFuncs:
 class ExtSensorEntityDescription(SensorEntityDescription):
     controls: list[str] | None = None
     senec_lala_section: str | None = None
+    # the lala.cgi fields (of the 'senec_lala_section') that are required by the entity - when not
+    # specified, the complete section will be requested
+    senec_lala_fields: tuple[str, ...] | None = None
+    # other lala.cgi sections the (calculated) value depends on (e.g. the wallbox power uses the PM1OBJ1 voltages)
+    senec_lala_extra_sections: tuple[str, ...] | None = None
+    # state writes will be skipped, when the value differs less than 'deadband' (absolute) or 'deadband_relative'
+    # (fraction of the last written value) from the last written value - at least every
+    # 'deadband_max_silence_in_sec' the state will be written
+    deadband: float | None = None
+    deadband_relative: float | None = None
+    deadband_max_silence_in_sec: int = 60
 
     # serial, wallbox_id, system_id will be only used for SENEC.Connect
     serial: str | None = None
@@ -264,6 +312,9 @@ class ExtButtonEntityDescription(ButtonEntityDescription):
 class ExtBinarySensorEntityDescription(BinarySensorEntityDescription):
     icon_off: str | None = None
     senec_lala_section: str | None = None
+    # the lala.cgi fields (of the 'senec_lala_section') that are required by the entity - when not
+    # specified, the complete section will be requested
+    senec_lala_fields: tuple[str, ...] | None = None
 
     # serial, wallbox_id, system_id will be only used for SENEC.Connect
     serial: str | None = None
@@ -1468,6 +1519,8 @@ INVERTER_SENSOR_TYPES = [
         icon="mdi:solar-power",
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=POWER_DEADBAND,
+        deadband_relative=POWER_DEADBAND_RELATIVE,
     ),
 
     ExtSensorEntityDescription(
@@ -1478,6 +1531,8 @@ INVERTER_SENSOR_TYPES = [
         icon="mdi:solar-power",
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=POWER_DEADBAND,
+        deadband_relative=POWER_DEADBAND_RELATIVE,
     ),
 
     ExtSensorEntityDescription(
@@ -1753,6 +1808,7 @@ MAIN_SWITCH_TYPES = [
 MAIN_BIN_SENSOR_TYPES = [
     ExtBinarySensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L1_USED",),
         entity_registry_enabled_default=False,
         key="wallbox_1_l1_used",
         name="Wallbox L1 used",
@@ -1761,6 +1817,7 @@ MAIN_BIN_SENSOR_TYPES = [
     ),
     ExtBinarySensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L2_USED",),
         entity_registry_enabled_default=False,
         key="wallbox_1_l2_used",
         name="Wallbox L2 used",
@@ -1769,6 +1826,7 @@ MAIN_BIN_SENSOR_TYPES = [
     ),
     ExtBinarySensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L3_USED",),
         entity_registry_enabled_default=False,
         key="wallbox_1_l3_used",
         name="Wallbox L3 used",
@@ -1777,6 +1835,7 @@ MAIN_BIN_SENSOR_TYPES = [
     ),
     ExtBinarySensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L1_USED",),
         entity_registry_enabled_default=False,
         key="wallbox_2_l1_used",
         name="Wallbox II L1 used",
@@ -1785,6 +1844,7 @@ MAIN_BIN_SENSOR_TYPES = [
     ),
     ExtBinarySensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L2_USED",),
         entity_registry_enabled_default=False,
         key="wallbox_2_l2_used",
         name="Wallbox II L2 used",
@@ -1793,6 +1853,7 @@ MAIN_BIN_SENSOR_TYPES = [
     ),
     ExtBinarySensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L3_USED",),
         entity_registry_enabled_default=False,
         key="wallbox_2_l3_used",
         name="Wallbox II L3 used",
@@ -1801,6 +1862,7 @@ MAIN_BIN_SENSOR_TYPES = [
     ),
     ExtBinarySensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L1_USED",),
         entity_registry_enabled_default=False,
         key="wallbox_3_l1_used",
         name="Wallbox III L1 used",
@@ -1809,6 +1871,7 @@ MAIN_BIN_SENSOR_TYPES = [
     ),
     ExtBinarySensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L2_USED",),
         entity_registry_enabled_default=False,
         key="wallbox_3_l2_used",
         name="Wallbox III L2 used",
@@ -1817,6 +1880,7 @@ MAIN_BIN_SENSOR_TYPES = [
     ),
     ExtBinarySensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L3_USED",),
         entity_registry_enabled_default=False,
         key="wallbox_3_l3_used",
         name="Wallbox III L3 used",
@@ -1825,6 +1889,7 @@ MAIN_BIN_SENSOR_TYPES = [
     ),
     ExtBinarySensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L1_USED",),
         entity_registry_enabled_default=False,
         key="wallbox_4_l1_used",
         name="Wallbox IV L1 used",
@@ -1833,6 +1898,7 @@ MAIN_BIN_SENSOR_TYPES = [
     ),
     ExtBinarySensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L2_USED",),
         entity_registry_enabled_default=False,
         key="wallbox_4_l2_used",
         name="Wallbox IV L2 used",
@@ -1841,6 +1907,7 @@ MAIN_BIN_SENSOR_TYPES = [
     ),
     ExtBinarySensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L3_USED",),
         entity_registry_enabled_default=False,
         key="wallbox_4_l3_used",
         name="Wallbox IV L3 used",
@@ -1849,6 +1916,7 @@ MAIN_BIN_SENSOR_TYPES = [
     ),
     ExtBinarySensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("SMART_CHARGE_ACTIVE",),
         entity_registry_enabled_default=False,
         array_key="wallbox_smart_charge_active",
         array_pos=0,
@@ -1861,6 +1929,7 @@ MAIN_BIN_SENSOR_TYPES = [
     ),
     ExtBinarySensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("SMART_CHARGE_ACTIVE",),
         entity_registry_enabled_default=False,
         array_key="wallbox_smart_charge_active",
         array_pos=1,
@@ -1873,6 +1942,7 @@ MAIN_BIN_SENSOR_TYPES = [
     ),
     ExtBinarySensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("SMART_CHARGE_ACTIVE",),
         entity_registry_enabled_default=False,
         array_key="wallbox_smart_charge_active",
         array_pos=2,
@@ -1885,6 +1955,7 @@ MAIN_BIN_SENSOR_TYPES = [
     ),
     ExtBinarySensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("SMART_CHARGE_ACTIVE",),
         entity_registry_enabled_default=False,
         array_key="wallbox_smart_charge_active",
         array_pos=3,
@@ -1897,6 +1968,7 @@ MAIN_BIN_SENSOR_TYPES = [
     ),
     ExtBinarySensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("PROHIBIT_USAGE",),
         entity_registry_enabled_default=False,
         array_key="wallbox_prohibit_usage",
         array_pos=0,
@@ -1908,6 +1980,7 @@ MAIN_BIN_SENSOR_TYPES = [
     ),
     ExtBinarySensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("PROHIBIT_USAGE",),
         entity_registry_enabled_default=False,
         array_key="wallbox_prohibit_usage",
         array_pos=1,
@@ -1919,6 +1992,7 @@ MAIN_BIN_SENSOR_TYPES = [
     ),
     ExtBinarySensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("PROHIBIT_USAGE",),
         entity_registry_enabled_default=False,
         array_key="wallbox_prohibit_usage",
         array_pos=2,
@@ -1930,6 +2004,7 @@ MAIN_BIN_SENSOR_TYPES = [
     ),
     ExtBinarySensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("PROHIBIT_USAGE",),
         entity_registry_enabled_default=False,
         array_key="wallbox_prohibit_usage",
         array_pos=3,
@@ -2342,6 +2417,16 @@ MAIN_SENSOR_TYPES = [
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.MEASUREMENT,
     ),
+    ExtSensorEntityDescription(
+        key="lala_response_time",
+        name="Response Time",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=0,
+        icon="mdi:timer-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
     ExtSensorEntityDescription(
         key="solar_generated_power",
         name="Solar Generated Power",
@@ -2350,6 +2435,8 @@ MAIN_SENSOR_TYPES = [
         icon="mdi:solar-power",
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=POWER_DEADBAND,
+        deadband_relative=POWER_DEADBAND_RELATIVE,
     ),
     ExtSensorEntityDescription(
         key="house_power",
@@ -2359,6 +2446,8 @@ MAIN_SENSOR_TYPES = [
         icon="mdi:home-import-outline",
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=POWER_DEADBAND,
+        deadband_relative=POWER_DEADBAND_RELATIVE,
     ),
     ExtSensorEntityDescription(
         key="battery_state_power",
@@ -2368,6 +2457,8 @@ MAIN_SENSOR_TYPES = [
         icon="mdi:home-battery",
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=POWER_DEADBAND,
+        deadband_relative=POWER_DEADBAND_RELATIVE,
     ),
     ExtSensorEntityDescription(
         key="battery_state_current",
@@ -2395,6 +2486,8 @@ MAIN_SENSOR_TYPES = [
         icon="mdi:home-battery",
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=POWER_DEADBAND,
+        deadband_relative=POWER_DEADBAND_RELATIVE,
     ),
     ExtSensorEntityDescription(
         key="battery_discharge_power",
@@ -2404,6 +2497,8 @@ MAIN_SENSOR_TYPES = [
         icon="mdi:home-battery-outline",
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=POWER_DEADBAND,
+        deadband_relative=POWER_DEADBAND_RELATIVE,
     ),
     ExtSensorEntityDescription(
         key="battery_charge_percent",
@@ -2422,6 +2517,49 @@ MAIN_SENSOR_TYPES = [
         icon="mdi:transmission-tower",
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=POWER_DEADBAND,
+        deadband_relative=POWER_DEADBAND_RELATIVE,
+    ),
+    # rolling averages from the in memory history of the last polls (see CONF_LALA_HISTORY_DEPTH)
+    ExtSensorEntityDescription(
+        entity_registry_enabled_default=False,
+        key="house_power_avg",
+        name="House Power (5min average)",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        suggested_display_precision=0,
+        icon="mdi:home-import-outline",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    ExtSensorEntityDescription(
+        entity_registry_enabled_default=False,
+        key="solar_generated_power_avg",
+        name="Solar Generated Power (5min average)",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        suggested_display_precision=0,
+        icon="mdi:solar-power",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    ExtSensorEntityDescription(
+        entity_registry_enabled_default=False,
+        key="grid_state_power_avg",
+        name="Grid State Power (5min average)",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        suggested_display_precision=0,
+        icon="mdi:transmission-tower",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    ExtSensorEntityDescription(
+        entity_registry_enabled_default=False,
+        key="battery_state_power_avg",
+        name="Battery State Power (5min average)",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        suggested_display_precision=0,
+        icon="mdi:home-battery",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
     ),
     ExtSensorEntityDescription(
         key="grid_imported_power",
@@ -2431,6 +2569,8 @@ MAIN_SENSOR_TYPES = [
         icon="mdi:transmission-tower-export",
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=POWER_DEADBAND,
+        deadband_relative=POWER_DEADBAND_RELATIVE,
     ),
     ExtSensorEntityDescription(
         key="grid_exported_power",
@@ -2440,6 +2580,8 @@ MAIN_SENSOR_TYPES = [
         icon="mdi:transmission-tower-import",
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=POWER_DEADBAND,
+        deadband_relative=POWER_DEADBAND_RELATIVE,
     ),
     ExtSensorEntityDescription(
         key="house_total_consumption",
@@ -2501,6 +2643,67 @@ MAIN_SENSOR_TYPES = [
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
     ),
+    # NPU 2408+: the totals integrated from the power values of the local polls
+    ExtSensorEntityDescription(
+        key="house_total_consumption_integrated",
+        controls=("require_no_stats_fields",),
+        name="House consumed (integrated)",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        suggested_display_precision=3,
+        icon="mdi:home-import-outline",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    ExtSensorEntityDescription(
+        key="solar_total_generated_integrated",
+        controls=("require_no_stats_fields",),
+        name="Solar generated (integrated)",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        suggested_display_precision=3,
+        icon="mdi:solar-power",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    ExtSensorEntityDescription(
+        key="battery_total_charged_integrated",
+        controls=("require_no_stats_fields",),
+        name="Battery charged (integrated)",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        suggested_display_precision=3,
+        icon="mdi:home-battery",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    ExtSensorEntityDescription(
+        key="battery_total_discharged_integrated",
+        controls=("require_no_stats_fields",),
+        name="Battery discharged (integrated)",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        suggested_display_precision=3,
+        icon="mdi:home-battery-outline",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    ExtSensorEntityDescription(
+        key="grid_total_import_integrated",
+        controls=("require_no_stats_fields",),
+        name="Grid Imported (integrated)",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        suggested_display_precision=3,
+        icon="mdi:transmission-tower-export",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    ExtSensorEntityDescription(
+        key="grid_total_export_integrated",
+        controls=("require_no_stats_fields",),
+        name="Grid Exported (integrated)",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        suggested_display_precision=3,
+        icon="mdi:transmission-tower-import",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_PV1,
         key="solar_mpp1_potential",
@@ -2610,6 +2813,8 @@ MAIN_SENSOR_TYPES = [
         icon="mdi:meter-electric",
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=POWER_DEADBAND,
+        deadband_relative=POWER_DEADBAND_RELATIVE,
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_PM1OBJ1,
@@ -2680,6 +2885,8 @@ MAIN_SENSOR_TYPES = [
         icon="mdi:meter-electric",
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=POWER_DEADBAND,
+        deadband_relative=POWER_DEADBAND_RELATIVE,
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_PM1OBJ1,
@@ -2690,6 +2897,8 @@ MAIN_SENSOR_TYPES = [
         icon="mdi:meter-electric",
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=POWER_DEADBAND,
+        deadband_relative=POWER_DEADBAND_RELATIVE,
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_PM1OBJ1,
@@ -2700,6 +2909,8 @@ MAIN_SENSOR_TYPES = [
         icon="mdi:meter-electric",
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=POWER_DEADBAND,
+        deadband_relative=POWER_DEADBAND_RELATIVE,
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_PM1OBJ2,
@@ -2722,6 +2933,8 @@ MAIN_SENSOR_TYPES = [
         icon="mdi:meter-electric",
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=POWER_DEADBAND,
+        deadband_relative=POWER_DEADBAND_RELATIVE,
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_PM1OBJ2,
@@ -2799,6 +3012,8 @@ MAIN_SENSOR_TYPES = [
         icon="mdi:meter-electric",
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=POWER_DEADBAND,
+        deadband_relative=POWER_DEADBAND_RELATIVE,
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_PM1OBJ2,
@@ -2810,6 +3025,8 @@ MAIN_SENSOR_TYPES = [
         icon="mdi:meter-electric",
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=POWER_DEADBAND,
+        deadband_relative=POWER_DEADBAND_RELATIVE,
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_PM1OBJ2,
@@ -2821,9 +3038,12 @@ MAIN_SENSOR_TYPES = [
         icon="mdi:meter-electric",
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=POWER_DEADBAND,
+        deadband_relative=POWER_DEADBAND_RELATIVE,
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_A",),
         entity_registry_enabled_default=False,
         key="bms_cell_temp_a1",
         name="Module A: Cell Temperature A1",
@@ -2836,6 +3056,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_A",),
         entity_registry_enabled_default=False,
         key="bms_cell_temp_a2",
         name="Module A: Cell Temperature A2",
@@ -2848,6 +3069,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_A",),
         entity_registry_enabled_default=False,
         key="bms_cell_temp_a3",
         name="Module A: Cell Temperature A3",
@@ -2860,6 +3082,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_A",),
         entity_registry_enabled_default=False,
         key="bms_cell_temp_a4",
         name="Module A: Cell Temperature A4",
@@ -2872,6 +3095,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_A",),
         entity_registry_enabled_default=False,
         key="bms_cell_temp_a5",
         name="Module A: Cell Temperature A5",
@@ -2884,6 +3108,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_A",),
         entity_registry_enabled_default=False,
         key="bms_cell_temp_a6",
         name="Module A: Cell Temperature A6",
@@ -2896,6 +3121,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_B",),
         entity_registry_enabled_default=False,
         key="bms_cell_temp_b1",
         name="Module B: Cell Temperature B1",
@@ -2908,6 +3134,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_B",),
         entity_registry_enabled_default=False,
         key="bms_cell_temp_b2",
         name="Module B: Cell Temperature B2",
@@ -2920,6 +3147,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_B",),
         entity_registry_enabled_default=False,
         key="bms_cell_temp_b3",
         name="Module B: Cell Temperature B3",
@@ -2932,6 +3160,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_B",),
         entity_registry_enabled_default=False,
         key="bms_cell_temp_b4",
         name="Module B: Cell Temperature B4",
@@ -2944,6 +3173,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_B",),
         entity_registry_enabled_default=False,
         key="bms_cell_temp_b5",
         name="Module B: Cell Temperature B5",
@@ -2956,6 +3186,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_B",),
         entity_registry_enabled_default=False,
         key="bms_cell_temp_b6",
         name="Module B: Cell Temperature B6",
@@ -2968,6 +3199,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_C",),
         entity_registry_enabled_default=False,
         key="bms_cell_temp_c1",
         name="Module C: Cell Temperature C1",
@@ -2980,6 +3212,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_C",),
         entity_registry_enabled_default=False,
         key="bms_cell_temp_c2",
         name="Module C: Cell Temperature C2",
@@ -2992,6 +3225,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_C",),
         entity_registry_enabled_default=False,
         key="bms_cell_temp_c3",
         name="Module C: Cell Temperature C3",
@@ -3004,6 +3238,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_C",),
         entity_registry_enabled_default=False,
         key="bms_cell_temp_c4",
         name="Module C: Cell Temperature C4",
@@ -3016,6 +3251,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_C",),
         entity_registry_enabled_default=False,
         key="bms_cell_temp_c5",
         name="Module C: Cell Temperature C5",
@@ -3028,6 +3264,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_C",),
         entity_registry_enabled_default=False,
         key="bms_cell_temp_c6",
         name="Module C: Cell Temperature C6",
@@ -3040,6 +3277,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_D",),
         entity_registry_enabled_default=False,
         key="bms_cell_temp_d1",
         name="Module D: Cell Temperature D1",
@@ -3052,6 +3290,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_D",),
         entity_registry_enabled_default=False,
         key="bms_cell_temp_d2",
         name="Module D: Cell Temperature D2",
@@ -3064,6 +3303,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_D",),
         entity_registry_enabled_default=False,
         key="bms_cell_temp_d3",
         name="Module D: Cell Temperature D3",
@@ -3076,6 +3316,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_D",),
         entity_registry_enabled_default=False,
         key="bms_cell_temp_d4",
         name="Module D: Cell Temperature D4",
@@ -3088,6 +3329,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_D",),
         entity_registry_enabled_default=False,
         key="bms_cell_temp_d5",
         name="Module D: Cell Temperature D5",
@@ -3100,6 +3342,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_D",),
         entity_registry_enabled_default=False,
         key="bms_cell_temp_d6",
         name="Module D: Cell Temperature D6",
@@ -3113,6 +3356,7 @@ MAIN_SENSOR_TYPES = [
 
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_A",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_a1",
         name="Module A: Cell Voltage A1",
@@ -3125,6 +3369,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_A",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_a2",
         name="Module A: Cell Voltage A2",
@@ -3137,6 +3382,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_A",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_a3",
         name="Module A: Cell Voltage A3",
@@ -3149,6 +3395,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_A",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_a4",
         name="Module A: Cell Voltage A4",
@@ -3161,6 +3408,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_A",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_a5",
         name="Module A: Cell Voltage A5",
@@ -3173,6 +3421,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_A",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_a6",
         name="Module A: Cell Voltage A6",
@@ -3185,6 +3434,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_A",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_a7",
         name="Module A: Cell Voltage A7",
@@ -3197,6 +3447,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_A",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_a8",
         name="Module A: Cell Voltage A8",
@@ -3209,6 +3460,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_A",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_a9",
         name="Module A: Cell Voltage A9",
@@ -3221,6 +3473,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_A",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_a10",
         name="Module A: Cell Voltage A10",
@@ -3233,6 +3486,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_A",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_a11",
         name="Module A: Cell Voltage A11",
@@ -3245,6 +3499,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_A",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_a12",
         name="Module A: Cell Voltage A12",
@@ -3257,6 +3512,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_A",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_a13",
         name="Module A: Cell Voltage A13",
@@ -3269,6 +3525,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_A",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_a14",
         name="Module A: Cell Voltage A14",
@@ -3281,6 +3538,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_A",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_a15",
         name="Module A: Cell Voltage A15",
@@ -3293,6 +3551,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_A",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_a16",
         name="Module A: Cell Voltage A16",
@@ -3305,6 +3564,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_B",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_b1",
         name="Module B: Cell Voltage B1",
@@ -3317,6 +3577,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_B",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_b2",
         name="Module B: Cell Voltage B2",
@@ -3329,6 +3590,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_B",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_b3",
         name="Module B: Cell Voltage B3",
@@ -3341,6 +3603,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_B",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_b4",
         name="Module B: Cell Voltage B4",
@@ -3353,6 +3616,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_B",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_b5",
         name="Module B: Cell Voltage B5",
@@ -3365,6 +3629,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_B",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_b6",
         name="Module B: Cell Voltage B6",
@@ -3377,6 +3642,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_B",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_b7",
         name="Module B: Cell Voltage B7",
@@ -3389,6 +3655,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_B",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_b8",
         name="Module B: Cell Voltage B8",
@@ -3401,6 +3668,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_B",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_b9",
         name="Module B: Cell Voltage B9",
@@ -3413,6 +3681,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_B",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_b10",
         name="Module B: Cell Voltage B10",
@@ -3425,6 +3694,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_B",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_b11",
         name="Module B: Cell Voltage B11",
@@ -3437,6 +3707,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_B",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_b12",
         name="Module B: Cell Voltage B12",
@@ -3449,6 +3720,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_B",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_b13",
         name="Module B: Cell Voltage B13",
@@ -3461,6 +3733,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_B",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_b14",
         name="Module B: Cell Voltage B14",
@@ -3473,6 +3746,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_B",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_b15",
         name="Module B: Cell Voltage B15",
@@ -3485,6 +3759,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_B",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_b16",
         name="Module B: Cell Voltage B16",
@@ -3497,6 +3772,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_C",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_c1",
         name="Module C: Cell Voltage C1",
@@ -3509,6 +3785,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_C",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_c2",
         name="Module C: Cell Voltage C2",
@@ -3521,6 +3798,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_C",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_c3",
         name="Module C: Cell Voltage C3",
@@ -3533,6 +3811,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_C",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_c4",
         name="Module C: Cell Voltage C4",
@@ -3545,6 +3824,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_C",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_c5",
         name="Module C: Cell Voltage C5",
@@ -3557,6 +3837,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_C",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_c6",
         name="Module C: Cell Voltage C6",
@@ -3569,6 +3850,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_C",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_c7",
         name="Module C: Cell Voltage C7",
@@ -3581,6 +3863,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_C",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_c8",
         name="Module C: Cell Voltage C8",
@@ -3593,6 +3876,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_C",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_c9",
         name="Module C: Cell Voltage C9",
@@ -3605,6 +3889,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_C",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_c10",
         name="Module C: Cell Voltage C10",
@@ -3617,6 +3902,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_C",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_c11",
         name="Module C: Cell Voltage C11",
@@ -3629,6 +3915,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_C",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_c12",
         name="Module C: Cell Voltage C12",
@@ -3641,6 +3928,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_C",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_c13",
         name="Module C: Cell Voltage C13",
@@ -3653,6 +3941,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_C",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_c14",
         name="Module C: Cell Voltage C14",
@@ -3665,6 +3954,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_C",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_c15",
         name="Module C: Cell Voltage C15",
@@ -3677,6 +3967,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_C",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_c16",
         name="Module C: Cell Voltage C16",
@@ -3689,6 +3980,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_D",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_d1",
         name="Module D: Cell Voltage D1",
@@ -3701,6 +3993,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_D",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_d2",
         name="Module D: Cell Voltage D2",
@@ -3713,6 +4006,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_D",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_d3",
         name="Module D: Cell Voltage D3",
@@ -3725,6 +4019,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_D",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_d4",
         name="Module D: Cell Voltage D4",
@@ -3737,6 +4032,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_D",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_d5",
         name="Module D: Cell Voltage D5",
@@ -3749,6 +4045,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_D",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_d6",
         name="Module D: Cell Voltage D6",
@@ -3761,6 +4058,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_D",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_d7",
         name="Module D: Cell Voltage D7",
@@ -3773,6 +4071,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_D",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_d8",
         name="Module D: Cell Voltage D8",
@@ -3785,6 +4084,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_D",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_d9",
         name="Module D: Cell Voltage D9",
@@ -3797,6 +4097,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_D",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_d10",
         name="Module D: Cell Voltage D10",
@@ -3809,6 +4110,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_D",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_d11",
         name="Module D: Cell Voltage D11",
@@ -3821,6 +4123,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_D",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_d12",
         name="Module D: Cell Voltage D12",
@@ -3833,6 +4136,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_D",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_d13",
         name="Module D: Cell Voltage D13",
@@ -3845,6 +4149,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_D",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_d14",
         name="Module D: Cell Voltage D14",
@@ -3857,6 +4162,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_D",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_d15",
         name="Module D: Cell Voltage D15",
@@ -3869,6 +4175,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_D",),
         entity_registry_enabled_default=False,
         key="bms_cell_volt_d16",
         name="Module D: Cell Voltage D16",
@@ -3880,8 +4187,244 @@ MAIN_SENSOR_TYPES = [
         state_class=SensorStateClass.MEASUREMENT,
     ),
 
+    # the BMS cell analytics (per poll statistics of all cells)
+    ExtSensorEntityDescription(
+        senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_A", "CELL_VOLTAGES_MODULE_B", "CELL_VOLTAGES_MODULE_C", "CELL_VOLTAGES_MODULE_D"),
+        entity_registry_enabled_default=False,
+        key="bms_cell_volt_min",
+        name="Cells: Voltage Min",
+        icon="mdi:lightning-bolt",
+        native_unit_of_measurement=UnitOfElectricPotential.MILLIVOLT,
+        suggested_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        suggested_display_precision=3,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    ExtSensorEntityDescription(
+        senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_A", "CELL_VOLTAGES_MODULE_B", "CELL_VOLTAGES_MODULE_C", "CELL_VOLTAGES_MODULE_D"),
+        entity_registry_enabled_default=False,
+        key="bms_cell_volt_max",
+        name="Cells: Voltage Max",
+        icon="mdi:lightning-bolt",
+        native_unit_of_measurement=UnitOfElectricPotential.MILLIVOLT,
+        suggested_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        suggested_display_precision=3,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    ExtSensorEntityDescription(
+        senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_A", "CELL_VOLTAGES_MODULE_B", "CELL_VOLTAGES_MODULE_C", "CELL_VOLTAGES_MODULE_D"),
+        entity_registry_enabled_default=False,
+        key="bms_cell_volt_mean",
+        name="Cells: Voltage Mean",
+        icon="mdi:lightning-bolt",
+        native_unit_of_measurement=UnitOfElectricPotential.MILLIVOLT,
+        suggested_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        suggested_display_precision=3,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    ExtSensorEntityDescription(
+        senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_A", "CELL_VOLTAGES_MODULE_B", "CELL_VOLTAGES_MODULE_C", "CELL_VOLTAGES_MODULE_D"),
+        entity_registry_enabled_default=False,
+        key="bms_cell_volt_std",
+        name="Cells: Voltage Standard Deviation",
+        icon="mdi:sigma",
+        native_unit_of_measurement=UnitOfElectricPotential.MILLIVOLT,
+        suggested_display_precision=1,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    ExtSensorEntityDescription(
+        senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_A", "CELL_VOLTAGES_MODULE_B", "CELL_VOLTAGES_MODULE_C", "CELL_VOLTAGES_MODULE_D"),
+        entity_registry_enabled_default=False,
+        key="bms_cell_volt_spread",
+        name="Cells: Voltage Spread",
+        icon="mdi:arrow-expand-vertical",
+        native_unit_of_measurement=UnitOfElectricPotential.MILLIVOLT,
+        suggested_display_precision=1,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    ExtSensorEntityDescription(
+        senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_A", "CELL_VOLTAGES_MODULE_B", "CELL_VOLTAGES_MODULE_C", "CELL_VOLTAGES_MODULE_D"),
+        entity_registry_enabled_default=False,
+        key="bms_cell_volt_min_cell",
+        name="Cells: Weakest Cell",
+        icon="mdi:battery-alert-variant-outline",
+    ),
+    ExtSensorEntityDescription(
+        senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_A",),
+        entity_registry_enabled_default=False,
+        key="bms_cell_volt_spread_a",
+        name="Module A: Cell Voltage Spread",
+        icon="mdi:arrow-expand-vertical",
+        native_unit_of_measurement=UnitOfElectricPotential.MILLIVOLT,
+        suggested_display_precision=1,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    ExtSensorEntityDescription(
+        senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_B",),
+        entity_registry_enabled_default=False,
+        key="bms_cell_volt_spread_b",
+        name="Module B: Cell Voltage Spread",
+        icon="mdi:arrow-expand-vertical",
+        native_unit_of_measurement=UnitOfElectricPotential.MILLIVOLT,
+        suggested_display_precision=1,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    ExtSensorEntityDescription(
+        senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_C",),
+        entity_registry_enabled_default=False,
+        key="bms_cell_volt_spread_c",
+        name="Module C: Cell Voltage Spread",
+        icon="mdi:arrow-expand-vertical",
+        native_unit_of_measurement=UnitOfElectricPotential.MILLIVOLT,
+        suggested_display_precision=1,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    ExtSensorEntityDescription(
+        senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_VOLTAGES_MODULE_D",),
+        entity_registry_enabled_default=False,
+        key="bms_cell_volt_spread_d",
+        name="Module D: Cell Voltage Spread",
+        icon="mdi:arrow-expand-vertical",
+        native_unit_of_measurement=UnitOfElectricPotential.MILLIVOLT,
+        suggested_display_precision=1,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    ExtSensorEntityDescription(
+        senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_A", "CELL_TEMPERATURES_MODULE_B", "CELL_TEMPERATURES_MODULE_C", "CELL_TEMPERATURES_MODULE_D"),
+        entity_registry_enabled_default=False,
+        key="bms_cell_temp_min",
+        name="Cells: Temperature Min",
+        icon="mdi:thermometer",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        suggested_display_precision=1,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    ExtSensorEntityDescription(
+        senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_A", "CELL_TEMPERATURES_MODULE_B", "CELL_TEMPERATURES_MODULE_C", "CELL_TEMPERATURES_MODULE_D"),
+        entity_registry_enabled_default=False,
+        key="bms_cell_temp_max",
+        name="Cells: Temperature Max",
+        icon="mdi:thermometer",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        suggested_display_precision=1,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    ExtSensorEntityDescription(
+        senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_A", "CELL_TEMPERATURES_MODULE_B", "CELL_TEMPERATURES_MODULE_C", "CELL_TEMPERATURES_MODULE_D"),
+        entity_registry_enabled_default=False,
+        key="bms_cell_temp_mean",
+        name="Cells: Temperature Mean",
+        icon="mdi:thermometer",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        suggested_display_precision=1,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    ExtSensorEntityDescription(
+        senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_A", "CELL_TEMPERATURES_MODULE_B", "CELL_TEMPERATURES_MODULE_C", "CELL_TEMPERATURES_MODULE_D"),
+        entity_registry_enabled_default=False,
+        key="bms_cell_temp_std",
+        name="Cells: Temperature Standard Deviation",
+        icon="mdi:sigma",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        suggested_display_precision=1,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    ExtSensorEntityDescription(
+        senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_A", "CELL_TEMPERATURES_MODULE_B", "CELL_TEMPERATURES_MODULE_C", "CELL_TEMPERATURES_MODULE_D"),
+        entity_registry_enabled_default=False,
+        key="bms_cell_temp_spread",
+        name="Cells: Temperature Spread",
+        icon="mdi:arrow-expand-vertical",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        suggested_display_precision=1,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    ExtSensorEntityDescription(
+        senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_A", "CELL_TEMPERATURES_MODULE_B", "CELL_TEMPERATURES_MODULE_C", "CELL_TEMPERATURES_MODULE_D"),
+        entity_registry_enabled_default=False,
+        key="bms_cell_temp_max_cell",
+        name="Cells: Hottest Cell",
+        icon="mdi:thermometer-alert",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    ExtSensorEntityDescription(
+        senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_A",),
+        entity_registry_enabled_default=False,
+        key="bms_cell_temp_spread_a",
+        name="Module A: Cell Temperature Spread",
+        icon="mdi:arrow-expand-vertical",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        suggested_display_precision=1,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    ExtSensorEntityDescription(
+        senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_B",),
+        entity_registry_enabled_default=False,
+        key="bms_cell_temp_spread_b",
+        name="Module B: Cell Temperature Spread",
+        icon="mdi:arrow-expand-vertical",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        suggested_display_precision=1,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    ExtSensorEntityDescription(
+        senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_C",),
+        entity_registry_enabled_default=False,
+        key="bms_cell_temp_spread_c",
+        name="Module C: Cell Temperature Spread",
+        icon="mdi:arrow-expand-vertical",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        suggested_display_precision=1,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    ExtSensorEntityDescription(
+        senec_lala_section=SENEC_SECTION_BMS_CELLS,
+        senec_lala_fields=("CELL_TEMPERATURES_MODULE_D",),
+        entity_registry_enabled_default=False,
+        key="bms_cell_temp_spread_d",
+        name="Module D: Cell Temperature Spread",
+        icon="mdi:arrow-expand-vertical",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        suggested_display_precision=1,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS,
+        senec_lala_fields=("VOLTAGE",),
         key="bms_voltage_a",
         name="Module A: Voltage",
         icon="mdi:lightning-bolt",
@@ -3892,6 +4435,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS,
+        senec_lala_fields=("VOLTAGE",),
         key="bms_voltage_b",
         name="Module B: Voltage",
         icon="mdi:lightning-bolt",
@@ -3902,6 +4446,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS,
+        senec_lala_fields=("VOLTAGE",),
         key="bms_voltage_c",
         name="Module C: Voltage",
         icon="mdi:lightning-bolt",
@@ -3912,6 +4457,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS,
+        senec_lala_fields=("VOLTAGE",),
         key="bms_voltage_d",
         name="Module D: Voltage",
         icon="mdi:lightning-bolt",
@@ -3923,6 +4469,7 @@ MAIN_SENSOR_TYPES = [
 
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS,
+        senec_lala_fields=("CURRENT",),
         key="bms_current_a",
         name="Module A: Current",
         icon="mdi:current-dc",
@@ -3933,6 +4480,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS,
+        senec_lala_fields=("CURRENT",),
         key="bms_current_b",
         name="Module B: Current",
         icon="mdi:current-dc",
@@ -3943,6 +4491,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS,
+        senec_lala_fields=("CURRENT",),
         key="bms_current_c",
         name="Module C: Current",
         icon="mdi:current-dc",
@@ -3953,6 +4502,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS,
+        senec_lala_fields=("CURRENT",),
         key="bms_current_d",
         name="Module D: Current",
         icon="mdi:current-dc",
@@ -3964,6 +4514,7 @@ MAIN_SENSOR_TYPES = [
 
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS,
+        senec_lala_fields=("SOC",),
         key="bms_soc_a",
         name="Module A: State of charge",
         icon="mdi:battery-charging-high",
@@ -3973,6 +4524,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS,
+        senec_lala_fields=("SOC",),
         key="bms_soc_b",
         name="Module B: State of charge",
         icon="mdi:battery-charging-high",
@@ -3982,6 +4534,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS,
+        senec_lala_fields=("SOC",),
         key="bms_soc_c",
         name="Module C: State of charge",
         icon="mdi:battery-charging-high",
@@ -3991,6 +4544,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS,
+        senec_lala_fields=("SOC",),
         key="bms_soc_d",
         name="Module D: State of charge",
         icon="mdi:battery-charging-high",
@@ -4001,6 +4555,7 @@ MAIN_SENSOR_TYPES = [
 
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS,
+        senec_lala_fields=("SOH",),
         entity_registry_enabled_default=False,
         key="bms_soh_a",
         name="Module A: State of Health",
@@ -4011,6 +4566,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS,
+        senec_lala_fields=("SOH",),
         entity_registry_enabled_default=False,
         key="bms_soh_b",
         name="Module B: State of Health",
@@ -4021,6 +4577,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS,
+        senec_lala_fields=("SOH",),
         entity_registry_enabled_default=False,
         key="bms_soh_c",
         name="Module C: State of Health",
@@ -4031,6 +4588,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS,
+        senec_lala_fields=("SOH",),
         entity_registry_enabled_default=False,
         key="bms_soh_d",
         name="Module D: State of Health",
@@ -4042,6 +4600,7 @@ MAIN_SENSOR_TYPES = [
 
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS,
+        senec_lala_fields=("CYCLES",),
         entity_registry_enabled_default=False,
         key="bms_cycles_a",
         name="Module A: Cycles",
@@ -4051,6 +4610,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS,
+        senec_lala_fields=("CYCLES",),
         entity_registry_enabled_default=False,
         key="bms_cycles_b",
         name="Module B: Cycles",
@@ -4060,6 +4620,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS,
+        senec_lala_fields=("CYCLES",),
         entity_registry_enabled_default=False,
         key="bms_cycles_c",
         name="Module C: Cycles",
@@ -4069,6 +4630,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_BMS,
+        senec_lala_fields=("CYCLES",),
         entity_registry_enabled_default=False,
         key="bms_cycles_d",
         name="Module D: Cycles",
@@ -4080,6 +4642,7 @@ MAIN_SENSOR_TYPES = [
     # wallbox stuff
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("STATE",),
         entity_registry_enabled_default=False,
         key="wallbox_1_state",
         name="Wallbox I state",
@@ -4087,6 +4650,8 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L1_CHARGING_CURRENT", "L1_USED", "L2_CHARGING_CURRENT", "L2_USED", "L3_CHARGING_CURRENT", "L3_USED"),
+        senec_lala_extra_sections=(SENEC_SECTION_PM1OBJ1,),
         entity_registry_enabled_default=False,
         key="wallbox_1_power",
         name="Wallbox I Power",
@@ -4098,6 +4663,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("APPARENT_CHARGING_POWER",),
         entity_registry_enabled_default=False,
         key="wallbox_1_power_alt",
         name="Wallbox I Power [ALT]",
@@ -4109,6 +4675,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("EV_CONNECTED",),
         entity_registry_enabled_default=False,
         key="wallbox_1_ev_connected",
         name="Wallbox I EV Connected",
@@ -4128,6 +4695,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L1_CHARGING_CURRENT",),
         entity_registry_enabled_default=False,
         key="wallbox_1_l1_charging_current",
         name="Wallbox I L1 charging Current",
@@ -4139,6 +4707,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L2_CHARGING_CURRENT",),
         entity_registry_enabled_default=False,
         key="wallbox_1_l2_charging_current",
         name="Wallbox I L2 charging Current",
@@ -4150,6 +4719,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L3_CHARGING_CURRENT",),
         entity_registry_enabled_default=False,
         key="wallbox_1_l3_charging_current",
         name="Wallbox I L3 charging Current",
@@ -4161,6 +4731,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("MIN_CHARGING_CURRENT",),
         entity_registry_enabled_default=False,
         key="wallbox_1_min_charging_current",
         name="Wallbox I MIN charging Current",
@@ -4173,6 +4744,7 @@ MAIN_SENSOR_TYPES = [
 
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("STATE",),
         entity_registry_enabled_default=False,
         key="wallbox_2_state",
         name="Wallbox II state",
@@ -4180,6 +4752,8 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L1_CHARGING_CURRENT", "L1_USED", "L2_CHARGING_CURRENT", "L2_USED", "L3_CHARGING_CURRENT", "L3_USED"),
+        senec_lala_extra_sections=(SENEC_SECTION_PM1OBJ1,),
         entity_registry_enabled_default=False,
         key="wallbox_2_power",
         name="Wallbox II Power",
@@ -4191,6 +4765,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("APPARENT_CHARGING_POWER",),
         entity_registry_enabled_default=False,
         key="wallbox_2_power_alt",
         name="Wallbox II Power [ALT]",
@@ -4202,6 +4777,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("EV_CONNECTED",),
         entity_registry_enabled_default=False,
         key="wallbox_2_ev_connected",
         name="Wallbox II EV Connected",
@@ -4221,6 +4797,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L1_CHARGING_CURRENT",),
         entity_registry_enabled_default=False,
         key="wallbox_2_l1_charging_current",
         name="Wallbox II L1 charging Current",
@@ -4232,6 +4809,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L2_CHARGING_CURRENT",),
         entity_registry_enabled_default=False,
         key="wallbox_2_l2_charging_current",
         name="Wallbox II L2 charging Current",
@@ -4243,6 +4821,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L3_CHARGING_CURRENT",),
         entity_registry_enabled_default=False,
         key="wallbox_2_l3_charging_current",
         name="Wallbox II L3 charging Current",
@@ -4254,6 +4833,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("MIN_CHARGING_CURRENT",),
         entity_registry_enabled_default=False,
         key="wallbox_2_min_charging_current",
         name="Wallbox II MIN charging Current",
@@ -4266,6 +4846,7 @@ MAIN_SENSOR_TYPES = [
 
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("STATE",),
         entity_registry_enabled_default=False,
         key="wallbox_3_state",
         name="Wallbox III state",
@@ -4273,6 +4854,8 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L1_CHARGING_CURRENT", "L1_USED", "L2_CHARGING_CURRENT", "L2_USED", "L3_CHARGING_CURRENT", "L3_USED"),
+        senec_lala_extra_sections=(SENEC_SECTION_PM1OBJ1,),
         entity_registry_enabled_default=False,
         key="wallbox_3_power",
         name="Wallbox III Power",
@@ -4284,6 +4867,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("APPARENT_CHARGING_POWER",),
         entity_registry_enabled_default=False,
         key="wallbox_3_power_alt",
         name="Wallbox III Power [ALT]",
@@ -4295,6 +4879,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("EV_CONNECTED",),
         entity_registry_enabled_default=False,
         key="wallbox_3_ev_connected",
         name="Wallbox III EV Connected",
@@ -4314,6 +4899,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L1_CHARGING_CURRENT",),
         entity_registry_enabled_default=False,
         key="wallbox_3_l1_charging_current",
         name="Wallbox III L1 charging Current",
@@ -4325,6 +4911,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L2_CHARGING_CURRENT",),
         entity_registry_enabled_default=False,
         key="wallbox_3_l2_charging_current",
         name="Wallbox III L2 charging Current",
@@ -4336,6 +4923,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L3_CHARGING_CURRENT",),
         entity_registry_enabled_default=False,
         key="wallbox_3_l3_charging_current",
         name="Wallbox III L3 charging Current",
@@ -4347,6 +4935,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("MIN_CHARGING_CURRENT",),
         entity_registry_enabled_default=False,
         key="wallbox_3_min_charging_current",
         name="Wallbox III MIN charging Current",
@@ -4359,6 +4948,7 @@ MAIN_SENSOR_TYPES = [
 
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("STATE",),
         entity_registry_enabled_default=False,
         key="wallbox_4_state",
         name="Wallbox IV state",
@@ -4366,6 +4956,8 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L1_CHARGING_CURRENT", "L1_USED", "L2_CHARGING_CURRENT", "L2_USED", "L3_CHARGING_CURRENT", "L3_USED"),
+        senec_lala_extra_sections=(SENEC_SECTION_PM1OBJ1,),
         entity_registry_enabled_default=False,
         key="wallbox_4_power",
         name="Wallbox IV Power",
@@ -4377,6 +4969,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("APPARENT_CHARGING_POWER",),
         entity_registry_enabled_default=False,
         key="wallbox_4_power_alt",
         name="Wallbox IV Power [ALT]",
@@ -4388,6 +4981,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("EV_CONNECTED",),
         entity_registry_enabled_default=False,
         key="wallbox_4_ev_connected",
         name="Wallbox IV EV Connected",
@@ -4407,6 +5001,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L1_CHARGING_CURRENT",),
         entity_registry_enabled_default=False,
         key="wallbox_4_l1_charging_current",
         name="Wallbox IV L1 charging Current",
@@ -4418,6 +5013,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L2_CHARGING_CURRENT",),
         entity_registry_enabled_default=False,
         key="wallbox_4_l2_charging_current",
         name="Wallbox IV L2 charging Current",
@@ -4429,6 +5025,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("L3_CHARGING_CURRENT",),
         entity_registry_enabled_default=False,
         key="wallbox_4_l3_charging_current",
         name="Wallbox IV L3 charging Current",
@@ -4440,6 +5037,7 @@ MAIN_SENSOR_TYPES = [
     ),
     ExtSensorEntityDescription(
         senec_lala_section=SENEC_SECTION_WALLBOX,
+        senec_lala_fields=("MIN_CHARGING_CURRENT",),
         entity_registry_enabled_default=False,
         key="wallbox_4_min_charging_current",
         name="Wallbox IV MIN charging Current",
@@ -126,13 +126,13 @@ class SenecNumber(SenecEntity, NumberEntity):
     @property
     def native_value(self) -> float:
         if self.entity_description.array_key is not None:
-            data = getattr(self.coordinator.senec, self.entity_description.array_key)
+            data = self._api_value()
             if data is not None and len(data) > self.entity_description.array_pos:
                 value = data[self.entity_description.array_pos]
             else:
                 value = 0
         else:
-            value = getattr(self.coordinator.senec, self.entity_description.key)
+            value = self._api_value()
 
         if value is not None:
             return float(value)
@@ -151,6 +151,7 @@ class SenecNumber(SenecEntity, NumberEntity):
                                                  float(value))
             else:
                 await api.set_number_value(self.entity_description.key, float(value))
+        self.coordinator.refresh_value_snapshot()
         self.async_schedule_update_ha_state(force_refresh=True)
 
     @property
@@ -11,12 +11,15 @@ import random
 import re
 import secrets
 import string
+import tempfile
 import traceback
 from base64 import urlsafe_b64encode
+from collections.abc import Mapping
 from datetime import datetime, timezone, timedelta
+from functools import partial
 from json import JSONDecodeError
 from pathlib import Path
-from time import time, strftime, localtime
+from time import time, strftime, localtime, monotonic
 from typing import Final, Iterable, Any
 from urllib.parse import quote, urlparse, parse_qs
 
@@ -41,6 +44,16 @@ from custom_components.senec.const import (
     QUERY_SYSTEM_DETAILS_KEY,
     QUERY_SGREADY_KEY,
     IGNORE_SYSTEM_STATE_KEY,
+    QUERY_FIELDS_KEY,
+    LALA_MAX_PARALLEL_REQUESTS_KEY,
+    LALA_MEDIUM_INTERVAL_KEY,
+    LALA_SLOW_INTERVAL_KEY,
+    LALA_HISTORY_DEPTH_KEY,
+    DEFAULT_LALA_MAX_PARALLEL_REQUESTS,
+    DEFAULT_LALA_MEDIUM_INTERVAL,
+    DEFAULT_LALA_SLOW_INTERVAL,
+    DEFAULT_LALA_HISTORY_DEPTH,
+    LALA_HISTORY_AVG_WINDOW,
     CONF_APP_SYSTEMID,
     CONF_APP_SERIALNUM,
     CONF_APP_WALLBOX_COUNT,
@@ -48,6 +61,13 @@ from custom_components.senec.const import (
     CONF_APP_DATA_END,
     CONF_APP_TOTAL_DATA,
     CONF_INCLUDE_WALLBOX_IN_HOUSE_CONSUMPTION,
+    CONF_APP_MAX_PARALLEL_REQUESTS,
+    DEFAULT_APP_MAX_PARALLEL_REQUESTS,
+    APP_BACKFILL_REQUEST_SPACING,
+    APP_GET_CACHE_TTL,
+    APP_GET_VALIDATORS_MAX,
+    APP_TOKEN_REFRESH_AHEAD,
+    APP_TOTALS_WRITE_DELAY,
     DOMAIN
 )
 from custom_components.senec.pysenec_ha.constants import (
@@ -75,6 +95,12 @@ from custom_components.senec.pysenec_ha.constants import (
     SENEC_SECTION_WIZARD,
     SENEC_SECTION_LOG,
 
+    LALA_TIER_FAST,
+    LALA_TIER_MEDIUM,
+    LALA_TIER_SLOW,
+    SENEC_LALA_SECTION_TIERS,
+    SENEC_LALA_FIELD_TIERS,
+
     APP_API_WB_MODE_LOCKED,
     APP_API_WB_MODE_2025_SOLAR,
     APP_API_WB_MODE_2025_FAST,
@@ -107,8 +133,13 @@ from custom_components.senec.pysenec_ha.constants import (
     UPDATE_INTERVALS,
     UPDATE_INTERVAL_OPTIONS,
 )
+from custom_components.senec.pysenec_ha import bms_cells
+from custom_components.senec.pysenec_ha.energy import EnergyIntegrator
+from custom_components.senec.pysenec_ha.history import LalaHistory
+from custom_components.senec.pysenec_ha.lala_fields import SENEC_LALA_FIELD_TABLE
 from custom_components.senec.pysenec_ha.phones import PHONE_BUILD_MAPPING
-from custom_components.senec.pysenec_ha.util import parse
+from custom_components.senec.pysenec_ha.timeseries import MeasurementSeries
+from custom_components.senec.pysenec_ha.util import parse, decode, diff, merge_diffs, LalaSection
 
 # 4: "INITIAL CHARGE",
 # 5: "MAINTENANCE CHARGE",
@@ -133,9 +164,29 @@ _LOGGER = logging.getLogger(__name__)
 
 SET_COOKIE = "Set-Cookie"
 
+# adaptive pacing of the lala.cgi chunk-requests
+LALA_PACING_INITIAL_WAIT: Final = 0.2
+LALA_PACING_MAX_WAIT: Final = 2.0
+LALA_PACING_EWMA_ALPHA: Final = 0.2
+LALA_PACING_FAST_RESPONSE: Final = 0.25
+LALA_PACING_LATENCY_FACTOR: Final = 0.5
+LALA_PACING_ERROR_RATE_THRESHOLD: Final = 0.1
+
+# the (SenecLocal) values that will be kept in the history ring buffer
+LALA_HISTORY_FIELDS: Final = ("house_power", "solar_generated_power", "grid_state_power", "battery_state_power")
+
+# the energy totals that will be integrated from the power values (NPU 2408+ does not provide STATISTIC data)
+LALA_ENERGY_COUNTERS: Final = ("house_total_consumption_integrated", "solar_total_generated_integrated",
+                               "grid_total_import_integrated", "grid_total_export_integrated",
+                               "battery_total_charged_integrated", "battery_total_discharged_integrated")
+# polls that are more than 5 minutes apart will not be integrated
+LALA_ENERGY_MAX_GAP: Final = 300
+
 class ServiceUnavailableException(Exception):
     """Raised when the backend service or device cannot be reached."""
 
+@SENEC_LALA_FIELD_TABLE.accessors
+@bms_cells.accessors
 class SenecLocal:
     """Senec Home Battery Sensor"""
 
@@ -172,38 +223,38 @@ class SenecLocal:
         self._QUERY_SOCKETSDATA = False
         self._IGNORE_SYSTEM_STATUS = False
         self._QUERY_FANDATA = False
+        # the lala.cgi fields per section that should be requested (sections that are not included will
+        # be requested completely)
+        self._QUERY_FIELDS = {}
+        self._LALA_MAX_PARALLEL_REQUESTS = DEFAULT_LALA_MAX_PARALLEL_REQUESTS
+        self._LALA_TIER_INTERVALS = {
+            LALA_TIER_FAST: 0,
+            LALA_TIER_MEDIUM: DEFAULT_LALA_MEDIUM_INTERVAL,
+            LALA_TIER_SLOW: DEFAULT_LALA_SLOW_INTERVAL
+        }
+        a_history_depth = DEFAULT_LALA_HISTORY_DEPTH
 
         if options is not None:
-            if QUERY_PV1_KEY in options:
-                self._QUERY_PV1 = options[QUERY_PV1_KEY]
-
-            if QUERY_PM1OBJ1_KEY in options:
-                self._QUERY_PM1OBJ1 = options[QUERY_PM1OBJ1_KEY]
+            self._set_query_options(options)
 
-            if QUERY_PM1OBJ2_KEY in options:
-                self._QUERY_PM1OBJ2 = options[QUERY_PM1OBJ2_KEY]
-
-            if QUERY_BMS_KEY in options:
-                self._QUERY_BMS = options[QUERY_BMS_KEY]
+            if IGNORE_SYSTEM_STATE_KEY in options:
+                self._IGNORE_SYSTEM_STATUS = options[IGNORE_SYSTEM_STATE_KEY]
 
-            if QUERY_BMS_CELLS_KEY in options:
-                self._QUERY_BMS_CELLS = options[QUERY_BMS_CELLS_KEY]
-                if self._QUERY_BMS_CELLS:
-                    self._QUERY_BMS = True
+            if LALA_MAX_PARALLEL_REQUESTS_KEY in options and options[LALA_MAX_PARALLEL_REQUESTS_KEY] is not None:
+                self._LALA_MAX_PARALLEL_REQUESTS = max(1, int(options[LALA_MAX_PARALLEL_REQUESTS_KEY]))
 
-            if QUERY_WALLBOX_KEY in options:
-                self._QUERY_WALLBOX = options[QUERY_WALLBOX_KEY]
-                # do we need some additional information for our wallbox (that are only available via the app-api!
-                self._QUERY_WALLBOX_APPAPI = options[QUERY_WALLBOX_KEY]
+            if LALA_MEDIUM_INTERVAL_KEY in options and options[LALA_MEDIUM_INTERVAL_KEY] is not None:
+                self._LALA_TIER_INTERVALS[LALA_TIER_MEDIUM] = max(0, int(options[LALA_MEDIUM_INTERVAL_KEY]))
 
-            if QUERY_FANDATA_KEY in options:
-                self._QUERY_FANDATA = options[QUERY_FANDATA_KEY]
+            if LALA_SLOW_INTERVAL_KEY in options and options[LALA_SLOW_INTERVAL_KEY] is not None:
+                self._LALA_TIER_INTERVALS[LALA_TIER_SLOW] = max(0, int(options[LALA_SLOW_INTERVAL_KEY]))
 
-            if QUERY_SOCKETS_KEY in options:
-                self._QUERY_SOCKETSDATA = options[QUERY_SOCKETS_KEY]
+            if LALA_HISTORY_DEPTH_KEY in options and options[LALA_HISTORY_DEPTH_KEY] is not None:
+                a_history_depth = max(0, int(options[LALA_HISTORY_DEPTH_KEY]))
 
-            if IGNORE_SYSTEM_STATE_KEY in options:
-                self._IGNORE_SYSTEM_STATUS = options[IGNORE_SYSTEM_STATE_KEY]
+        # the values of the last polls (for the rolling sensors) - 'None' when disabled
+        self._lala_history = LalaHistory(LALA_HISTORY_FIELDS, a_history_depth) if a_history_depth > 0 else None
+        self._energy_integrator = EnergyIntegrator(LALA_ENERGY_COUNTERS, LALA_ENERGY_MAX_GAP)
 
         self._host = host
         if use_https:
@@ -250,6 +301,10 @@ class SenecLocal:
         self._raw_post = None
         self._raw = None
         self._raw_version = None
+        # the resolved values of the SENEC_LALA_FIELD_TABLE (the generated properties read from here)
+        self._lala_slots = SENEC_LALA_FIELD_TABLE.empty()
+        # the per poll BMS cell statistics (min/max/mean/std/spread per module & pack)
+        self._bms_cell_analytics = {}
         self._last_version_update = 0
         self._last_version_attempt = 0
         self._last_system_reset = 0
@@ -257,11 +312,68 @@ class SenecLocal:
                                               ceil_threshold=5)
         self._bridge_to_senec_online = None
 
+        # adaptive pacing between the lala.cgi chunk-requests (EWMA of the response time & error rate)
+        self._lala_pacing_wait = LALA_PACING_INITIAL_WAIT
+        self._lala_latency_ewma = None
+        self._lala_error_rate_ewma = 0.0
+        self._lala_requests_total = 0
+        self._lala_errors_total = 0
+
+        # the pre-serialized lala.cgi chunks (will be rebuilt when the options or the firmware version change)
+        # for each combination of the refresh tiers that are due
+        self._lala_request_plans = {}
+        self._lala_request_plan_key = None
+        self._lala_tier_forms = {}
+        self._lala_tier_ts = {}
+
+        # the changed lala.cgi fields (per section) since the last 'pop_lala_changes()' call - 'None' when
+        # there is nothing to compare with (so all values must be treated as changed)
+        self._lala_changes = None
+
         #try:
         #    asyncio.create_task(self.update_version())
         #except Exception as exc:
         #    _LOGGER.debug(f"Exception while try to call 'self.update_version()': {exc}")
 
+    def _set_query_options(self, options: dict):
+        if QUERY_PV1_KEY in options:
+            self._QUERY_PV1 = options[QUERY_PV1_KEY]
+
+        if QUERY_PM1OBJ1_KEY in options:
+            self._QUERY_PM1OBJ1 = options[QUERY_PM1OBJ1_KEY]
+
+        if QUERY_PM1OBJ2_KEY in options:
+            self._QUERY_PM1OBJ2 = options[QUERY_PM1OBJ2_KEY]
+
+        if QUERY_BMS_KEY in options:
+            self._QUERY_BMS = options[QUERY_BMS_KEY]
+
+        if QUERY_BMS_CELLS_KEY in options:
+            self._QUERY_BMS_CELLS = options[QUERY_BMS_CELLS_KEY]
+            if self._QUERY_BMS_CELLS:
+                self._QUERY_BMS = True
+
+        if QUERY_WALLBOX_KEY in options:
+            self._QUERY_WALLBOX = options[QUERY_WALLBOX_KEY]
+            # do we need some additional information for our wallbox (that are only available via the app-api!
+            self._QUERY_WALLBOX_APPAPI = options[QUERY_WALLBOX_KEY]
+
+        if QUERY_FANDATA_KEY in options:
+            self._QUERY_FANDATA = options[QUERY_FANDATA_KEY]
+
+        if QUERY_SOCKETS_KEY in options:
+            self._QUERY_SOCKETSDATA = options[QUERY_SOCKETS_KEY]
+
+        if QUERY_FIELDS_KEY in options:
+            self._QUERY_FIELDS = options[QUERY_FIELDS_KEY] if options[QUERY_FIELDS_KEY] is not None else {}
+
+    def update_query_options(self, options: dict):
+        # called when entities have been enabled/disabled - the request plan will be rebuilt with the next poll
+        self._set_query_options(options)
+        _LOGGER.debug(f"update_query_options(): new options: {options}")
+        if self._bridge_to_senec_online is not None and self._QUERY_WALLBOX_APPAPI:
+            self._bridge_to_senec_online._QUERY_WALLBOX = True
+
     def set_senec_online_instance(self, a_senec_online):
         if a_senec_online is not None:
             _LOGGER.debug(f"SIBLING: SenecLocal: bound a instance of SenecOnline - BRIDGE from LOCAL to ONLINE is establish!")
@@ -303,21 +415,21 @@ class SenecLocal:
         form = {SENEC_SECTION_FACTORY:{"SYS_TYPE":"","COUNTRY":"","DEVICE_ID":""}}
         try:
             async with self.lala_session.post(self.url, json=form, ssl=False, headers=self._lalaHeaders, timeout=self._timeout) as res:
-                _LOGGER.debug(f"_init_gui_cookies(): {util.mask_map(form)} from '{self.url}' - with headers: {res.request_info.headers}")
+                _LOGGER.debug("_init_gui_cookies(): %s from '%s' - with headers: %s", util.lazy_mask_map(form), self.url, res.request_info.headers)
                 try:
                     res.raise_for_status()
                     data = parse(await res.json())
                     if SET_COOKIE in res.headers:
-                        _LOGGER.debug(f"_init_gui_cookies(): response {util.mask_map(data)} - {res.headers[SET_COOKIE]}")
+                        _LOGGER.debug("_init_gui_cookies(): response %s - %s", util.lazy_mask_map(data), res.headers[SET_COOKIE])
                     else:
                         if(retry):
-                            _LOGGER.debug(f"_init_gui_cookies(): response {util.mask_map(data)} - NO COOKIES in RESPONSE (try to logout)")
+                            _LOGGER.debug("_init_gui_cookies(): response %s - NO COOKIES in RESPONSE (try to logout)", util.lazy_mask_map(data))
                             await asyncio.sleep(2)
                             await self._senec_local_access_stop_no_checks()
                             await asyncio.sleep(5)
                             await self._init_gui_cookies(retry=False)
                         else:
-                            _LOGGER.debug(f"_init_gui_cookies(): response {util.mask_map(data)} - NO COOKIES in RESPONSE")
+                            _LOGGER.debug("_init_gui_cookies(): response %s - NO COOKIES in RESPONSE", util.lazy_mask_map(data))
 
                 except JSONDecodeError as exc:
                     _LOGGER.warning(f"_init_gui_cookies(): JSONDecodeError while 'await res.json()' {exc}")
@@ -361,7 +473,7 @@ class SenecLocal:
 
         try:
             async with self.lala_session.post(self.url, json=form, ssl=False, headers=self._lalaHeaders, timeout=self._timeout) as res:
-                _LOGGER.debug(f"_read_version() {util.mask_map(form)} from '{self.url}' - with headers: {res.request_info.headers}")
+                _LOGGER.debug("_read_version() %s from '%s' - with headers: %s", util.lazy_mask_map(form), self.url, res.request_info.headers)
                 try:
                     res.raise_for_status()
                     self._raw_version = parse(await res.json())
@@ -395,6 +507,206 @@ class SenecLocal:
                 _LOGGER.info(f"_read_senec_lala_with_retry() failed with {type(exc).__name__} - {exc}")
 
     async def _read_senec_lala(self):
+        # the tier timestamps & the history must not be affected by a step of the wall clock (NTP)
+        a_now = monotonic()
+        # must be done before the due tiers are checked (changed options will reset the tier timestamps)
+        self._update_senec_lala_tier_forms()
+        # the 'fast' tier is always due - 'medium' & 'slow' only when their interval has passed
+        due_tiers = frozenset(a_tier for a_tier, a_interval in self._LALA_TIER_INTERVALS.items()
+                              if a_interval <= 0 or a_tier not in self._lala_tier_ts or
+                              self._lala_tier_ts[a_tier] + a_interval - 5 < a_now)
+
+        a_plan = self._get_senec_lala_request_plan(due_tiers)
+        a_raw = decode(await self._request_senec_lala_plan(a_plan))
+        for a_tier, a_tier_form in self._lala_tier_forms.items():
+            if a_tier in due_tiers:
+                # only when we got all sections (and fields) of the tier, we can skip the tier for the next polls
+                if self._is_senec_lala_tier_complete(a_raw, a_tier_form):
+                    self._lala_tier_ts[a_tier] = a_now
+            elif self._raw is not None:
+                self._merge_cached_senec_lala_values(a_raw, a_tier_form)
+
+        if self._raw is None:
+            self._lala_changes = None
+        elif self._lala_changes is not None:
+            merge_diffs(self._lala_changes, diff(self._raw, a_raw))
+        self._raw = a_raw
+        self._update_lala_slots()
+        self._append_lala_history(a_now)
+        self._integrate_energy(a_now)
+
+    @staticmethod
+    def _is_senec_lala_tier_complete(a_raw: dict, a_tier_form: dict) -> bool:
+        # a split section (see '_build_senec_lala_chunks') is present, even if one of its chunks failed - so
+        # the fields must be checked too
+        for a_section, a_fields in a_tier_form.items():
+            a_section_data = a_raw.get(a_section, None)
+            if a_section_data is None:
+                return False
+            if isinstance(a_fields, dict) and len(a_fields) > 0:
+                if not isinstance(a_section_data, Mapping) or any(a_field not in a_section_data for a_field in a_fields):
+                    return False
+        return True
+
+    def _update_lala_slots(self):
+        self._lala_slots = SENEC_LALA_FIELD_TABLE.resolve(self._raw)
+        self._bms_cell_analytics = bms_cells.analyze(self._raw) if self._QUERY_BMS_CELLS else {}
+
+    def _append_lala_history(self, ts: float):
+        if self._lala_history is not None:
+            values = {}
+            for a_field in LALA_HISTORY_FIELDS:
+                try:
+                    values[a_field] = getattr(self, a_field)
+                except (KeyError, TypeError, IndexError):
+                    pass
+            self._lala_history.append(ts, values)
+
+    @property
+    def lala_history(self) -> LalaHistory | None:
+        return self._lala_history
+
+    def _history_mean(self, field: str) -> float | None:
+        if self._lala_history is not None:
+            return self._lala_history.mean(field, LALA_HISTORY_AVG_WINDOW)
+
+    @property
+    def house_power_avg(self) -> float:
+        return self._history_mean("house_power")
+
+    @property
+    def solar_generated_power_avg(self) -> float:
+        return self._history_mean("solar_generated_power")
+
+    @property
+    def grid_state_power_avg(self) -> float:
+        return self._history_mean("grid_state_power")
+
+    @property
+    def battery_state_power_avg(self) -> float:
+        return self._history_mean("battery_state_power")
+
+    def _integrate_energy(self, ts: float):
+        def as_number(value):
+            # 'VARIABLE_NOT_FOUND' & co
+            return value if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+        a_grid = as_number(self.grid_state_power)
+        a_battery = as_number(self.battery_state_power)
+        try:
+            a_solar = as_number(self.solar_generated_power)
+        except (KeyError, TypeError):
+            a_solar = None
+        self._energy_integrator.add(ts, {
+            "house_total_consumption_integrated": as_number(self.house_power),
+            "solar_total_generated_integrated": a_solar,
+            "grid_total_import_integrated": max(a_grid, 0) if a_grid is not None else None,
+            "grid_total_export_integrated": max(-a_grid, 0) if a_grid is not None else None,
+            "battery_total_charged_integrated": max(a_battery, 0) if a_battery is not None else None,
+            "battery_total_discharged_integrated": max(-a_battery, 0) if a_battery is not None else None
+        })
+
+    def energy_checkpoint(self) -> dict:
+        return self._energy_integrator.checkpoint()
+
+    def restore_energy_checkpoint(self, data: dict | None):
+        self._energy_integrator.restore(data)
+
+    @property
+    def house_total_consumption_integrated(self) -> float:
+        return self._energy_integrator.total("house_total_consumption_integrated")
+
+    @property
+    def solar_total_generated_integrated(self) -> float:
+        return self._energy_integrator.total("solar_total_generated_integrated")
+
+    @property
+    def grid_total_import_integrated(self) -> float:
+        return self._energy_integrator.total("grid_total_import_integrated")
+
+    @property
+    def grid_total_export_integrated(self) -> float:
+        return self._energy_integrator.total("grid_total_export_integrated")
+
+    @property
+    def battery_total_charged_integrated(self) -> float:
+        return self._energy_integrator.total("battery_total_charged_integrated")
+
+    @property
+    def battery_total_discharged_integrated(self) -> float:
+        return self._energy_integrator.total("battery_total_discharged_integrated")
+
+    def _mark_lala_field_changed(self, section: str, field: str):
+        # a local write to self._raw - the next diff would not see it
+        if self._lala_changes is not None:
+            merge_diffs(self._lala_changes, {section: frozenset((field,))})
+        self._update_lala_slots()
+
+    def pop_lala_changes(self) -> dict | None:
+        # the changed fields per section since the last call ('None' when all values must be treated as changed)
+        a_changes = self._lala_changes
+        self._lala_changes = {}
+        return a_changes
+
+    def _merge_cached_senec_lala_values(self, a_raw: dict, a_form: dict):
+        # the values of the skipped sections/fields will be taken from the previous poll
+        for a_section, a_fields in a_form.items():
+            if a_section in self._raw:
+                if isinstance(a_fields, dict) and len(a_fields) > 0 and isinstance(self._raw[a_section], LalaSection):
+                    a_target = a_raw.setdefault(a_section, LalaSection())
+                    if isinstance(a_target, LalaSection):
+                        for a_field in a_fields:
+                            if a_field in self._raw[a_section] and a_field not in a_target:
+                                a_target[a_field] = self._raw[a_section][a_field]
+                else:
+                    a_raw.setdefault(a_section, self._raw[a_section])
+
+    def _update_senec_lala_tier_forms(self):
+        # the form (and so the chunks) only depends on the query options and the firmware version of the
+        # system - so we build the request plan only once and just post the pre-serialized chunks on every poll
+        a_plan_key = (self._QUERY_STATS, self._QUERY_USER_LEVEL, self._QUERY_PV1, self._QUERY_PM1OBJ1,
+                      self._QUERY_PM1OBJ2, self._QUERY_BMS, self._QUERY_BMS_CELLS, self._QUERY_WALLBOX,
+                      self._QUERY_FANDATA, self._QUERY_SOCKETSDATA, self.number_of_configured_bms_modules,
+                      self._is_2408_or_higher(), self._is_2411_or_higher(),
+                      tuple(sorted((a_section, tuple(sorted(a_fields))) for a_section, a_fields in self._QUERY_FIELDS.items())))
+        if self._lala_request_plan_key != a_plan_key:
+            self._lala_tier_forms = self._split_senec_lala_form_into_tiers(self._build_senec_lala_form())
+            self._lala_request_plans = {}
+            self._lala_request_plan_key = a_plan_key
+            # the options have changed - so new fields in the 'medium' & 'slow' tier must be requested right now
+            self._lala_tier_ts = {}
+
+    def _get_senec_lala_request_plan(self, due_tiers: frozenset) -> list[tuple[dict, bytes]]:
+        self._update_senec_lala_tier_forms()
+        if due_tiers not in self._lala_request_plans:
+            form = {}
+            for a_tier in [LALA_TIER_FAST, LALA_TIER_MEDIUM, LALA_TIER_SLOW]:
+                if a_tier in due_tiers and a_tier in self._lala_tier_forms:
+                    for a_section, a_fields in self._lala_tier_forms[a_tier].items():
+                        if a_section in form and isinstance(a_fields, dict):
+                            form[a_section] = {**form[a_section], **a_fields}
+                        else:
+                            form[a_section] = a_fields
+
+            _LOGGER.debug("_get_senec_lala_request_plan(): build request plan for tiers %s: %s from '%s'", sorted(due_tiers), util.lazy_mask_map(form), self.url)
+            self._lala_request_plans[due_tiers] = self._build_senec_lala_request_plan(form)
+        return self._lala_request_plans[due_tiers]
+
+    @staticmethod
+    def _split_senec_lala_form_into_tiers(form: dict) -> dict:
+        tier_forms = {}
+        for a_section, a_fields in form.items():
+            a_section_tier = SENEC_LALA_SECTION_TIERS.get(a_section, LALA_TIER_FAST)
+            a_field_tiers = SENEC_LALA_FIELD_TIERS.get(a_section, None)
+            if a_field_tiers is None or not isinstance(a_fields, dict) or len(a_fields) == 0:
+                tier_forms.setdefault(a_section_tier, {})[a_section] = a_fields
+            else:
+                for a_field, a_value in a_fields.items():
+                    a_tier = a_field_tiers.get(a_field, a_section_tier)
+                    tier_forms.setdefault(a_tier, {}).setdefault(a_section, {})[a_field] = a_value
+        return tier_forms
+
+    def _build_senec_lala_form(self) -> dict:
         # captured 2026/08
         # form_lala_captured = {
         #     "PM1OBJ1": {
@@ -549,7 +861,23 @@ class SenecLocal:
             form[SENEC_SECTION_FAN_SPEED] = {}
 
         if self._QUERY_SOCKETSDATA:
-            form[SENEC_SECTION_SOCKETS] = {}
+            # the fields are listed explicitly - so the (live) state & the configuration fields can be
+            # requested in different tiers
+            form[SENEC_SECTION_SOCKETS] = {
+                "POWER_ON": "",
+                "ALREADY_SWITCHED": "",
+                "TIME_REM": "",
+                "PRIORITY": "",
+                "FORCE_ON": "",
+                "ENABLE": "",
+                "USE_TIME": "",
+                "LOWER_LIMIT": "",
+                "UPPER_LIMIT": "",
+                "POWER_ON_TIME": "",
+                "SWITCH_ON_HOUR": "",
+                "SWITCH_ON_MINUTE": "",
+                "TIME_LIMIT": ""
+            }
 
         if self._QUERY_BMS:
             bms_query = {
@@ -607,56 +935,122 @@ class SenecLocal:
                 "PROHIBIT_USAGE": ""
             }
 
-        await self._request_senec_lala_chunked(form)
+        # only request the fields that are actually used by the enabled entities
+        for a_section, a_fields in self._QUERY_FIELDS.items():
+            if a_section in form and isinstance(form[a_section], dict) and len(form[a_section]) > 0:
+                a_filtered_fields = {a_key: a_value for a_key, a_value in form[a_section].items() if a_key in a_fields}
+                if len(a_filtered_fields) > 0:
+                    form[a_section] = a_filtered_fields
 
-    async def _request_senec_lala_chunked(self, payload: dict, max_len: int = 600) -> dict:
-        _LOGGER.debug(f"_request_senec_lala_chunked(): request {util.mask_map(payload)} from '{self.url}'")
-        req_min_wait = 0.2
-        def compact_json(data: dict) -> str:
+        return form
+
+    @staticmethod
+    def _build_senec_lala_chunks(payload: dict, max_len: int = 600) -> list[dict]:
+        def compact_json(data) -> str:
             # Replicates JS JSON.stringify() character formatting (no spaces)
             return json.dumps(data, separators=(',', ':'))
 
-        chunk_form_data = {}
+        # 1) collect all sections (with the length of their serialized '"key":value') - sections that
+        # do not fit into a single chunk (e.g. BMS with all the cell data) will be split on field level
+        items = []
+        for key, value in payload.items():
+            key_len = len(compact_json(key)) + 1
+            value_len = len(compact_json(value))
+            if 2 + key_len + value_len >= max_len and isinstance(value, dict) and len(value) > 1:
+                a_part = {}
+                a_part_len = 2
+                for a_field_key, a_field_value in value.items():
+                    a_field_len = len(compact_json(a_field_key)) + 1 + len(compact_json(a_field_value))
+                    if a_part and 2 + key_len + a_part_len + 1 + a_field_len >= max_len:
+                        items.append((key, a_part, key_len + a_part_len))
+                        a_part = {}
+                        a_part_len = 2
+                    a_part_len += a_field_len + (1 if a_part else 0)
+                    a_part[a_field_key] = a_field_value
+                if a_part:
+                    items.append((key, a_part, key_len + a_part_len))
+            else:
+                items.append((key, value, key_len + value_len))
+
+        # 2) first-fit-decreasing: the largest sections first, each into the first chunk that still has
+        # space for it - a chunk can only hold a single part of a (split) section
+        items.sort(key=lambda an_item: an_item[2], reverse=True)
+        chunks = []
+        chunks_len = []
+        for key, value, item_len in items:
+            for idx, a_chunk_form_data in enumerate(chunks):
+                if key not in a_chunk_form_data and chunks_len[idx] + 1 + item_len < max_len:
+                    a_chunk_form_data[key] = value
+                    chunks_len[idx] += 1 + item_len
+                    break
+            else:
+                chunks.append({key: value})
+                chunks_len.append(2 + item_len)
+
+        return chunks
+
+    @staticmethod
+    def _merge_senec_lala_response(responses: dict, a_chunk_response: dict):
+        # a section might have been split over multiple chunks - so we must merge on field level
+        for a_section, a_section_data in a_chunk_response.items():
+            if isinstance(a_section_data, dict) and isinstance(responses.get(a_section, None), dict):
+                responses[a_section].update(a_section_data)
+            else:
+                responses[a_section] = a_section_data
+
+    @staticmethod
+    def _build_senec_lala_request_plan(payload: dict, max_len: int = 600) -> list[tuple[dict, bytes]]:
+        return [(a_chunk_form_data, json.dumps(a_chunk_form_data, separators=(',', ':')).encode("utf-8"))
+                for a_chunk_form_data in SenecLocal._build_senec_lala_chunks(payload, max_len)]
+
+    async def _request_senec_lala_chunked(self, payload: dict, max_len: int = 600) -> dict:
+        _LOGGER.debug("_request_senec_lala_chunked(): request %s from '%s'", util.lazy_mask_map(payload), self.url)
+        self._raw = decode(await self._request_senec_lala_plan(self._build_senec_lala_request_plan(payload, max_len)))
+        self._lala_changes = None
+        self._update_lala_slots()
+
+    async def _request_senec_lala_plan(self, plan: list[tuple[dict, bytes]]) -> dict:
         responses = {}
-        part_count = 0
 
-        # Process key-value pairs and chunk if length limit is reached
-        must_pause = False
-        for key, value in payload.items():
-            # Check if serialized item + current chunk exceeds character limit
-            if len(compact_json(value)) + len(compact_json(chunk_form_data)) >= max_len:
-                if chunk_form_data:
-                    if must_pause:
-                        await asyncio.sleep(req_min_wait)
-                    must_pause = True
-
-                    # Send full chunk
-                    a_chunk_response = await self._request_senec_lala(chunk_form_data, part_count)
-                    part_count += 1
-                    if a_chunk_response is not None:
-                        responses.update(a_chunk_response)
-                    chunk_form_data = {}
-
-            chunk_form_data[key] = value
-
-        # Send remaining payload buffer
-        if chunk_form_data:
-            if must_pause:
-                await asyncio.sleep(req_min_wait)
-            a_chunk_response = await self._request_senec_lala(chunk_form_data, part_count)
-            if a_chunk_response is not None:
-                responses.update(a_chunk_response)
-
-        # finally processing the complete response object (after the requests had been chuncked to max of 600 bytes)
-        self._raw = parse(responses)
-
-    async def _request_senec_lala(self, form:dict, part_count:int):
+        if self._LALA_MAX_PARALLEL_REQUESTS <= 1 or len(plan) <= 1:
+            # sequential mode (for the fragile firmware versions) - one chunk after the other
+            for part_count, (a_chunk_form_data, a_chunk_bytes) in enumerate(plan):
+                if part_count > 0 and self._lala_pacing_wait > 0:
+                    await asyncio.sleep(self._lala_pacing_wait)
+                a_chunk_response = await self._request_senec_lala(a_chunk_form_data, part_count, a_chunk_bytes)
+                if a_chunk_response is not None:
+                    self._merge_senec_lala_response(responses, a_chunk_response)
+        else:
+            # pipelined mode - up to '_LALA_MAX_PARALLEL_REQUESTS' chunks are in flight at the same time,
+            # the responses can be merged as they arrive, since '_merge_senec_lala_response' merges the sections
+            # that have been split over multiple chunks field by field
+            a_semaphore = asyncio.Semaphore(self._LALA_MAX_PARALLEL_REQUESTS)
+            async def request_chunk_bounded(a_chunk_form_data: dict, a_chunk_bytes: bytes, part_count: int):
+                async with a_semaphore:
+                    if part_count > 0 and self._lala_pacing_wait > 0:
+                        await asyncio.sleep(self._lala_pacing_wait)
+                    return await self._request_senec_lala(a_chunk_form_data, part_count, a_chunk_bytes)
+
+            for a_chunk_task in asyncio.as_completed([request_chunk_bounded(a_chunk_form_data, a_chunk_bytes, part_count) for part_count, (a_chunk_form_data, a_chunk_bytes) in enumerate(plan)]):
+                a_chunk_response = await a_chunk_task
+                if a_chunk_response is not None:
+                    self._merge_senec_lala_response(responses, a_chunk_response)
+
+        # the complete response object (after the requests had been chuncked to max of 600 bytes)
+        return responses
+
+    async def _request_senec_lala(self, form:dict, part_count:int, form_bytes: bytes = None):
+        if form_bytes is None:
+            form_bytes = json.dumps(form, separators=(',', ':')).encode("utf-8")
+        start_ts = monotonic()
         try:
-            async with self.lala_session.post(self.url, json=form, ssl=False, headers=self._lalaHeaders, timeout=self._timeout) as res:
-                _LOGGER.debug(f"_request_senec_lala() form-part[{part_count}] with len: {len(json.dumps(form, separators=(',', ':')))} from '{self.url}' - with headers: {res.request_info.headers}")
+            async with self.lala_session.post(self.url, data=form_bytes, ssl=False, headers=self._lalaHeaders, timeout=self._timeout) as res:
+                _LOGGER.debug(f"_request_senec_lala() form-part[{part_count}] with len: {len(form_bytes)} from '{self.url}' - with headers: {res.request_info.headers}")
                 try:
                     res.raise_for_status()
-                    return await res.json()
+                    data = await res.json()
+                    self._update_lala_pacing(monotonic() - start_ts, failed=False)
+                    return data
                 except JSONDecodeError as exc:
                     _LOGGER.warning(f"_request_senec_lala(): JSONDecodeError while 'await res.json()' {exc}")
                 except Exception as err:
@@ -667,6 +1061,40 @@ class SenecLocal:
         except BaseException as e:
             _LOGGER.info(f"_request_senec_lala() caused: {type(e).__name__} - {e}")
 
+        self._update_lala_pacing(monotonic() - start_ts, failed=True)
+
+    def _update_lala_pacing(self, duration: float, failed: bool):
+        self._lala_requests_total += 1
+        if failed:
+            self._lala_errors_total += 1
+        else:
+            if self._lala_latency_ewma is None:
+                self._lala_latency_ewma = duration
+            else:
+                self._lala_latency_ewma = LALA_PACING_EWMA_ALPHA * duration + (1 - LALA_PACING_EWMA_ALPHA) * self._lala_latency_ewma
+        self._lala_error_rate_ewma = LALA_PACING_EWMA_ALPHA * (1.0 if failed else 0.0) + (1 - LALA_PACING_EWMA_ALPHA) * self._lala_error_rate_ewma
+
+        if self._lala_error_rate_ewma > LALA_PACING_ERROR_RATE_THRESHOLD:
+            if failed:
+                # the NPU starts dropping our requests - back off (exponentially) till it recovers
+                new_wait = max(self._lala_pacing_wait * 2, LALA_PACING_INITIAL_WAIT)
+            else:
+                # keep the current pause, till the error rate has calmed down
+                new_wait = self._lala_pacing_wait
+        elif self._lala_latency_ewma is not None and self._lala_latency_ewma <= LALA_PACING_FAST_RESPONSE:
+            # the NPU answers fast - no need to pause between the chunks
+            new_wait = 0.0
+        elif self._lala_latency_ewma is not None:
+            # give the NPU webserver a breather that is proportional to its current response time
+            new_wait = self._lala_latency_ewma * LALA_PACING_LATENCY_FACTOR
+        else:
+            new_wait = self._lala_pacing_wait
+
+        new_wait = min(new_wait, LALA_PACING_MAX_WAIT)
+        if new_wait != self._lala_pacing_wait:
+            _LOGGER.debug(f"_update_lala_pacing(): pacing changed from {self._lala_pacing_wait:.3f}s to {new_wait:.3f}s [latency: {self._lala_latency_ewma}, error-rate: {self._lala_error_rate_ewma:.3f}]")
+            self._lala_pacing_wait = new_wait
+
     async def _read_all_fields(self) -> []:
         form = {}
         try:
@@ -708,23 +1136,26 @@ class SenecLocal:
         await self._write_senec_v31(data)
 
     async def _write_senec_v31(self, data):
-        _LOGGER.debug(f"_write_senec_v31(): posting data (raw): {util.mask_map(data)}")
+        _LOGGER.debug("_write_senec_v31(): posting data (raw): %s", util.lazy_mask_map(data))
+        # after any write, we want to read all the (cached) sections with the next poll
+        self._lala_tier_ts = {}
         try:
             async with self.lala_session.post(self.url, json=data, ssl=False, headers=self._lalaHeaders, timeout=self._timeout) as res:
                 try:
                     res.raise_for_status()
                     self._raw_post = parse(await res.json())
-                    _LOGGER.debug(f"_write_senec_v31(): post result (already parsed): {util.mask_map(self._raw_post)}")
+                    _LOGGER.debug("_write_senec_v31(): post result (already parsed): %s", util.lazy_mask_map(self._raw_post))
                     return self._raw_post
                 except Exception as err:
                     _LOGGER.warning(f"_write_senec_v31(): Error while 'posting data' {err}")
         except asyncio.TimeoutError:
-            _LOGGER.info(f"_write_senec_v31(): TimeoutError (20sec) while posting '{util.mask_map(data)}'")
+            _LOGGER.info("_write_senec_v31(): TimeoutError (20sec) while posting '%s'", util.lazy_mask_map(data))
         except BaseException as e:
             _LOGGER.info(f"_write_senec_v31() caused: {type(e).__name__} - {e}")
 
     async def _senec_v31_post_plain_form_data(self, form_data_str:str):
         _LOGGER.debug(f"posting x-www-form-urlencoded: {form_data_str}")
+        self._lala_tier_ts = {}
         special_hdrs = {
             "Host": self._host,
             "Origin": self._host_and_schema,
@@ -748,7 +1179,7 @@ class SenecLocal:
                 try:
                     res.raise_for_status()
                     self._raw_post = parse(await res.json())
-                    _LOGGER.debug(f"senec_v31_post_plain_form_data(): post result (already parsed): {util.mask_map(self._raw_post)}")
+                    _LOGGER.debug("senec_v31_post_plain_form_data(): post result (already parsed): %s", util.lazy_mask_map(self._raw_post))
                     return self._raw_post
                 except Exception as err:
                     _LOGGER.warning(f"senec_v31_post_plain_form_data(): Error while 'posting data' {err}")
@@ -841,9 +1272,11 @@ class SenecLocal:
             post_data_str = None
             if (value):
                 self._raw[SENEC_SECTION_ENERGY]["SAFE_CHARGE_RUNNING"] = 1
+                self._mark_lala_field_changed(SENEC_SECTION_ENERGY, "SAFE_CHARGE_RUNNING")
                 post_data_str = '{"ENERGY":{"SAFE_CHARGE_FORCE":"u8_01","SAFE_CHARGE_PROHIBIT":"","SAFE_CHARGE_RUNNING":"","LI_STORAGE_MODE_START":"","LI_STORAGE_MODE_STOP":"","LI_STORAGE_MODE_RUNNING":""}}'
             else:
                 self._raw[SENEC_SECTION_ENERGY]["SAFE_CHARGE_RUNNING"] = 0
+                self._mark_lala_field_changed(SENEC_SECTION_ENERGY, "SAFE_CHARGE_RUNNING")
                 post_data_str = '{"ENERGY":{"SAFE_CHARGE_FORCE":"","SAFE_CHARGE_PROHIBIT":"u8_01","SAFE_CHARGE_RUNNING":"","LI_STORAGE_MODE_START":"","LI_STORAGE_MODE_STOP":"","LI_STORAGE_MODE_RUNNING":""}}'
 
             await self._senec_v31_post_plain_form_data(post_data_str)
@@ -868,12 +1301,14 @@ class SenecLocal:
         post_data = {}
         if (value):
             self._raw[SENEC_SECTION_ENERGY]["LI_STORAGE_MODE_RUNNING"] = 1
+            self._mark_lala_field_changed(SENEC_SECTION_ENERGY, "LI_STORAGE_MODE_RUNNING")
             post_data = {
                 SENEC_SECTION_ENERGY: {"SAFE_CHARGE_FORCE": "", "SAFE_CHARGE_PROHIBIT": "", "SAFE_CHARGE_RUNNING": "",
                                        "LI_STORAGE_MODE_START": "u8_01", "LI_STORAGE_MODE_STOP": "",
                                        "LI_STORAGE_MODE_RUNNING": ""}}
         else:
             self._raw[SENEC_SECTION_ENERGY]["LI_STORAGE_MODE_RUNNING"] = 0
+            self._mark_lala_field_changed(SENEC_SECTION_ENERGY, "LI_STORAGE_MODE_RUNNING")
             post_data = {
                 SENEC_SECTION_ENERGY: {"SAFE_CHARGE_FORCE": "", "SAFE_CHARGE_PROHIBIT": "", "SAFE_CHARGE_RUNNING": "",
                                        "LI_STORAGE_MODE_START": "", "LI_STORAGE_MODE_STOP": "u8_01",
@@ -1011,6 +1446,22 @@ class SenecLocal:
         # self._raw_version = None
         return {"data": self._raw, "version": self._raw_version}
 
+    @property
+    def lala_response_time(self) -> float:
+        if self._lala_latency_ewma is not None:
+            return round(self._lala_latency_ewma * 1000, 1)
+        return None
+
+    @property
+    def lala_response_time_attr(self) -> dict:
+        return {
+            "pacing_wait_ms": round(self._lala_pacing_wait * 1000, 1),
+            "error_rate": round(self._lala_error_rate_ewma, 3),
+            "requests_total": self._lala_requests_total,
+            "errors_total": self._lala_errors_total,
+            "max_parallel_requests": self._LALA_MAX_PARALLEL_REQUESTS
+        }
+
     @property
     def device_id(self) -> str:
         if self._raw_version is not None and SENEC_SECTION_FACTORY in self._raw_version:
@@ -1069,24 +1520,6 @@ class SenecLocal:
         """
         return self._raw
 
-    @property
-    def house_power(self) -> float:
-        """
-        Current power consumption (W)
-
-        """
-        if self._raw is not None and SENEC_SECTION_ENERGY in self._raw:
-            return self._raw[SENEC_SECTION_ENERGY]["GUI_HOUSE_POW"]
-
-    @property
-    def house_total_consumption(self) -> float:
-        """
-        Total energy used by house (kWh)
-        Does not include Wallbox.
-        """
-        if self._raw is not None and SENEC_SECTION_STATISTIC in self._raw and "LIVE_HOUSE_CONS" in self._raw[SENEC_SECTION_STATISTIC]:
-            return self._raw[SENEC_SECTION_STATISTIC]["LIVE_HOUSE_CONS"]
-
     @property
     def solar_generated_power(self) -> float:
         """
@@ -1095,22 +1528,6 @@ class SenecLocal:
         if self._raw is not None and SENEC_SECTION_ENERGY in self._raw:
             return abs(self._raw[SENEC_SECTION_ENERGY]["GUI_INVERTER_POWER"])
 
-    @property
-    def solar_total_generated(self) -> float:
-        """
-        Total energy generated by solar panels (kWh)
-        """
-        if self._raw is not None and SENEC_SECTION_STATISTIC in self._raw and "LIVE_PV_GEN" in self._raw[SENEC_SECTION_STATISTIC]:
-            return self._raw[SENEC_SECTION_STATISTIC]["LIVE_PV_GEN"]
-
-    @property
-    def battery_charge_percent(self) -> float:
-        """
-        Current battery charge value (%)
-        """
-        if self._raw is not None and SENEC_SECTION_ENERGY in self._raw:
-            return self._raw[SENEC_SECTION_ENERGY]["GUI_BAT_DATA_FUEL_CHARGE"]
-
     @property
     def battery_charge_power(self) -> float:
         """
@@ -1135,42 +1552,6 @@ class SenecLocal:
                     return abs(value)
         return 0
 
-    @property
-    def battery_state_power(self) -> float:
-        """
-        Battery charging power (W)
-        Value is positive when battery is charging
-        Value is negative when battery is discharging.
-        """
-        if self._raw is not None and SENEC_SECTION_ENERGY in self._raw:
-            return self._raw[SENEC_SECTION_ENERGY]["GUI_BAT_DATA_POWER"]
-
-    @property
-    def battery_state_current(self) -> float:
-        if self._raw is not None and SENEC_SECTION_ENERGY in self._raw:
-            return self._raw[SENEC_SECTION_ENERGY]["GUI_BAT_DATA_CURRENT"]
-
-    @property
-    def battery_state_voltage(self) -> float:
-        if self._raw is not None and SENEC_SECTION_ENERGY in self._raw:
-            return self._raw[SENEC_SECTION_ENERGY]["GUI_BAT_DATA_VOLTAGE"]
-
-    @property
-    def battery_total_charged(self) -> float:
-        """
-        Total energy charged to battery (kWh)
-        """
-        if self._raw is not None and SENEC_SECTION_STATISTIC in self._raw and "LIVE_BAT_CHARGE" in self._raw[SENEC_SECTION_STATISTIC]:
-            return self._raw[SENEC_SECTION_STATISTIC]["LIVE_BAT_CHARGE"]
-
-    @property
-    def battery_total_discharged(self) -> float:
-        """
-        Total energy discharged from battery (kWh)
-        """
-        if self._raw is not None and SENEC_SECTION_STATISTIC in self._raw and "LIVE_BAT_DISCHARGE" in self._raw[SENEC_SECTION_STATISTIC]:
-            return self._raw[SENEC_SECTION_STATISTIC]["LIVE_BAT_DISCHARGE"]
-
     @property
     def grid_imported_power(self) -> float:
         """
@@ -1193,17 +1574,6 @@ class SenecLocal:
                 return abs(value)
         return 0
 
-    @property
-    def grid_state_power(self) -> float:
-        """
-        Grid exchange power (W)
-
-        Value is positive when power is imported from grid.
-        Value is negative when power is exported to grid.
-        """
-        if self._raw is not None and SENEC_SECTION_ENERGY in self._raw:
-            return self._raw[SENEC_SECTION_ENERGY]["GUI_GRID_POW"]
-
     @property
     def grid_total_export(self) -> float:
         """
@@ -1221,811 +1591,24 @@ class SenecLocal:
         Total energy imported from grid (kWh)
         """
         if self._raw is not None and \
-                SENEC_SECTION_STATISTIC in self._raw and \
-                "LIVE_GRID_IMPORT" in self._raw[SENEC_SECTION_STATISTIC]:
-            return self._raw[SENEC_SECTION_STATISTIC]["LIVE_GRID_IMPORT"]
-
-    @property
-    def battery_temp(self) -> float:
-        """
-        Current battery temperature
-        """
-        if self._raw is not None and SENEC_SECTION_TEMPMEASURE in self._raw:
-            return self._raw[SENEC_SECTION_TEMPMEASURE]["BATTERY_TEMP"]
-
-    @property
-    def case_temp(self) -> float:
-        """
-        Current case temperature
-        """
-        if self._raw is not None and SENEC_SECTION_TEMPMEASURE in self._raw:
-            return self._raw[SENEC_SECTION_TEMPMEASURE]["CASE_TEMP"]
-
-    @property
-    def mcu_temp(self) -> float:
-        """
-        Current controller temperature
-        """
-        if self._raw is not None and SENEC_SECTION_TEMPMEASURE in self._raw:
-            return self._raw[SENEC_SECTION_TEMPMEASURE]["MCU_TEMP"]
-
-    @property
-    def solar_mpp1_potential(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PV1 in self._raw:
-            return self._raw[SENEC_SECTION_PV1]["MPP_VOL"][0]
-
-    @property
-    def solar_mpp1_current(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PV1 in self._raw:
-            return self._raw[SENEC_SECTION_PV1]["MPP_CUR"][0]
-
-    @property
-    def solar_mpp1_power(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PV1 in self._raw:
-            return self._raw[SENEC_SECTION_PV1]["MPP_POWER"][0]
-
-    @property
-    def solar_mpp2_potential(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PV1 in self._raw:
-            return self._raw[SENEC_SECTION_PV1]["MPP_VOL"][1]
-
-    @property
-    def solar_mpp2_current(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PV1 in self._raw:
-            return self._raw[SENEC_SECTION_PV1]["MPP_CUR"][1]
-
-    @property
-    def solar_mpp2_power(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PV1 in self._raw:
-            return self._raw[SENEC_SECTION_PV1]["MPP_POWER"][1]
-
-    @property
-    def solar_mpp3_potential(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PV1 in self._raw:
-            return self._raw[SENEC_SECTION_PV1]["MPP_VOL"][2]
-
-    @property
-    def solar_mpp3_current(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PV1 in self._raw:
-            return self._raw[SENEC_SECTION_PV1]["MPP_CUR"][2]
-
-    @property
-    def solar_mpp3_power(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PV1 in self._raw:
-            return self._raw[SENEC_SECTION_PV1]["MPP_POWER"][2]
-
-    @property
-    def enfluri_net_freq(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PM1OBJ1 in self._raw:
-            return self._raw[SENEC_SECTION_PM1OBJ1]["FREQ"]
-
-    @property
-    def enfluri_net_potential_p1(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PM1OBJ1 in self._raw:
-            return self._raw[SENEC_SECTION_PM1OBJ1]["U_AC"][0]
-
-    @property
-    def enfluri_net_potential_p2(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PM1OBJ1 in self._raw:
-            return self._raw[SENEC_SECTION_PM1OBJ1]["U_AC"][1]
-
-    @property
-    def enfluri_net_potential_p3(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PM1OBJ1 in self._raw:
-            return self._raw[SENEC_SECTION_PM1OBJ1]["U_AC"][2]
-
-    @property
-    def enfluri_net_current_p1(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PM1OBJ1 in self._raw:
-            return self._raw[SENEC_SECTION_PM1OBJ1]["I_AC"][0]
-
-    @property
-    def enfluri_net_current_p2(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PM1OBJ1 in self._raw:
-            return self._raw[SENEC_SECTION_PM1OBJ1]["I_AC"][1]
-
-    @property
-    def enfluri_net_current_p3(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PM1OBJ1 in self._raw:
-            return self._raw[SENEC_SECTION_PM1OBJ1]["I_AC"][2]
-
-    @property
-    def enfluri_net_power_p1(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PM1OBJ1 in self._raw:
-            return self._raw[SENEC_SECTION_PM1OBJ1]["P_AC"][0]
-
-    @property
-    def enfluri_net_power_p2(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PM1OBJ1 in self._raw:
-            return self._raw[SENEC_SECTION_PM1OBJ1]["P_AC"][1]
-
-    @property
-    def enfluri_net_power_p3(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PM1OBJ1 in self._raw:
-            return self._raw[SENEC_SECTION_PM1OBJ1]["P_AC"][2]
-
-    @property
-    def enfluri_net_power_total(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PM1OBJ1 in self._raw:
-            return self._raw[SENEC_SECTION_PM1OBJ1]["P_TOTAL"]
-
-    @property
-    def enfluri_usage_freq(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PM1OBJ2 in self._raw:
-            return self._raw[SENEC_SECTION_PM1OBJ2]["FREQ"]
-
-    @property
-    def enfluri_usage_potential_p1(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PM1OBJ2 in self._raw:
-            return self._raw[SENEC_SECTION_PM1OBJ2]["U_AC"][0]
-
-    @property
-    def enfluri_usage_potential_p2(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PM1OBJ2 in self._raw:
-            return self._raw[SENEC_SECTION_PM1OBJ2]["U_AC"][1]
-
-    @property
-    def enfluri_usage_potential_p3(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PM1OBJ2 in self._raw:
-            return self._raw[SENEC_SECTION_PM1OBJ2]["U_AC"][2]
-
-    @property
-    def enfluri_usage_current_p1(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PM1OBJ2 in self._raw:
-            return self._raw[SENEC_SECTION_PM1OBJ2]["I_AC"][0]
-
-    @property
-    def enfluri_usage_current_p2(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PM1OBJ2 in self._raw:
-            return self._raw[SENEC_SECTION_PM1OBJ2]["I_AC"][1]
-
-    @property
-    def enfluri_usage_current_p3(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PM1OBJ2 in self._raw:
-            return self._raw[SENEC_SECTION_PM1OBJ2]["I_AC"][2]
-
-    @property
-    def enfluri_usage_power_p1(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PM1OBJ2 in self._raw:
-            return self._raw[SENEC_SECTION_PM1OBJ2]["P_AC"][0]
-
-    @property
-    def enfluri_usage_power_p2(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PM1OBJ2 in self._raw:
-            return self._raw[SENEC_SECTION_PM1OBJ2]["P_AC"][1]
-
-    @property
-    def enfluri_usage_power_p3(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PM1OBJ2 in self._raw:
-            return self._raw[SENEC_SECTION_PM1OBJ2]["P_AC"][2]
-
-    @property
-    def enfluri_usage_power_total(self) -> float:
-        if self._raw is not None and SENEC_SECTION_PM1OBJ2 in self._raw:
-            return self._raw[SENEC_SECTION_PM1OBJ2]["P_TOTAL"]
-
-    def is_battery_empty(self) -> bool:
-        # 15: "BATTERY EMPTY",
-        if self._raw is not None and SENEC_SECTION_ENERGY in self._raw:
-            bat_state_is_empty = self._raw[SENEC_SECTION_ENERGY]["STAT_STATE"] == 15
-            bat_percent_is_zero = self._raw[SENEC_SECTION_ENERGY]["GUI_BAT_DATA_FUEL_CHARGE"] == 0
-            return bat_state_is_empty or bat_percent_is_zero
-
-    def is_system_state_charging(self) -> bool:
-        if self._raw is not None and SENEC_SECTION_ENERGY in self._raw:
-            return self._raw[SENEC_SECTION_ENERGY]["STAT_STATE"] in SYSTEM_STATUS_CHARGE
-
-    def is_system_state_discharging(self) -> bool:
-        if self._raw is not None and SENEC_SECTION_ENERGY in self._raw:
-            return self._raw[SENEC_SECTION_ENERGY]["STAT_STATE"] in SYSTEM_STATUS_DISCHARGE
-
-    @property
-    def bms_cell_temp_a1(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_TEMPERATURES_MODULE_A" in self._raw["BMS"]:
-            if len(self._raw["BMS"]["CELL_TEMPERATURES_MODULE_A"]) > 0:
-                return self._raw["BMS"]["CELL_TEMPERATURES_MODULE_A"][0]
-
-    @property
-    def bms_cell_temp_a2(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_TEMPERATURES_MODULE_A" in self._raw["BMS"]:
-            if len(self._raw["BMS"]["CELL_TEMPERATURES_MODULE_A"]) > 1:
-                return self._raw["BMS"]["CELL_TEMPERATURES_MODULE_A"][1]
-
-    @property
-    def bms_cell_temp_a3(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_TEMPERATURES_MODULE_A" in self._raw["BMS"]:
-            if len(self._raw["BMS"]["CELL_TEMPERATURES_MODULE_A"]) > 2:
-                return self._raw["BMS"]["CELL_TEMPERATURES_MODULE_A"][2]
-
-    @property
-    def bms_cell_temp_a4(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_TEMPERATURES_MODULE_A" in self._raw["BMS"]:
-            if len(self._raw["BMS"]["CELL_TEMPERATURES_MODULE_A"]) > 3:
-                return self._raw["BMS"]["CELL_TEMPERATURES_MODULE_A"][3]
-
-    @property
-    def bms_cell_temp_a5(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_TEMPERATURES_MODULE_A" in self._raw["BMS"]:
-            if len(self._raw["BMS"]["CELL_TEMPERATURES_MODULE_A"]) > 4:
-                return self._raw["BMS"]["CELL_TEMPERATURES_MODULE_A"][4]
-
-    @property
-    def bms_cell_temp_a6(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_TEMPERATURES_MODULE_A" in self._raw["BMS"]:
-            if len(self._raw["BMS"]["CELL_TEMPERATURES_MODULE_A"]) > 5:
-                return self._raw["BMS"]["CELL_TEMPERATURES_MODULE_A"][5]
-
-    @property
-    def bms_cell_temp_b1(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_TEMPERATURES_MODULE_B" in self._raw["BMS"]:
-            if len(self._raw["BMS"]["CELL_TEMPERATURES_MODULE_B"]) > 0:
-                return self._raw["BMS"]["CELL_TEMPERATURES_MODULE_B"][0]
-
-    @property
-    def bms_cell_temp_b2(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_TEMPERATURES_MODULE_B" in self._raw["BMS"]:
-            if len(self._raw["BMS"]["CELL_TEMPERATURES_MODULE_B"]) > 1:
-                return self._raw["BMS"]["CELL_TEMPERATURES_MODULE_B"][1]
-
-    @property
-    def bms_cell_temp_b3(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_TEMPERATURES_MODULE_B" in self._raw["BMS"]:
-            if len(self._raw["BMS"]["CELL_TEMPERATURES_MODULE_B"]) > 2:
-                return self._raw["BMS"]["CELL_TEMPERATURES_MODULE_B"][2]
-
-    @property
-    def bms_cell_temp_b4(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_TEMPERATURES_MODULE_B" in self._raw["BMS"]:
-            if len(self._raw["BMS"]["CELL_TEMPERATURES_MODULE_B"]) > 3:
-                return self._raw["BMS"]["CELL_TEMPERATURES_MODULE_B"][3]
-
-    @property
-    def bms_cell_temp_b5(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_TEMPERATURES_MODULE_B" in self._raw["BMS"]:
-            if len(self._raw["BMS"]["CELL_TEMPERATURES_MODULE_B"]) > 4:
-                return self._raw["BMS"]["CELL_TEMPERATURES_MODULE_B"][4]
-
-    @property
-    def bms_cell_temp_b6(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_TEMPERATURES_MODULE_B" in self._raw["BMS"]:
-            if len(self._raw["BMS"]["CELL_TEMPERATURES_MODULE_B"]) > 5:
-                return self._raw["BMS"]["CELL_TEMPERATURES_MODULE_B"][5]
-
-    @property
-    def bms_cell_temp_c1(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_TEMPERATURES_MODULE_C" in self._raw["BMS"]:
-            if len(self._raw["BMS"]["CELL_TEMPERATURES_MODULE_C"]) > 0:
-                return self._raw["BMS"]["CELL_TEMPERATURES_MODULE_C"][0]
-
-    @property
-    def bms_cell_temp_c2(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_TEMPERATURES_MODULE_C" in self._raw["BMS"]:
-            if len(self._raw["BMS"]["CELL_TEMPERATURES_MODULE_C"]) > 1:
-                return self._raw["BMS"]["CELL_TEMPERATURES_MODULE_C"][1]
-
-    @property
-    def bms_cell_temp_c3(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_TEMPERATURES_MODULE_C" in self._raw["BMS"]:
-            if len(self._raw["BMS"]["CELL_TEMPERATURES_MODULE_C"]) > 2:
-                return self._raw["BMS"]["CELL_TEMPERATURES_MODULE_C"][2]
-
-    @property
-    def bms_cell_temp_c4(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_TEMPERATURES_MODULE_C" in self._raw["BMS"]:
-            if len(self._raw["BMS"]["CELL_TEMPERATURES_MODULE_C"]) > 3:
-                return self._raw["BMS"]["CELL_TEMPERATURES_MODULE_C"][3]
-
-    @property
-    def bms_cell_temp_c5(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_TEMPERATURES_MODULE_C" in self._raw["BMS"]:
-            if len(self._raw["BMS"]["CELL_TEMPERATURES_MODULE_C"]) > 4:
-                return self._raw["BMS"]["CELL_TEMPERATURES_MODULE_C"][4]
-
-    @property
-    def bms_cell_temp_c6(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_TEMPERATURES_MODULE_C" in self._raw["BMS"]:
-            if len(self._raw["BMS"]["CELL_TEMPERATURES_MODULE_C"]) > 5:
-                return self._raw["BMS"]["CELL_TEMPERATURES_MODULE_C"][5]
-
-    @property
-    def bms_cell_temp_d1(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_TEMPERATURES_MODULE_D" in self._raw["BMS"]:
-            if len(self._raw["BMS"]["CELL_TEMPERATURES_MODULE_D"]) > 0:
-                return self._raw["BMS"]["CELL_TEMPERATURES_MODULE_D"][0]
-
-    @property
-    def bms_cell_temp_d2(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_TEMPERATURES_MODULE_D" in self._raw["BMS"]:
-            if len(self._raw["BMS"]["CELL_TEMPERATURES_MODULE_D"]) > 1:
-                return self._raw["BMS"]["CELL_TEMPERATURES_MODULE_D"][1]
-
-    @property
-    def bms_cell_temp_d3(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_TEMPERATURES_MODULE_D" in self._raw["BMS"]:
-            if len(self._raw["BMS"]["CELL_TEMPERATURES_MODULE_D"]) > 2:
-                return self._raw["BMS"]["CELL_TEMPERATURES_MODULE_D"][2]
-
-    @property
-    def bms_cell_temp_d4(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_TEMPERATURES_MODULE_D" in self._raw["BMS"]:
-            if len(self._raw["BMS"]["CELL_TEMPERATURES_MODULE_D"]) > 3:
-                return self._raw["BMS"]["CELL_TEMPERATURES_MODULE_D"][3]
-
-    @property
-    def bms_cell_temp_d5(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_TEMPERATURES_MODULE_D" in self._raw["BMS"]:
-            if len(self._raw["BMS"]["CELL_TEMPERATURES_MODULE_D"]) > 4:
-                return self._raw["BMS"]["CELL_TEMPERATURES_MODULE_D"][4]
-
-    @property
-    def bms_cell_temp_d6(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_TEMPERATURES_MODULE_D" in self._raw["BMS"]:
-            if len(self._raw["BMS"]["CELL_TEMPERATURES_MODULE_D"]) > 5:
-                return self._raw["BMS"]["CELL_TEMPERATURES_MODULE_D"][5]
-
-    @property
-    def bms_cell_volt_a1(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_A" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_A"][0]
-
-    @property
-    def bms_cell_volt_a2(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_A" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_A"][1]
-
-    @property
-    def bms_cell_volt_a3(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_A" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_A"][2]
-
-    @property
-    def bms_cell_volt_a4(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_A" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_A"][3]
-
-    @property
-    def bms_cell_volt_a5(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_A" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_A"][4]
-
-    @property
-    def bms_cell_volt_a6(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_A" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_A"][5]
-
-    @property
-    def bms_cell_volt_a7(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_A" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_A"][6]
-
-    @property
-    def bms_cell_volt_a8(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_A" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_A"][7]
-
-    @property
-    def bms_cell_volt_a9(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_A" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_A"][8]
-
-    @property
-    def bms_cell_volt_a10(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_A" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_A"][9]
-
-    @property
-    def bms_cell_volt_a11(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_A" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_A"][10]
-
-    @property
-    def bms_cell_volt_a12(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_A" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_A"][11]
-
-    @property
-    def bms_cell_volt_a13(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_A" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_A"][12]
-
-    @property
-    def bms_cell_volt_a14(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_A" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_A"][13]
-
-    @property
-    def bms_cell_volt_a15(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_A" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_A"][14]
-
-    @property
-    def bms_cell_volt_a16(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_A" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_A"][15]
-
-    @property
-    def bms_cell_volt_b1(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_B" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_B"][0]
-
-    @property
-    def bms_cell_volt_b2(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_B" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_B"][1]
-
-    @property
-    def bms_cell_volt_b3(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_B" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_B"][2]
-
-    @property
-    def bms_cell_volt_b4(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_B" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_B"][3]
-
-    @property
-    def bms_cell_volt_b5(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_B" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_B"][4]
-
-    @property
-    def bms_cell_volt_b6(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_B" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_B"][5]
-
-    @property
-    def bms_cell_volt_b7(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_B" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_B"][6]
-
-    @property
-    def bms_cell_volt_b8(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_B" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_B"][7]
-
-    @property
-    def bms_cell_volt_b9(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_B" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_B"][8]
-
-    @property
-    def bms_cell_volt_b10(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_B" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_B"][9]
-
-    @property
-    def bms_cell_volt_b11(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_B" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_B"][10]
-
-    @property
-    def bms_cell_volt_b12(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_B" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_B"][11]
-
-    @property
-    def bms_cell_volt_b13(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_B" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_B"][12]
-
-    @property
-    def bms_cell_volt_b14(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_B" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_B"][13]
-
-    @property
-    def bms_cell_volt_b15(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_B" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_B"][14]
-
-    @property
-    def bms_cell_volt_b16(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_B" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_B"][15]
-
-    @property
-    def bms_cell_volt_c1(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_C" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_C"][0]
-
-    @property
-    def bms_cell_volt_c2(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_C" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_C"][1]
-
-    @property
-    def bms_cell_volt_c3(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_C" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_C"][2]
-
-    @property
-    def bms_cell_volt_c4(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_C" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_C"][3]
-
-    @property
-    def bms_cell_volt_c5(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_C" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_C"][4]
-
-    @property
-    def bms_cell_volt_c6(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_C" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_C"][5]
-
-    @property
-    def bms_cell_volt_c7(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_C" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_C"][6]
-
-    @property
-    def bms_cell_volt_c8(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_C" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_C"][7]
-
-    @property
-    def bms_cell_volt_c9(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_C" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_C"][8]
-
-    @property
-    def bms_cell_volt_c10(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_C" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_C"][9]
-
-    @property
-    def bms_cell_volt_c11(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_C" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_C"][10]
-
-    @property
-    def bms_cell_volt_c12(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_C" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_C"][11]
-
-    @property
-    def bms_cell_volt_c13(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_C" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_C"][12]
-
-    @property
-    def bms_cell_volt_c14(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_C" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_C"][13]
-
-    @property
-    def bms_cell_volt_c15(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_C" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_C"][14]
-
-    @property
-    def bms_cell_volt_c16(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_C" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_C"][15]
-
-    @property
-    def bms_cell_volt_d1(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_D" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_D"][0]
-
-    @property
-    def bms_cell_volt_d2(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_D" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_D"][1]
-
-    @property
-    def bms_cell_volt_d3(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_D" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_D"][2]
-
-    @property
-    def bms_cell_volt_d4(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_D" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_D"][3]
-
-    @property
-    def bms_cell_volt_d5(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_D" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_D"][4]
-
-    @property
-    def bms_cell_volt_d6(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_D" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_D"][5]
-
-    @property
-    def bms_cell_volt_d7(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_D" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_D"][6]
-
-    @property
-    def bms_cell_volt_d8(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_D" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_D"][7]
-
-    @property
-    def bms_cell_volt_d9(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_D" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_D"][8]
-
-    @property
-    def bms_cell_volt_d10(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_D" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_D"][9]
-
-    @property
-    def bms_cell_volt_d11(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_D" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_D"][10]
-
-    @property
-    def bms_cell_volt_d12(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_D" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_D"][11]
-
-    @property
-    def bms_cell_volt_d13(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_D" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_D"][12]
-
-    @property
-    def bms_cell_volt_d14(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_D" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_D"][13]
-
-    @property
-    def bms_cell_volt_d15(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_D" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_D"][14]
-
-    @property
-    def bms_cell_volt_d16(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CELL_VOLTAGES_MODULE_D" in self._raw["BMS"]:
-            return self._raw["BMS"]["CELL_VOLTAGES_MODULE_D"][15]
-
-    @property
-    def bms_soc_a(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "SOC" in self._raw["BMS"] and (
-                self.number_of_configured_bms_modules > 0 or len(self._raw["BMS"]["SOC"]) > 0):
-            return self._raw["BMS"]["SOC"][0]
-
-    @property
-    def bms_soc_b(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "SOC" in self._raw["BMS"] and (
-                self.number_of_configured_bms_modules > 1 or len(self._raw["BMS"]["SOC"]) > 1):
-            return self._raw["BMS"]["SOC"][1]
-
-    @property
-    def bms_soc_c(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "SOC" in self._raw["BMS"] and (
-                self.number_of_configured_bms_modules > 2 or len(self._raw["BMS"]["SOC"]) > 2):
-            return self._raw["BMS"]["SOC"][2]
-
-    @property
-    def bms_soc_d(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "SOC" in self._raw["BMS"] and (
-                self.number_of_configured_bms_modules > 3 or len(self._raw["BMS"]["SOC"]) > 3):
-            return self._raw["BMS"]["SOC"][3]
-
-    @property
-    def bms_soh_a(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "SOH" in self._raw["BMS"] and (
-                self.number_of_configured_bms_modules > 0 or len(self._raw["BMS"]["SOH"]) > 0):
-            return self._raw["BMS"]["SOH"][0]
-
-    @property
-    def bms_soh_b(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "SOH" in self._raw["BMS"] and (
-                self.number_of_configured_bms_modules > 1 or len(self._raw["BMS"]["SOH"]) > 1):
-            return self._raw["BMS"]["SOH"][1]
-
-    @property
-    def bms_soh_c(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "SOH" in self._raw["BMS"] and (
-                self.number_of_configured_bms_modules > 2 or len(self._raw["BMS"]["SOH"]) > 2):
-            return self._raw["BMS"]["SOH"][2]
-
-    @property
-    def bms_soh_d(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "SOH" in self._raw["BMS"] and (
-                self.number_of_configured_bms_modules > 3 or len(self._raw["BMS"]["SOH"]) > 3):
-            return self._raw["BMS"]["SOH"][3]
-
-    @property
-    def bms_voltage_a(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "VOLTAGE" in self._raw["BMS"] and (
-                self.number_of_configured_bms_modules > 0 or len(self._raw["BMS"]["VOLTAGE"]) > 0):
-            return self._raw["BMS"]["VOLTAGE"][0]
-
-    @property
-    def bms_voltage_b(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "VOLTAGE" in self._raw["BMS"] and (
-                self.number_of_configured_bms_modules > 1 or len(self._raw["BMS"]["VOLTAGE"]) > 1):
-            return self._raw["BMS"]["VOLTAGE"][1]
-
-    @property
-    def bms_voltage_c(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "VOLTAGE" in self._raw["BMS"] and (
-                self.number_of_configured_bms_modules > 2 or len(self._raw["BMS"]["VOLTAGE"]) > 2):
-            return self._raw["BMS"]["VOLTAGE"][2]
-
-    @property
-    def bms_voltage_d(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "VOLTAGE" in self._raw["BMS"] and (
-                self.number_of_configured_bms_modules > 3 or len(self._raw["BMS"]["VOLTAGE"]) > 3):
-            return self._raw["BMS"]["VOLTAGE"][3]
-
-    @property
-    def bms_current_a(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CURRENT" in self._raw["BMS"] and (
-                self.number_of_configured_bms_modules > 0 or len(self._raw["BMS"]["CURRENT"]) > 0):
-            return self._raw["BMS"]["CURRENT"][0]
-
-    @property
-    def bms_current_b(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CURRENT" in self._raw["BMS"] and (
-                self.number_of_configured_bms_modules > 1 or len(self._raw["BMS"]["CURRENT"]) > 1):
-            return self._raw["BMS"]["CURRENT"][1]
-
-    @property
-    def bms_current_c(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CURRENT" in self._raw["BMS"] and (
-                self.number_of_configured_bms_modules > 2 or len(self._raw["BMS"]["CURRENT"]) > 2):
-            return self._raw["BMS"]["CURRENT"][2]
-
-    @property
-    def bms_current_d(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CURRENT" in self._raw["BMS"] and (
-                self.number_of_configured_bms_modules > 3 or len(self._raw["BMS"]["CURRENT"]) > 3):
-            return self._raw["BMS"]["CURRENT"][3]
-
-    @property
-    def bms_cycles_a(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CYCLES" in self._raw["BMS"] and (
-                self.number_of_configured_bms_modules > 0 or len(self._raw["BMS"]["CYCLES"]) > 0):
-            return self._raw["BMS"]["CYCLES"][0]
-
-    @property
-    def bms_cycles_b(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CYCLES" in self._raw["BMS"] and (
-                self.number_of_configured_bms_modules > 1 or len(self._raw["BMS"]["CYCLES"]) > 1):
-            return self._raw["BMS"]["CYCLES"][1]
-
-    @property
-    def bms_cycles_c(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CYCLES" in self._raw["BMS"] and (
-                self.number_of_configured_bms_modules > 2 or len(self._raw["BMS"]["CYCLES"]) > 2):
-            return self._raw["BMS"]["CYCLES"][2]
-
-    @property
-    def bms_cycles_d(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "CYCLES" in self._raw["BMS"] and (
-                self.number_of_configured_bms_modules > 3 or len(self._raw["BMS"]["CYCLES"]) > 3):
-            return self._raw["BMS"]["CYCLES"][3]
-
-    @property
-    def bms_fw_a(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "FW" in self._raw["BMS"] and (
-                self.number_of_configured_bms_modules > 0 or len(self._raw["BMS"]["FW"]) > 0):
-            return self._raw["BMS"]["FW"][0]
+                SENEC_SECTION_STATISTIC in self._raw and \
+                "LIVE_GRID_IMPORT" in self._raw[SENEC_SECTION_STATISTIC]:
+            return self._raw[SENEC_SECTION_STATISTIC]["LIVE_GRID_IMPORT"]
 
-    @property
-    def bms_fw_b(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "FW" in self._raw["BMS"] and (
-                self.number_of_configured_bms_modules > 1 or len(self._raw["BMS"]["FW"]) > 1):
-            return self._raw["BMS"]["FW"][1]
+    def is_battery_empty(self) -> bool:
+        # 15: "BATTERY EMPTY",
+        if self._raw is not None and SENEC_SECTION_ENERGY in self._raw:
+            bat_state_is_empty = self._raw[SENEC_SECTION_ENERGY]["STAT_STATE"] == 15
+            bat_percent_is_zero = self._raw[SENEC_SECTION_ENERGY]["GUI_BAT_DATA_FUEL_CHARGE"] == 0
+            return bat_state_is_empty or bat_percent_is_zero
 
-    @property
-    def bms_fw_c(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "FW" in self._raw["BMS"] and (
-                self.number_of_configured_bms_modules > 2 or len(self._raw["BMS"]["FW"]) > 2):
-            return self._raw["BMS"]["FW"][2]
+    def is_system_state_charging(self) -> bool:
+        if self._raw is not None and SENEC_SECTION_ENERGY in self._raw:
+            return self._raw[SENEC_SECTION_ENERGY]["STAT_STATE"] in SYSTEM_STATUS_CHARGE
 
-    @property
-    def bms_fw_d(self) -> float:
-        if self._raw is not None and "BMS" in self._raw and "FW" in self._raw["BMS"] and (
-                self.number_of_configured_bms_modules > 3 or len(self._raw["BMS"]["FW"]) > 3):
-            return self._raw["BMS"]["FW"][3]
+    def is_system_state_discharging(self) -> bool:
+        if self._raw is not None and SENEC_SECTION_ENERGY in self._raw:
+            return self._raw[SENEC_SECTION_ENERGY]["STAT_STATE"] in SYSTEM_STATUS_DISCHARGE
 
     @property
     def wallbox_1_state(self) -> str:
@@ -2061,60 +1644,6 @@ class SenecLocal:
                          self._raw[SENEC_SECTION_PM1OBJ1]["U_AC"][2]
             return total
 
-    @property
-    def wallbox_1_power_alt(self) -> float:
-        """
-        Wallbox Total Charging Power (W)
-        """
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "APPARENT_CHARGING_POWER" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["APPARENT_CHARGING_POWER"][0]
-
-    @property
-    def wallbox_1_ev_connected(self) -> bool:
-        """
-        Wallbox EV Connected
-        """
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "EV_CONNECTED" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["EV_CONNECTED"][0]
-
-    @property
-    def wallbox_1_energy(self) -> float:
-        """
-        Wallbox Total Energy
-        """
-        if self._raw is not None and SENEC_SECTION_STATISTIC in self._raw and "LIVE_WB_ENERGY" in self._raw[SENEC_SECTION_STATISTIC]:
-            return self._raw[SENEC_SECTION_STATISTIC]["LIVE_WB_ENERGY"][0]
-
-    @property
-    def wallbox_1_l1_used(self) -> bool:
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "L1_USED" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["L1_USED"][0] == 1
-
-    @property
-    def wallbox_1_l2_used(self) -> bool:
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "L1_USED" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["L2_USED"][0] == 1
-
-    @property
-    def wallbox_1_l3_used(self) -> bool:
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "L1_USED" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["L3_USED"][0] == 1
-
-    @property
-    def wallbox_1_l1_charging_current(self) -> float:
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "L1_CHARGING_CURRENT" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["L1_CHARGING_CURRENT"][0]
-
-    @property
-    def wallbox_1_l2_charging_current(self) -> float:
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "L2_CHARGING_CURRENT" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["L2_CHARGING_CURRENT"][0]
-
-    @property
-    def wallbox_1_l3_charging_current(self) -> float:
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "L3_CHARGING_CURRENT" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["L3_CHARGING_CURRENT"][0]
-
     @property
     def wallbox_1_min_charging_current(self) -> float:
         return self.read_array_data(SENEC_SECTION_WALLBOX, "MIN_CHARGING_CURRENT")[0]
@@ -2153,60 +1682,6 @@ class SenecLocal:
                          self._raw[SENEC_SECTION_PM1OBJ1]["U_AC"][2]
             return total
 
-    @property
-    def wallbox_2_power_alt(self) -> float:
-        """
-        Wallbox Total Charging Power (W)
-        """
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "APPARENT_CHARGING_POWER" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["APPARENT_CHARGING_POWER"][1]
-
-    @property
-    def wallbox_2_ev_connected(self) -> bool:
-        """
-        Wallbox EV Connected
-        """
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "EV_CONNECTED" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["EV_CONNECTED"][1]
-
-    @property
-    def wallbox_2_energy(self) -> float:
-        """
-        Wallbox Total Energy
-        """
-        if self._raw is not None and SENEC_SECTION_STATISTIC in self._raw and "LIVE_WB_ENERGY" in self._raw[SENEC_SECTION_STATISTIC]:
-            return self._raw[SENEC_SECTION_STATISTIC]["LIVE_WB_ENERGY"][1]
-
-    @property
-    def wallbox_2_l1_used(self) -> bool:
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "L1_USED" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["L1_USED"][1] == 1
-
-    @property
-    def wallbox_2_l2_used(self) -> bool:
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "L1_USED" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["L2_USED"][1] == 1
-
-    @property
-    def wallbox_2_l3_used(self) -> bool:
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "L1_USED" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["L3_USED"][1] == 1
-
-    @property
-    def wallbox_2_l1_charging_current(self) -> float:
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "L1_CHARGING_CURRENT" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["L1_CHARGING_CURRENT"][1]
-
-    @property
-    def wallbox_2_l2_charging_current(self) -> float:
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "L2_CHARGING_CURRENT" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["L2_CHARGING_CURRENT"][1]
-
-    @property
-    def wallbox_2_l3_charging_current(self) -> float:
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "L3_CHARGING_CURRENT" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["L3_CHARGING_CURRENT"][1]
-
     @property
     def wallbox_2_min_charging_current(self) -> float:
         return self.read_array_data(SENEC_SECTION_WALLBOX, "MIN_CHARGING_CURRENT")[1]
@@ -2245,60 +1720,6 @@ class SenecLocal:
                          self._raw[SENEC_SECTION_PM1OBJ1]["U_AC"][2]
             return total
 
-    @property
-    def wallbox_3_power_alt(self) -> float:
-        """
-        Wallbox Total Charging Power (W)
-        """
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "APPARENT_CHARGING_POWER" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["APPARENT_CHARGING_POWER"][2]
-
-    @property
-    def wallbox_3_ev_connected(self) -> bool:
-        """
-        Wallbox EV Connected
-        """
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "EV_CONNECTED" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["EV_CONNECTED"][2]
-
-    @property
-    def wallbox_3_energy(self) -> float:
-        """
-        Wallbox Total Energy
-        """
-        if self._raw is not None and SENEC_SECTION_STATISTIC in self._raw and "LIVE_WB_ENERGY" in self._raw[SENEC_SECTION_STATISTIC]:
-            return self._raw[SENEC_SECTION_STATISTIC]["LIVE_WB_ENERGY"][2]
-
-    @property
-    def wallbox_3_l1_used(self) -> bool:
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "L1_USED" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["L1_USED"][2] == 1
-
-    @property
-    def wallbox_3_l2_used(self) -> bool:
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "L1_USED" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["L2_USED"][2] == 1
-
-    @property
-    def wallbox_3_l3_used(self) -> bool:
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "L1_USED" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["L3_USED"][2] == 1
-
-    @property
-    def wallbox_3_l1_charging_current(self) -> float:
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "L1_CHARGING_CURRENT" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["L1_CHARGING_CURRENT"][2]
-
-    @property
-    def wallbox_3_l2_charging_current(self) -> float:
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "L2_CHARGING_CURRENT" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["L2_CHARGING_CURRENT"][2]
-
-    @property
-    def wallbox_3_l3_charging_current(self) -> float:
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "L3_CHARGING_CURRENT" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["L3_CHARGING_CURRENT"][2]
-
     @property
     def wallbox_3_min_charging_current(self) -> float:
         return self.read_array_data(SENEC_SECTION_WALLBOX, "MIN_CHARGING_CURRENT")[2]
@@ -2337,99 +1758,10 @@ class SenecLocal:
                          self._raw[SENEC_SECTION_PM1OBJ1]["U_AC"][2]
             return total
 
-    @property
-    def wallbox_4_power_alt(self) -> float:
-        """
-        Wallbox Total Charging Power (W)
-        """
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "APPARENT_CHARGING_POWER" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["APPARENT_CHARGING_POWER"][3]
-
-    @property
-    def wallbox_4_ev_connected(self) -> bool:
-        """
-        Wallbox EV Connected
-        """
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "EV_CONNECTED" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["EV_CONNECTED"][3]
-
-    @property
-    def wallbox_4_energy(self) -> float:
-        """
-        Wallbox Total Energy
-        """
-        if self._raw is not None and SENEC_SECTION_STATISTIC in self._raw and "LIVE_WB_ENERGY" in self._raw[SENEC_SECTION_STATISTIC]:
-            return self._raw[SENEC_SECTION_STATISTIC]["LIVE_WB_ENERGY"][3]
-
-    @property
-    def wallbox_4_l1_used(self) -> bool:
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "L1_USED" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["L1_USED"][3] == 1
-
-    @property
-    def wallbox_4_l2_used(self) -> bool:
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "L1_USED" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["L2_USED"][3] == 1
-
-    @property
-    def wallbox_4_l3_used(self) -> bool:
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "L1_USED" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["L3_USED"][3] == 1
-
-    @property
-    def wallbox_4_l1_charging_current(self) -> float:
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "L1_CHARGING_CURRENT" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["L1_CHARGING_CURRENT"][3]
-
-    @property
-    def wallbox_4_l2_charging_current(self) -> float:
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "L2_CHARGING_CURRENT" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["L2_CHARGING_CURRENT"][3]
-
-    @property
-    def wallbox_4_l3_charging_current(self) -> float:
-        if self._raw is not None and SENEC_SECTION_WALLBOX in self._raw and "L3_CHARGING_CURRENT" in self._raw[SENEC_SECTION_WALLBOX]:
-            return self._raw[SENEC_SECTION_WALLBOX]["L3_CHARGING_CURRENT"][3]
-
     @property
     def wallbox_4_min_charging_current(self) -> float:
         return self.read_array_data(SENEC_SECTION_WALLBOX, "MIN_CHARGING_CURRENT")[3]
 
-    @property
-    def fan_inv_lv(self) -> bool:
-        if self._raw is not None and SENEC_SECTION_FAN_SPEED in self._raw and "INV_LV" in self._raw[SENEC_SECTION_FAN_SPEED]:
-            return self._raw[SENEC_SECTION_FAN_SPEED]["INV_LV"] > 0
-
-    @property
-    def fan_inv_hv(self) -> bool:
-        if self._raw is not None and SENEC_SECTION_FAN_SPEED in self._raw and "INV_HV" in self._raw[SENEC_SECTION_FAN_SPEED]:
-            return self._raw[SENEC_SECTION_FAN_SPEED]["INV_HV"] > 0
-
-    @property
-    def spare_capacity(self) -> int:
-        if self._raw is not None and SENEC_SECTION_BAT1 in self._raw and "SPARE_CAPACITY" in self._raw[SENEC_SECTION_BAT1]:
-            return self._raw[SENEC_SECTION_BAT1]["SPARE_CAPACITY"]
-
-    @property
-    def sockets_already_switched(self) -> [int]:
-        if self._raw is not None and SENEC_SECTION_SOCKETS in self._raw and "ALREADY_SWITCHED" in self._raw[SENEC_SECTION_SOCKETS]:
-            return self._raw[SENEC_SECTION_SOCKETS]["ALREADY_SWITCHED"]
-
-    @property
-    def sockets_power_on(self) -> [float]:
-        if self._raw is not None and SENEC_SECTION_SOCKETS in self._raw and "POWER_ON" in self._raw[SENEC_SECTION_SOCKETS]:
-            return self._raw[SENEC_SECTION_SOCKETS]["POWER_ON"]
-
-    @property
-    def sockets_priority(self) -> [float]:
-        if self._raw is not None and SENEC_SECTION_SOCKETS in self._raw and "PRIORITY" in self._raw[SENEC_SECTION_SOCKETS]:
-            return self._raw[SENEC_SECTION_SOCKETS]["PRIORITY"]
-
-    @property
-    def sockets_time_rem(self) -> [float]:
-        if self._raw is not None and SENEC_SECTION_SOCKETS in self._raw and "TIME_REM" in self._raw[SENEC_SECTION_SOCKETS]:
-            return self._raw[SENEC_SECTION_SOCKETS]["TIME_REM"]
-
     @property
     def wallbox_allow_intercharge(self) -> bool:
         # please note this is not ARRAY data - so we code it here again…
@@ -2463,9 +1795,11 @@ class SenecLocal:
                 post_data = {}
                 if (value):
                     self._raw[SENEC_SECTION_WALLBOX]["ALLOW_INTERCHARGE"] = 1
+                    self._mark_lala_field_changed(SENEC_SECTION_WALLBOX, "ALLOW_INTERCHARGE")
                     post_data = {SENEC_SECTION_WALLBOX: {"ALLOW_INTERCHARGE": "u8_01"}}
                 else:
                     self._raw[SENEC_SECTION_WALLBOX]["ALLOW_INTERCHARGE"] = 0
+                    self._mark_lala_field_changed(SENEC_SECTION_WALLBOX, "ALLOW_INTERCHARGE")
                     post_data = {SENEC_SECTION_WALLBOX: {"ALLOW_INTERCHARGE": "u8_00"}}
 
                 # 2026/01/17: WHEN we set the allow_intercharge flag locally ON at the senec system, then IMHO
@@ -2801,12 +2135,18 @@ class SenecLocal:
         if section_key not in self._raw or value_key not in self._raw[section_key]:
             _LOGGER.warning(f"Section '{section_key}' or value key '{value_key}' not found in raw data: {self._raw.keys()}")
         else:
+            # numeric arrays are typed (array('f') or array('Q')) - so we must provide the matching type
+            if data_type == "fl":
+                value = float(value)
+            elif data_type in ("u1", "u8"):
+                value = int(value)
             self._OVERWRITES[section_key + "_" + value_key].update({"VALUE": self._raw[section_key][value_key]})
             self._OVERWRITES[section_key + "_" + value_key]["VALUE"][pos] = value
             self._OVERWRITES[section_key + "_" + value_key]["TS"] = time()
 
             value_data = [""] * array_length
             self._raw[section_key][value_key][pos] = value
+            self._mark_lala_field_changed(section_key, value_key)
             if data_type == "u1":
                 value_data[pos] = "u1_" + util.get_as_hex(int(value), 4)
             elif data_type == "u8":
@@ -3187,45 +2527,21 @@ def app_has_dict_timeseries_with_values(a_dict:dict, ts_key_name:str="timeSeries
         return False
     return True
 
-def app_summ_total_dict_values(src_dict, dest_dict, ts_key_name:str="timeSeries"):
-    """Add corresponding values from two measurement dictionaries"""
-    #src_dict = app_aggregate_timeseries_data_if_needed(src_dict)
-
-    # Get the value arrays from both dictionaries
-    src_values = src_dict[ts_key_name][0]["measurements"]["values"]
-    dest_values = dest_dict[ts_key_name][0]["measurements"]["values"]
-
-    # Add corresponding values together
-    summed_values = [src_val + dest_val for src_val, dest_val in zip(src_values, dest_values)]
-
-    # Create a result dictionary with the structure of the first one
-    dest_dict[ts_key_name][0]["measurements"]["values"] = summed_values
-    return dest_dict
-
-def app_aggregate_timeseries_data_if_needed(data, ts_key_name:str="timeSeries"):
-    if data is None or not data[ts_key_name] or len(data[ts_key_name]) == 1:
-        return data
-
-    first_date = data[ts_key_name][0]['date']
-    total_duration = 0
-    total_values = [0] * len(data["measurements"])
-
-    for ts in data[ts_key_name]:
-        total_duration += ts["measurements"]["durationInSeconds"]
-        values = ts["measurements"]["values"]
-        for i in range(len(values)):
-            total_values[i] += values[i]
+def app_extract_total_measurement(src_dict, measurement:str, ts_key_name:str="timeSeries", dest_ts_key_name:str="timeseries"):
+    """Single measurement (column) of a measurement dictionary - in the structure of the wallbox measurements"""
+    if src_dict is None or measurement not in src_dict.get("measurements", []):
+        return None
 
+    index = src_dict["measurements"].index(measurement)
     return {
-        "measurements": data["measurements"],
-        "totals": data["totals"] if "totals" in data else {},
-        ts_key_name: [{
-            "date": first_date,
+        "measurements": [measurement],
+        dest_ts_key_name: [{
+            "date": ts.get("date"),
             "measurements": {
-                "durationInSeconds": total_duration,
-                "values": total_values
+                "durationInSeconds": ts["measurements"].get("durationInSeconds"),
+                "values": [ts["measurements"]["values"][index]]
             }
-        }]
+        } for ts in src_dict[ts_key_name]]
     }
 
 STRFTIME_DATE_FORMAT:Final = '%Y-%m-%dT%H:%M:%SZ'
@@ -3310,6 +2626,22 @@ class SenecOnline:
         else:
             self._INCLUDE_WALLBOX_IN_HOUSE_CONSUMPTION = True
 
+        # max number of concurrent requests to the SENEC cloud
+        if options is not None and options.get(CONF_APP_MAX_PARALLEL_REQUESTS, None) is not None:
+            self._APP_MAX_PARALLEL_REQUESTS = max(1, int(options[CONF_APP_MAX_PARALLEL_REQUESTS]))
+        else:
+            self._APP_MAX_PARALLEL_REQUESTS = DEFAULT_APP_MAX_PARALLEL_REQUESTS
+        # the limit is enforced on the HTTP level (all GET/PATCH & POST requests share it) - so the nested
+        # concurrency (totals in parallel, each with its concurrent backfill requests) can't exceed it
+        self._app_request_semaphore = asyncio.Semaphore(self._APP_MAX_PARALLEL_REQUESTS)
+        self._app_backfill_next_ts = 0
+        # in flight GET requests & the (short living) response cache - both by url
+        self._app_get_in_flight = {}
+        self._app_get_cache = {}
+        self._app_get_cache_generation = 0
+        # url -> (etag, last_modified, body_hash, data) of the last GET response
+        self._app_get_validators = {}
+
         # Variable to save the latest update time for system-details/system_state data…
         self._QUERY_SYSTEM_DETAILS_TS = 0
         self._QUERY_SYSTEM_STATE_TS = 0
@@ -3505,11 +2837,29 @@ class SenecOnline:
             # acces_token files...
             self._app_stored_tokens_location = tokens_location
 
+        # the credentials & the (bulk) totals cache are stored in separate files - the content that has been
+        # written last, so unchanged data will not be written again
+        self._app_stored_token_json = None
+        self._app_stored_totals_json = None
+        self._app_pending_totals = None
+        self._app_totals_write_handle = None
+        self._app_totals_write_task = None
+        # the delayed write (task) & the flush must not write the totals file at the same time
+        self._app_totals_write_lock = asyncio.Lock()
+        # the token file can be written by the background refresh & the (concurrent) update requests
+        self._app_token_write_lock = asyncio.Lock()
+
         self._app_token_object = {}
         self._app_is_authenticated = False
         self._app_next_login_attempt_ts = 0
         self._app_login_backoff_secs = 60
         self._app_token = None
+        # the (epoch) expiry of the current access token - the token will be refreshed in the background
+        # before this time & only one coroutine at a time can verify/refresh it
+        self._app_token_valid_till = 0
+        self._app_token_lock = asyncio.Lock()
+        self._app_token_refresh_handle = None
+        self._app_token_refresh_task = None
         # the '_app_master_plant_id' will be used in any further request to
         # the senec endpoints as part of the URL...
         self._app_master_plant_id = None
@@ -3527,6 +2877,8 @@ class SenecOnline:
         self._app_raw_system_state_obj = None
         self._app_raw_total = None
         self._app_raw_wb_total = [None, None, None, None]
+        # 'True' when the wallbox totals have been taken from the (combined) total response
+        self._app_wb_total_from_total = False
         # for our TOTAL values…
         self._static_TOTAL_SUMS_PREV_YEARS = None
         self._static_TOTAL_SUMS_PREV_MONTHS = None
@@ -3781,61 +3133,64 @@ class SenecOnline:
         try:
             if self._app_is_authenticated:
                 _LOGGER.info("***** app_update(self) ********")
+                # the token must be checked (and refreshed) only once - and not by each of the concurrent
+                # requests below
+                await self.app_verify_token()
+
+                a_system_request = None
                 if self._QUERY_SYSTEM_DETAILS or self._app_master_plant_number_must_be_verified_after_init:
                     # 60min * 60 sec = 3600 sec
                     if self._QUERY_SYSTEM_DETAILS_TS + 3595 < time():
                         # since we also get the case-temp & system-state from the system_details
                         # we call this monster object every time [I dislike this!]
-                        await self.app_get_system_details()
+                        a_system_request = self.app_get_system_details
                     else:
                         # if we do not query the system_details, we might want/must update the
                         # system_state every 10 minutes
                         if self._QUERY_SYSTEM_STATE_TS + 595 < time():
-                            await self.app_get_system_status()
+                            a_system_request = self.app_get_system_status
 
-                await self.app_get_dashboard()
+                # all other requests need the (verified) master plant id - so this must be done first
+                if self._app_master_plant_number_must_be_verified_after_init or self.is_app_master_plant_id_none:
+                    if a_system_request is not None:
+                        await a_system_request()
+                        a_system_request = None
+                    if self.is_app_master_plant_id_none:
+                        await self.app_get_master_plant_id()
+
+                a_requests = [self.app_get_dashboard]
+                if a_system_request is not None:
+                    a_requests.append(a_system_request)
 
                 # we MUST QUERY possible WB-DATA BEFORE we _QUERY_TOTALS (since
-                # we need the wallbox UUID!)
-                if self._QUERY_WALLBOX or self.is_integration_startup_phase:
-                    await self.app_update_all_wallboxes()
-
-                if self._QUERY_TOTALS:
-                    # only request the totals at min update of 15 minutes
-                    # 15min * 60 sec = 900 sec - 5sec
-                    if self._QUERY_TOTALS_TS + 895 < time():
-                        the_wb_ids = None
-                        the_wb_uuids = None
-                        if self._INCLUDE_WALLBOX_IN_HOUSE_CONSUMPTION and self._app_wallbox_num_max > 0:
-                            the_wb_ids = ",".join(str(i) for i in range(1, self._app_wallbox_num_max + 1))
-                            the_wb_uuids = ",".join(
-                                self._app_get_wallbox_uuid(idx) or str(idx + 1)
-                                for idx in range(self._app_wallbox_num_max)
-                            )
-
-                        await self.app_update_total(wb_ids=the_wb_ids, wb_uuids=the_wb_uuids)
-                        if self._QUERY_WALLBOX:
-                            await self.app_update_total_all_wallboxes()
+                # we need the wallbox UUID!) - so wallbox & totals are one chain
+                a_query_wallbox = self._QUERY_WALLBOX or self.is_integration_startup_phase
+                # only request the totals at min update of 15 minutes
+                # 15min * 60 sec = 900 sec - 5sec
+                a_query_totals = self._QUERY_TOTALS and self._QUERY_TOTALS_TS + 895 < time()
+                if a_query_wallbox or a_query_totals:
+                    a_requests.append(partial(self._app_update_wallboxes_and_totals, a_query_wallbox, a_query_totals))
 
                 if self._QUERY_SPARE_CAPACITY:
                     # 1 day = 24 h = 24 * 60 min = 24 * 60 * 60 sec = 86400 sec
                     # 2025/06/19 - changed to 6h… = 86400/4 = 21600
                     if self._QUERY_SPARE_CAPACITY_TS + 21595 < time():
-                        await self.web_update_spare_capacity()
+                        a_requests.append(self.web_update_spare_capacity)
 
                 if self._QUERY_PEAK_SHAVING:
                     # 1 day = 24 h = 24 * 60 min = 24 * 60 * 60 sec = 86400 sec
                     if self._QUERY_PEAK_SHAVING_TS + 86395 < time():
-                        await self.web_update_peak_shaving()
+                        a_requests.append(self.web_update_peak_shaving)
 
                 if self.SGREADY_SUPPORTED:
                     # 6h = 6 * 60 min = 6 * 60 * 60 sec = 21600 sec
                     if self._QUERY_SGREADY_STATE_TS + 21595 < time():
-                        await self.web_update_sgready_state()
+                        a_requests.append(self.web_update_sgready_state)
                     # 1 day = 24 h = 24 * 60 min = 24 * 60 * 60 sec = 86400 sec
                     if self._QUERY_SGREADY_CONF_TS + 86395 < time():
-                        await self.web_update_sgready_conf()
+                        a_requests.append(self.web_update_sgready_conf)
 
+                await self._app_run_requests(a_requests)
                 return True
             else:
                 if self._app_next_login_attempt_ts <= time():
@@ -3851,6 +3206,49 @@ class SenecOnline:
             _LOGGER.warning(f"app_update() - Exception: {type(exc).__name__} - {exc} -> stack trace:\n{stack_trace_str}")
         return False
 
+    async def _app_update_wallboxes_and_totals(self, query_wallbox: bool, query_totals: bool):
+        if query_wallbox:
+            await self.app_update_all_wallboxes()
+
+        if query_totals:
+            the_wb_ids = None
+            the_wb_uuids = None
+            if self._INCLUDE_WALLBOX_IN_HOUSE_CONSUMPTION and self._app_wallbox_num_max > 0:
+                the_wb_ids = ",".join(str(i) for i in range(1, self._app_wallbox_num_max + 1))
+                the_wb_uuids = ",".join(
+                    self._app_get_wallbox_uuid(idx) or str(idx + 1)
+                    for idx in range(self._app_wallbox_num_max)
+                )
+
+            await self.app_update_total(wb_ids=the_wb_ids, wb_uuids=the_wb_uuids)
+            if self._QUERY_WALLBOX:
+                await self.app_update_total_all_wallboxes()
+
+    async def _app_run_requests(self, requests: list):
+        # the requests are independent of each other - so they can run concurrently (the number of the HTTP
+        # requests in flight is limited by the '_app_request_semaphore')
+        if self._APP_MAX_PARALLEL_REQUESTS <= 1 or len(requests) <= 1:
+            for a_request in requests:
+                await a_request()
+            return
+
+        results = await asyncio.gather(*(a_request() for a_request in requests), return_exceptions=True)
+        a_first_error = None
+        for a_request, a_result in zip(requests, results):
+            if isinstance(a_result, BaseException):
+                if isinstance(a_result, asyncio.CancelledError):
+                    raise a_result
+                if a_first_error is None:
+                    a_first_error = a_result
+                else:
+                    a_name = getattr(a_request, "__name__", None) or getattr(getattr(a_request, "func", None), "__name__", str(a_request))
+                    _LOGGER.warning(f"_app_run_requests(): '{a_name}' - Exception: {type(a_result).__name__} - {a_result}")
+
+        # like the sequential mode: the (first) failure will be reported to the caller - the other requests
+        # have been completed anyhow
+        if a_first_error is not None:
+            raise a_first_error
+
     async def web_update(self):
         if self.web_totp_required:
             _LOGGER.info("***** web_update(self) ********")
@@ -4165,15 +3563,15 @@ class SenecOnline:
             # we have to follow the redirect…
             async with self.web_session.post(self.TOKEN_URL, data=post_data, headers=req_headers) as res:
                 try:
-                    _LOGGER.debug(f"_initial_token_request_04_get_token(): requesting: {self.TOKEN_URL} with {util.mask_map(post_data)}")
+                    _LOGGER.debug("_initial_token_request_04_get_token(): requesting: %s with %s", self.TOKEN_URL, util.lazy_mask_map(post_data))
                     res.raise_for_status()
                     if res.status in [200, 201, 202, 204, 205]:
                         token_data = await res.json()
                         if "access_token" in token_data:
-                            _LOGGER.debug(f"_initial_token_request_04_get_token(): received token data: {util.mask_map(token_data)}")
+                            _LOGGER.debug("_initial_token_request_04_get_token(): received token data: %s", util.lazy_mask_map(token_data))
                             await self._app_on_new_token_data_received(token_data)
                         else:
-                            _LOGGER.info(f"_initial_token_request_04_get_token(): NO access_token in {util.mask_map(token_data)}")
+                            _LOGGER.info("_initial_token_request_04_get_token(): NO access_token in %s", util.lazy_mask_map(token_data))
                     else:
                         _LOGGER.info(f"_initial_token_request_04_get_token(): unexpected [200] response code: {res.status} - {res}")
 
@@ -4197,15 +3595,15 @@ class SenecOnline:
         # we have to follow the redirect…
         async with self.web_session.post(self.TOKEN_URL, data=post_data, headers=req_headers) as res:
             try:
-                _LOGGER.debug(f"_refresh_token_request(): requesting: {self.TOKEN_URL} with {util.mask_map(post_data)}")
+                _LOGGER.debug("_refresh_token_request(): requesting: %s with %s", self.TOKEN_URL, util.lazy_mask_map(post_data))
                 res.raise_for_status()
                 if res.status in [200, 201, 202, 204, 205]:
                     token_data = await res.json()
                     if "access_token" in token_data:
-                        _LOGGER.debug(f"_refresh_token_request(): received token data: {util.mask_map(token_data)}")
+                        _LOGGER.debug("_refresh_token_request(): received token data: %s", util.lazy_mask_map(token_data))
                         await self._app_on_new_token_data_received(token_data)
                     else:
-                        _LOGGER.info(f"_refresh_token_request(): NO access_token in {util.mask_map(token_data)}")
+                        _LOGGER.info("_refresh_token_request(): NO access_token in %s", util.lazy_mask_map(token_data))
                 else:
                     _LOGGER.info(f"_refresh_token_request(): unexpected [200] response code: {res.status} - {res}")
 
@@ -4216,49 +3614,139 @@ class SenecOnline:
     #####################
     # read/write token_dict from/to filesystem
     #####################
+    @property
+    def _app_stored_totals_location(self) -> str | None:
+        if self._app_stored_tokens_location is None:
+            return None
+        if self._app_stored_tokens_location.endswith("_access_token.txt"):
+            return self._app_stored_tokens_location[:-len("_access_token.txt")] + "_totals.txt"
+        a_base, a_ext = os.path.splitext(self._app_stored_tokens_location)
+        return f"{a_base}_totals{a_ext}"
+
     async def _write_token_to_storage(self, token_dict):
-        """Save token to file for reuse"""
+        """Save token to file for reuse - the totals data (CONF_APP_TOTAL_DATA) will be saved (debounced) to
+        its own file"""
         if self._app_stored_tokens_location is None:
             _LOGGER.info(f"_write_token_to_storage(): self._app_stored_tokens_location is None - NO-ACCESS-TOKEN-FILE will be SAVED")
             return
 
         if token_dict is None:
             _LOGGER.debug(f"_write_token_to_storage() - DELETE")
-        else:
+            self._app_cancel_totals_write()
+            self._app_pending_totals = None
+            self._app_stored_token_json = None
+            self._app_stored_totals_json = None
+            async with self._app_token_write_lock, self._app_totals_write_lock:
+                await asyncio.get_running_loop().run_in_executor(None, self.__delete_token_int)
+            return
+
+        a_totals = token_dict.get(CONF_APP_TOTAL_DATA, None)
+        if a_totals is not None:
+            # the latest totals will be written, when the delay is over
+            self._app_pending_totals = a_totals
+            self._app_schedule_totals_write()
+
+        a_token_json = json.dumps({a_key: a_value for a_key, a_value in token_dict.items() if a_key != CONF_APP_TOTAL_DATA}, separators=(",", ":"))
+        # the lock is FIFO - so the files will be written in the order of the calls
+        async with self._app_token_write_lock:
+            if a_token_json == self._app_stored_token_json:
+                _LOGGER.debug(f"_write_token_to_storage() - token data unchanged")
+                return
+
             _LOGGER.debug(f"_write_token_to_storage() - SAVE")
+            if await self._app_write_storage_file(self._app_stored_tokens_location, a_token_json):
+                self._app_stored_token_json = a_token_json
+
+    def _app_schedule_totals_write(self):
+        if self._app_totals_write_handle is not None:
+            return
+        try:
+            self._app_totals_write_handle = asyncio.get_running_loop().call_later(APP_TOTALS_WRITE_DELAY, self._app_start_totals_write)
+        except RuntimeError:
+            pass
+
+    def _app_start_totals_write(self):
+        # keeping a reference to the task (till it's done)
+        self._app_totals_write_handle = None
+        self._app_totals_write_task = asyncio.get_running_loop().create_task(self._app_write_totals_to_storage())
+
+    def _app_cancel_totals_write(self):
+        if self._app_totals_write_handle is not None:
+            self._app_totals_write_handle.cancel()
+            self._app_totals_write_handle = None
+
+    async def _app_write_totals_to_storage(self):
+        async with self._app_totals_write_lock:
+            # the pending totals are read when we own the lock - so a waiting write will save the latest data
+            a_totals = self._app_pending_totals
+            a_location = self._app_stored_totals_location
+            if a_totals is None or a_location is None:
+                return
+
+            a_totals_json = json.dumps(a_totals, separators=(",", ":"))
+            if a_totals_json == self._app_stored_totals_json:
+                _LOGGER.debug(f"_app_write_totals_to_storage() - totals data unchanged")
+                return
+
+            _LOGGER.debug(f"_app_write_totals_to_storage() - SAVE")
+            if await self._app_write_storage_file(a_location, a_totals_json):
+                self._app_stored_totals_json = a_totals_json
 
+    async def app_flush_storage(self):
+        """Write a pending (debounced) change of the totals data right now - a delayed write that is already
+        running will be completed first"""
+        self._app_cancel_totals_write()
+        await self._app_write_totals_to_storage()
+
+    async def _app_write_storage_file(self, location:str, content:str) -> bool:
         # Check if the parent directory exists
-        directory = os.path.dirname(self._app_stored_tokens_location)
+        directory = os.path.dirname(location)
         if not os.path.exists(directory):
             try:
                 await asyncio.get_running_loop().run_in_executor(None, lambda: os.makedirs(directory, exist_ok=True))
             except OSError as exc:
-                _LOGGER.warning(f"_write_token_to_storage(): could not create directory '{directory}': {type(exc).__name__} - {exc}")
+                _LOGGER.warning(f"_app_write_storage_file(): could not create directory '{directory}': {type(exc).__name__} - {exc}")
 
         # Write the file in executor
         if os.path.exists(directory):
-            await asyncio.get_running_loop().run_in_executor(None, lambda: self.__write_token_int(token_dict))
+            return await asyncio.get_running_loop().run_in_executor(None, lambda: self.__write_file_int(location, content))
+        return False
 
-    def __write_token_int(self, token_dict):
-        """Synchronous method to write the token file, called from executor."""
-        if self._app_stored_tokens_location is None:
-            _LOGGER.info(f"__write_token_int(): self._app_stored_tokens_location is None - NO-ACCESS-TOKEN-FILE will be SAVED")
-            return
+    @staticmethod
+    def __write_file_int(location:str, content:str) -> bool:
+        """Synchronous method to write a storage file (via a temp file & rename), called from executor."""
+        a_tmp_location = None
+        try:
+            # a unique temp file - so concurrent writes of the same file can't use the same temp file
+            a_fd, a_tmp_location = tempfile.mkstemp(prefix=f"{os.path.basename(location)}.", suffix=".tmp", dir=os.path.dirname(location))
+            with os.fdopen(a_fd, "w", encoding="utf-8") as outfile:
+                outfile.write(content)
+                outfile.flush()
+                os.fsync(outfile.fileno())
+            # so there will never be a half written file
+            os.replace(a_tmp_location, location)
+            return True
+        except OSError as exc:
+            _LOGGER.info(f"__write_file_int(): could not write file '{location}': {type(exc).__name__} - {exc}")
+            if a_tmp_location is not None:
+                try:
+                    os.remove(a_tmp_location)
+                except OSError:
+                    pass
+        return False
 
-        if token_dict is None:
+    def __delete_token_int(self):
+        """Synchronous method to delete the token (and totals) file, called from executor."""
+        for a_location in (self._app_stored_tokens_location, self._app_stored_totals_location):
+            if a_location is None:
+                continue
             try:
-                os.remove(self._app_stored_tokens_location)
-                _LOGGER.debug(f"__write_token_int(): Token file deleted: {self._app_stored_tokens_location}")
+                os.remove(a_location)
+                _LOGGER.debug(f"__delete_token_int(): file deleted: {a_location}")
             except FileNotFoundError:
-                _LOGGER.debug(f"__write_token_int(): Token file not found, nothing to delete: {self._app_stored_tokens_location}")
+                _LOGGER.debug(f"__delete_token_int(): file not found, nothing to delete: {a_location}")
             except OSError as exc:
-                _LOGGER.info(f"__write_token_int(): Error deleting token file: {type(exc).__name__} - {exc}")
-        else:
-            try:
-                with open(self._app_stored_tokens_location, "w", encoding="utf-8") as outfile:
-                    json.dump(token_dict, outfile)
-            except OSError as exc:
-                _LOGGER.info(f"__write_token_int(): could not write token file: {type(exc).__name__} - {exc}")
+                _LOGGER.info(f"__delete_token_int(): Error deleting file: {type(exc).__name__} - {exc}")
 
     async def _read_token_from_storage(self):
         """Read saved token from a file"""
@@ -4280,11 +3768,22 @@ class SenecOnline:
 
         if os.path.exists(self._app_stored_tokens_location):
             with open(self._app_stored_tokens_location, encoding="utf-8") as token_file:
-                return json.load(token_file)
+                token_data = json.load(token_file)
+
+            # token files of older versions still include the totals data (they will be split with the next write)
+            if isinstance(token_data, dict) and CONF_APP_TOTAL_DATA not in token_data:
+                a_totals_location = self._app_stored_totals_location
+                if os.path.exists(a_totals_location):
+                    try:
+                        with open(a_totals_location, encoding="utf-8") as totals_file:
+                            token_data[CONF_APP_TOTAL_DATA] = json.load(totals_file)
+                    except ValueError as exc:
+                        # the totals are just a cache - they will be fetched again
+                        _LOGGER.info(f"__read_token_int(): invalid totals file '{a_totals_location}': {type(exc).__name__} - {exc}")
+            return token_data
         else:
             return None
 
-
     #####################
     # helpers to make sure 'access_token' is ready to use
     #####################
@@ -4328,7 +3827,7 @@ class SenecOnline:
             self._app_token_object = stored_data
             if CONF_APP_TOTAL_DATA not in self._app_token_object:
                 # creating an initalized storage…
-                _LOGGER.debug(f"app_has_token(): no '{CONF_APP_TOTAL_DATA}' in _app_token_object: {util.mask_map(self._app_token_object)} - initializing it")
+                _LOGGER.debug("app_has_token(): no '%s' in _app_token_object: %s - initializing it", CONF_APP_TOTAL_DATA, util.lazy_mask_map(self._app_token_object))
                 self._app_token_object[CONF_APP_TOTAL_DATA] = {
                     "years":        self._static_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_YEARS,
                     "years_data":   self._static_TOTAL_SUMS_PREV_YEARS,
@@ -4349,6 +3848,17 @@ class SenecOnline:
         return False
 
     async def app_verify_token(self):
+        # the fast path - the current token is (still) valid
+        if self._app_is_authenticated and time() < self._app_token_valid_till:
+            return
+
+        async with self._app_token_lock:
+            # another request might have refreshed the token while we were waiting
+            if self._app_is_authenticated and time() < self._app_token_valid_till:
+                return
+            await self._app_verify_token_locked()
+
+    async def _app_verify_token_locked(self):
         if self._app_token_object is not None:
             if "expires_at" in self._app_token_object:
                 now = datetime.now(timezone.utc)
@@ -4370,14 +3880,14 @@ class SenecOnline:
             else:
                 can_token_be_restored = await self.app_has_token()
                 if can_token_be_restored and "expires_at" in self._app_token_object:
-                    await self.app_verify_token()
+                    await self._app_verify_token_locked()
                 else:
                     _LOGGER.info(f"app_verify_token(): no 'expires_at' in _app_token_object: '{self._app_token_object}' - need to re-authenticate")
                     await self._initial_token_request_01_start()
         else:
             can_token_be_restored = await self.app_has_token()
             if can_token_be_restored:
-                await self.app_verify_token()
+                await self._app_verify_token_locked()
             else:
                 _LOGGER.info("app_verify_token(): '_app_token_object' is None - need to re-authenticate")
                 await self._initial_token_request_01_start()
@@ -4386,6 +3896,10 @@ class SenecOnline:
         if self._app_token_object is not None and "access_token" in self._app_token_object:
             self._app_token = f"Bearer {self._app_token_object['access_token']}"
             self._app_is_authenticated  = True
+            a_valid_till = self._app_token_object.get("expires_at", 0)
+            if a_valid_till != self._app_token_valid_till or self._app_token_refresh_handle is None:
+                self._app_token_valid_till = a_valid_till
+                self._app_schedule_token_refresh()
             self._app_next_login_attempt_ts = 0
             self._app_login_backoff_secs = 60
             if CONF_APP_SYSTEMID in self._app_token_object and self._app_token_object[CONF_APP_SYSTEMID] is not None:
@@ -4398,18 +3912,146 @@ class SenecOnline:
             _LOGGER.info(f"app_ensure_token(): no valid token data found - need to re-authenticate ?")
             self._app_token = None
             self._app_is_authenticated  = False
+            self.app_cancel_token_refresh()
             self._app_master_plant_id   = None
             self._app_serial_number     = None
             self._app_wallbox_num_max   = 4
             self._app_data_start_ts     = -1
             self._app_data_end_ts       = -1
 
+    def _app_schedule_token_refresh(self):
+        self.app_cancel_token_refresh(reset_valid_till=False)
+        if self._app_token_object is None or "refresh_token" not in self._app_token_object or self._app_token_valid_till <= 0:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        a_delay = max(self._app_token_valid_till - APP_TOKEN_REFRESH_AHEAD - time(), 0)
+        _LOGGER.debug(f"_app_schedule_token_refresh(): access_token will be refreshed in {int(a_delay)} sec")
+        self._app_token_refresh_handle = loop.call_later(a_delay, self._app_start_background_token_refresh)
+
+    def _app_start_background_token_refresh(self):
+        # keeping a reference to the task (till it's done)
+        self._app_token_refresh_handle = None
+        self._app_token_refresh_task = asyncio.get_running_loop().create_task(self._app_background_token_refresh())
+
+    def app_cancel_token_refresh(self, reset_valid_till:bool = True):
+        if self._app_token_refresh_handle is not None:
+            self._app_token_refresh_handle.cancel()
+            self._app_token_refresh_handle = None
+        a_task = self._app_token_refresh_task
+        if a_task is not None:
+            try:
+                a_current_task = asyncio.current_task()
+            except RuntimeError:
+                a_current_task = None
+            # the refresh task itself will (re)schedule the next refresh - it must not cancel itself
+            if a_task is not a_current_task:
+                if not a_task.done():
+                    a_task.cancel()
+                self._app_token_refresh_task = None
+        if reset_valid_till:
+            self._app_token_valid_till = 0
+
+    async def _app_background_token_refresh(self):
+        try:
+            async with self._app_token_lock:
+                a_token_object = self._app_token_object
+                if a_token_object is None or "refresh_token" not in a_token_object:
+                    return
+                # the token might have been refreshed already
+                if time() < self._app_token_valid_till - APP_TOKEN_REFRESH_AHEAD:
+                    return
+                if time() < a_token_object.get("refresh_expires_at", 0):
+                    _LOGGER.debug(f"_app_background_token_refresh(): refreshing access_token [expires in: {int(self._app_token_valid_till - time())} sec]")
+                    await self._refresh_token_request(a_token_object["refresh_token"])
+                else:
+                    _LOGGER.debug(f"_app_background_token_refresh(): refresh_token EXPIRED - the token will be renewed with the next request")
+        except Exception as exc:
+            _LOGGER.info(f"_app_background_token_refresh(): {type(exc).__name__} - {exc}")
+
 
     #####################
     # backend requests from here
     # all token/login stuff should be fine…
     #####################
+
+    async def _app_do_get_requests(self, urls: list) -> list:
+        """GET all urls concurrently (a 'None' url will not be requested) - the results are in the order of
+        the urls. The requests will be started with a min distance of APP_BACKFILL_REQUEST_SPACING seconds (and
+        the '_app_request_semaphore' limits the requests in flight)."""
+        async def a_fetch(a_url):
+            if a_url is None:
+                return None
+            # reserve the next start slot (there is no await between reading & writing the slot)
+            now = monotonic()
+            a_start = max(now, self._app_backfill_next_ts)
+            self._app_backfill_next_ts = a_start + APP_BACKFILL_REQUEST_SPACING
+            if a_start > now:
+                await asyncio.sleep(a_start - now)
+            return await self._app_do_get_request(a_url=a_url)
+
+        results = await asyncio.gather(*(a_fetch(a_url) for a_url in urls), return_exceptions=True)
+        for idx, a_result in enumerate(results):
+            if isinstance(a_result, BaseException):
+                if isinstance(a_result, asyncio.CancelledError):
+                    raise a_result
+                _LOGGER.warning(f"_app_do_get_requests(): {urls[idx]} - Exception: {type(a_result).__name__} - {a_result}")
+                results[idx] = None
+        return results
+
     async def _app_do_get_request(self, a_url:str, do_as_patch:bool = False):
+        if do_as_patch:
+            self._app_invalidate_get_cache()
+            return await self._app_do_get_request_now(a_url, do_as_patch=True)
+
+        a_cached = self._app_get_cache.get(a_url, None)
+        if a_cached is not None and a_cached[0] + APP_GET_CACHE_TTL > monotonic():
+            _LOGGER.debug(f"_app_do_get_request(): using cached response for: {a_url}")
+            return copy.deepcopy(a_cached[1])
+
+        # concurrent callers of the same url will share a single request
+        a_request = self._app_get_in_flight.get(a_url, None)
+        if a_request is None:
+            a_request = asyncio.ensure_future(self._app_do_get_request_shared(a_url))
+            self._app_get_in_flight[a_url] = a_request
+        else:
+            _LOGGER.debug(f"_app_do_get_request(): joining in flight request for: {a_url}")
+
+        # the shared request must not be cancelled, when one of the callers is cancelled - and each caller gets
+        # its own copy (the totals code is modifying the data)
+        return copy.deepcopy(await asyncio.shield(a_request))
+
+    async def _app_do_get_request_shared(self, a_url:str):
+        a_generation = self._app_get_cache_generation
+        try:
+            data = await self._app_do_get_request_now(a_url)
+            # a response that has been requested before a change must not be cached
+            if data is not None and a_generation == self._app_get_cache_generation:
+                now = monotonic()
+                self._app_get_cache = {a_key: a_value for a_key, a_value in self._app_get_cache.items() if a_value[0] + APP_GET_CACHE_TTL > now}
+                self._app_get_cache[a_url] = (now, data)
+            return data
+        finally:
+            if self._app_get_in_flight.get(a_url, None) is asyncio.current_task():
+                del self._app_get_in_flight[a_url]
+
+    def _app_remember_get_validator(self, a_url:str, etag:str, last_modified:str, body_hash:bytes, data):
+        # re-inserted - so the least recently fetched url will be dropped first
+        self._app_get_validators.pop(a_url, None)
+        self._app_get_validators[a_url] = (etag, last_modified, body_hash, data)
+        while len(self._app_get_validators) > APP_GET_VALIDATORS_MAX:
+            del self._app_get_validators[next(iter(self._app_get_validators))]
+
+    def _app_invalidate_get_cache(self):
+        # something will be changed - so all cached (or currently requested) responses might be outdated
+        self._app_get_cache_generation += 1
+        self._app_get_cache.clear()
+        self._app_get_in_flight.clear()
+
+    async def _app_do_get_request_now(self, a_url:str, do_as_patch:bool = False):
         if do_as_patch:
             _LOGGER.debug(f"***** APP-API: _app_do_get(as_patch)_request(self) ********")
         else:
@@ -4418,6 +4060,13 @@ class SenecOnline:
         if self._app_is_authenticated:
             req_headers = self._default_app_headers.copy()
             req_headers["Authorization"] = self._app_token
+            a_validator = None if do_as_patch else self._app_get_validators.get(a_url, None)
+            if a_validator is not None:
+                # conditional request - the server can reply with '304 Not Modified'
+                if a_validator[0] is not None:
+                    req_headers["If-None-Match"] = a_validator[0]
+                if a_validator[1] is not None:
+                    req_headers["If-Modified-Since"] = a_validator[1]
             try:
                 get_or_patch = getattr(self.web_session, "patch" if do_as_patch else "get")
                 if do_as_patch:
@@ -4425,25 +4074,42 @@ class SenecOnline:
                 else:
                     _LOGGER.debug(f"_app_do_get_request(): requesting: {a_url}")
 
-                async with get_or_patch(a_url, headers=req_headers) as res:
+                async with self._app_request_semaphore, get_or_patch(a_url, headers=req_headers) as res:
                     data = None
                     try:
                         res.raise_for_status()
-                        if res.status in [204, 205] or res.content_length == 0:
+                        if res.status == 304 and a_validator is not None:
+                            _LOGGER.debug(f"_app_do_get_request(): {a_url} not modified")
+                            return a_validator[3]
+
+                        elif res.status in [204, 205] or res.content_length == 0:
                             _LOGGER.warning(f"_app_do_get_request(): {a_url} returned an empty response")
                             return None
 
                         elif res.status in [200, 201, 202]:
                             try:
-                                data = await res.json()
-                                _LOGGER.debug(f"_app_do_get_request(): response: {util.mask_map(data)}")
+                                if do_as_patch:
+                                    data = await res.json()
+                                else:
+                                    a_body = await res.read()
+                                    a_hash = hashlib.blake2b(a_body, digest_size=16).digest()
+                                    if a_validator is not None and a_validator[2] == a_hash:
+                                        # same body as last time - no need to parse it again
+                                        _LOGGER.debug(f"_app_do_get_request(): {a_url} response unchanged")
+                                        data = a_validator[3]
+                                    else:
+                                        data = json.loads(a_body)
+                                    self._app_remember_get_validator(a_url, res.headers.get("ETag", None), res.headers.get("Last-Modified", None), a_hash, data)
+                                # the (time series) responses can be large - so they will be dumped as JSON without
+                                # building the complete masked copy first
+                                _LOGGER.debug("_app_do_get_request(): response: %s", util.lazy_mask_map(data, as_json=True))
                                 return data
 
                             except JSONDecodeError as jexc:
                                 _LOGGER.info(f"_app_do_get_request(): JSONDecodeError while 'await res.json()' {jexc}")
                             except Exception as exc:
                                 if data is not None:
-                                    _LOGGER.warning(f"_app_do_get_request(): Error when handling [Response: {res}] - Data: '{util.mask_map(data)}' - [Exception: {exc}]")
+                                    _LOGGER.warning("_app_do_get_request(): Error when handling [Response: %s] - Data: '%s' - [Exception: %s]", res, util.lazy_mask_map(data), exc)
                                 else:
                                     _LOGGER.warning(f"_app_do_get_request(): Error when handling [Response: {res}] - [Exception: {exc}]")
                         else:
@@ -4465,35 +4131,36 @@ class SenecOnline:
 
     async def _app_do_post_request(self, a_url:str,  post_data: dict, read_response: bool = False):
         _LOGGER.debug("***** APP-API: _app_do_post_request(self) ********")
+        self._app_invalidate_get_cache()
         await self.app_verify_token()
         if self._app_is_authenticated:
             req_headers = self._default_app_headers.copy()
             req_headers["Authorization"] = self._app_token
             try:
                 if post_data is not None:
-                    _LOGGER.debug(f"_app_do_post_request(): requesting: {a_url} - with post_data: {util.mask_map(post_data)}")
+                    _LOGGER.debug("_app_do_post_request(): requesting: %s - with post_data: %s", a_url, util.lazy_mask_map(post_data))
                 else:
                     _LOGGER.debug(f"_app_do_post_request(): requesting: {a_url} - with EMPTY post_data")
 
-                async with self.web_session.post(a_url, headers=req_headers, json=post_data) as res:
+                async with self._app_request_semaphore, self.web_session.post(a_url, headers=req_headers, json=post_data) as res:
                     try:
                         res.raise_for_status()
                         if res.status in [200, 201, 202, 204, 205]:
                             if read_response:
                                 try:
                                     data = await res.json()
-                                    _LOGGER.debug(f"_app_do_post_request(): response: {util.mask_map(data)}")
+                                    _LOGGER.debug("_app_do_post_request(): response: %s", util.lazy_mask_map(data))
                                     return data
                                 except JSONDecodeError as jexc:
                                     _LOGGER.info(f"_app_do_post_request(): JSONDecodeError while 'await res.json()' {jexc}")
                                 except Exception as exc:
                                     if data is not None:
-                                        _LOGGER.warning(f"_app_do_post_request(): Error when handling [Response: {res}] - Data: '{util.mask_map(data)}' - [Exception: {exc}]")
+                                        _LOGGER.warning("_app_do_post_request(): Error when handling [Response: %s] - Data: '%s' - [Exception: %s]", res, util.lazy_mask_map(data), exc)
                                     else:
                                         _LOGGER.warning(f"_app_do_post_request(): Error when handling [Response: {res}] - [Exception: {exc}]")
                             else:
                                 if post_data is not None:
-                                    _LOGGER.debug(f"APP-API HTTP:200 for post {util.mask_map(post_data)} to {a_url}")
+                                    _LOGGER.debug("APP-API HTTP:200 for post %s to %s", util.lazy_mask_map(post_data), a_url)
                                 else:
                                     _LOGGER.debug(f"APP-API HTTP:200 for post EMPTY-DATA to {a_url}")
                                 return True
@@ -4983,6 +4650,7 @@ class SenecOnline:
             _LOGGER.warning(f"app_get_data_start_and_end_ts(): CANCEL REQUEST cause self._app_master_plant_id is: '{self._app_master_plant_id}'")
             return None
 
+        self._app_wb_total_from_total = False
         now_utc = datetime.now(timezone.utc)
         now_local =  datetime.now()
         current_year_local = now_local.year
@@ -5000,8 +4668,23 @@ class SenecOnline:
             self._static_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_DAYS   = storage.get("days",       self._static_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_DAYS)
             self._static_TOTAL_SUMS_PREV_DAYS                   = storage.get("days_data",  self._static_TOTAL_SUMS_PREV_DAYS)
 
+        def a_total_url(res_type:str, from_val:str, to_val:str) -> str:
+            if wb_ids is not None or wb_uuids is not None:
+                return self.APP_MEASURE_TOTAL_WITH_WB.format(master_plant_id=self._app_master_plant_id,
+                                                             #wb_ids    =wb_ids,
+                                                             wb_uuid   =wb_uuids,
+                                                             res_type  =res_type,
+                                                             from_val  =quote(from_val, safe=''),
+                                                             to_val    =quote(to_val, safe=''))
+            return self.APP_MEASURE_TOTAL.format(master_plant_id=self._app_master_plant_id,
+                                                 res_type  =res_type,
+                                                 from_val  =quote(from_val, safe=''),
+                                                 to_val    =quote(to_val, safe=''))
+
         # getting PREVIOUS_YEARS - only ONCE
-        if self._static_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_YEARS != current_year_local:
+        a_year_urls = {}
+        fetch_prev_years = self._static_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_YEARS != current_year_local
+        if fetch_prev_years:
             # we MUST delete all our previous collected data, when we switch over to a new year!
             self._static_TOTAL_SUMS_PREV_YEARS = None
             do_persist = True
@@ -5013,85 +4696,64 @@ class SenecOnline:
                 _LOGGER.debug(f"app_update_total(): - data start year is set to {start_year}")
 
             for a_year in range(start_year, current_year_local):
-                _LOGGER.debug(f"app_update_total(): - fetching data for year {a_year}")
-                if wb_ids is not None or wb_uuids is not None:
-                    a_url = self.APP_MEASURE_TOTAL_WITH_WB.format(master_plant_id=self._app_master_plant_id,
-                                                                  #wb_ids    =wb_ids,
-                                                                  wb_uuid   =wb_uuids,
-                                                                  res_type  ="MONTH",
-                                                                  from_val  =quote(app_get_utc_date_start(a_year, 1), safe=''),
-                                                                  to_val    =quote(app_get_utc_date_end(a_year, 12), safe=''))
-
-                else:
-                    a_url = self.APP_MEASURE_TOTAL.format(master_plant_id=self._app_master_plant_id,
-                                                          res_type  ="MONTH",
-                                                          from_val  =quote(app_get_utc_date_start(a_year, 1), safe=''),
-                                                          to_val    =quote(app_get_utc_date_end(a_year, 12), safe=''))
-
-                data = await self._app_do_get_request(a_url=a_url)
-                if data is not None and app_has_dict_timeseries_with_values(data):
-                    data = app_aggregate_timeseries_data_if_needed(data)
-                    _LOGGER.debug(f"app_update_total(): aggregated data for year {a_year} -> {data}")
-                    if self._static_TOTAL_SUMS_PREV_YEARS is None:
-                        self._static_TOTAL_SUMS_PREV_YEARS = data
-                    else:
-                        self._static_TOTAL_SUMS_PREV_YEARS = app_summ_total_dict_values(data, self._static_TOTAL_SUMS_PREV_YEARS)
-
-            self._static_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_YEARS = current_year_local
+                a_year_urls[a_year] = a_total_url("MONTH", app_get_utc_date_start(a_year, 1), app_get_utc_date_end(a_year, 12))
 
         # getting PREVIOUS_MONTH - only ONCE
-        if self._static_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_MONTHS != current_month_local:
+        a_months_url = None
+        fetch_prev_months = self._static_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_MONTHS != current_month_local
+        if fetch_prev_months:
             do_persist = True
             if current_month_local == 1:
                 self._static_TOTAL_SUMS_PREV_MONTHS = None
             else:
-                _LOGGER.debug(f"app_update_total(): - fetching data for year {current_year_local} month 01 - {(current_month_local-1):02d}")
-                if wb_ids is not None or wb_uuids is not None:
-                    a_url = self.APP_MEASURE_TOTAL_WITH_WB.format(master_plant_id=self._app_master_plant_id,
-                                                                  #wb_ids    =wb_ids,
-                                                                  wb_uuid   =wb_uuids,
-                                                                  res_type  ="MONTH",
-                                                                  from_val  =quote(app_get_utc_date_start(current_year_local, 1), safe=''),
-                                                                  to_val    =quote(app_get_utc_date_end(current_year_local, current_month_local - 1), safe=''))
-
-                else:
-                    a_url = self.APP_MEASURE_TOTAL.format(master_plant_id=self._app_master_plant_id,
-                                                          res_type  ="MONTH",
-                                                          from_val  =quote(app_get_utc_date_start(current_year_local, 1), safe=''),
-                                                          to_val    =quote(app_get_utc_date_end(current_year_local, current_month_local - 1), safe=''))
-
-                data = await self._app_do_get_request(a_url=a_url)
-                if data is not None and app_has_dict_timeseries_with_values(data):
-                    self._static_TOTAL_SUMS_PREV_MONTHS = app_aggregate_timeseries_data_if_needed(data)
-                    _LOGGER.debug(f"app_update_total(): aggregated data for year {current_year_local} month 01 - {(current_month_local-1):02d} -> {self._static_TOTAL_SUMS_PREV_MONTHS}")
-
-            self._static_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_MONTHS = current_month_local
+                a_months_url = a_total_url("MONTH", app_get_utc_date_start(current_year_local, 1),
+                                           app_get_utc_date_end(current_year_local, current_month_local - 1))
 
         # getting CURRENT_MONTH - only ONCE
-        if self._static_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_DAYS != current_day_local:
+        a_days_url = None
+        fetch_prev_days = self._static_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_DAYS != current_day_local
+        if fetch_prev_days:
             do_persist = True
             if current_day_local == 1:
                 self._static_TOTAL_SUMS_PREV_DAYS = None
             else:
-                _LOGGER.debug(f"***** APP-API: app_update_total() - fetching data for year {current_year_local} month {current_month_local} - till day: {(current_day_local-1):02d}")
-                if wb_ids is not None or wb_uuids is not None:
-                    a_url = self.APP_MEASURE_TOTAL_WITH_WB.format(master_plant_id=self._app_master_plant_id,
-                                                                  #wb_ids    =wb_ids,
-                                                                  wb_uuid   =wb_uuids,
-                                                                  res_type  ="MONTH",
-                                                                  from_val  =quote(app_get_utc_date_start(current_year_local, current_month_local, 1), safe=''),
-                                                                  to_val    =quote(app_get_utc_date_end(current_year_local, current_month_local, current_day_local - 1), safe=''))
+                a_days_url = a_total_url("MONTH", app_get_utc_date_start(current_year_local, current_month_local, 1),
+                                         app_get_utc_date_end(current_year_local, current_month_local, current_day_local - 1))
 
-                else:
-                    a_url = self.APP_MEASURE_TOTAL.format(master_plant_id=self._app_master_plant_id,
-                                                          res_type  ="MONTH",
-                                                          from_val  =quote(app_get_utc_date_start(current_year_local, current_month_local, 1), safe=''),
-                                                          to_val    =quote(app_get_utc_date_end(current_year_local, current_month_local, current_day_local - 1), safe=''))
+        # getting TODAY
+        a_today_url = a_total_url("DAY", app_get_utc_date_start(current_year_local, current_month_local, current_day_local),
+                                  (now_utc + timedelta(hours=24)).strftime(STRFTIME_DATE_FORMAT))
+
+        # all windows will be fetched concurrently - and merged when all are in
+        _LOGGER.debug(f"app_update_total(): - fetching data for years {list(a_year_urls)} prev_months: {a_months_url is not None} prev_days: {a_days_url is not None}")
+        results = await self._app_do_get_requests([*a_year_urls.values(), a_months_url, a_days_url, a_today_url])
+        months_data, days_data, data = results[-3:]
+
+        # the historic data is kept (and persisted) in the compact columnar structure of MeasurementSeries
+        a_prev_years = None
+        for a_year, a_year_data in zip(a_year_urls, results):
+            if a_year_data is not None and app_has_dict_timeseries_with_values(a_year_data):
+                a_year_series = MeasurementSeries.from_dict(a_year_data)
+                if a_year_series is not None:
+                    a_year_series = a_year_series.aggregated()
+                    _LOGGER.debug(f"app_update_total(): aggregated data for year {a_year} -> {a_year_series}")
+                    a_prev_years = a_year_series if a_prev_years is None else a_prev_years.add(a_year_series)
+        if a_prev_years is not None:
+            self._static_TOTAL_SUMS_PREV_YEARS = a_prev_years.compact()
+        if fetch_prev_years:
+            self._static_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_YEARS = current_year_local
 
-                data = await self._app_do_get_request(a_url=a_url)
-                if data is not None and app_has_dict_timeseries_with_values(data):
-                    self._static_TOTAL_SUMS_PREV_DAYS = app_aggregate_timeseries_data_if_needed(data)
+        a_months_series = MeasurementSeries.from_dict(months_data) if months_data is not None and app_has_dict_timeseries_with_values(months_data) else None
+        if a_months_series is not None:
+            self._static_TOTAL_SUMS_PREV_MONTHS = a_months_series.aggregated().compact()
+            _LOGGER.debug(f"app_update_total(): aggregated data for year {current_year_local} month 01 - {(current_month_local-1):02d} -> {self._static_TOTAL_SUMS_PREV_MONTHS}")
+        if fetch_prev_months:
+            self._static_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_MONTHS = current_month_local
 
+        a_days_series = MeasurementSeries.from_dict(days_data) if days_data is not None and app_has_dict_timeseries_with_values(days_data) else None
+        if a_days_series is not None:
+            self._static_TOTAL_SUMS_PREV_DAYS = a_days_series.aggregated().compact()
+        if fetch_prev_days:
             self._static_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_DAYS = current_day_local
 
         if do_persist:
@@ -5106,35 +4768,26 @@ class SenecOnline:
             }
             await self._app_on_new_token_data_received(self._app_token_object)
 
-        # getting TODAY
-        if wb_ids is not None or wb_uuids is not None:
-            a_url = self.APP_MEASURE_TOTAL_WITH_WB.format(master_plant_id=self._app_master_plant_id,
-                                                          #wb_ids    =wb_ids,
-                                                          wb_uuid   =wb_uuids,
-                                                          res_type  ="DAY",
-                                                          from_val  =quote(app_get_utc_date_start(current_year_local, current_month_local, current_day_local), safe=''),
-                                                          to_val    =quote((now_utc + timedelta(hours=24)).strftime(STRFTIME_DATE_FORMAT), safe=''))
-
-        else:
-            a_url = self.APP_MEASURE_TOTAL.format(master_plant_id=self._app_master_plant_id,
-                                                  res_type  ="DAY",
-                                                  from_val  =quote(app_get_utc_date_start(current_year_local, current_month_local, current_day_local), safe=''),
-                                                  to_val    =quote((now_utc + timedelta(hours=24)).strftime(STRFTIME_DATE_FORMAT), safe=''))
-
-        data = await self._app_do_get_request(a_url=a_url)
-        if data is not None and app_has_dict_timeseries_with_values(data):
-            data = app_aggregate_timeseries_data_if_needed(data)
+        a_series = MeasurementSeries.from_dict(data) if data is not None and app_has_dict_timeseries_with_values(data) else None
+        if a_series is not None:
+            a_series = a_series.aggregated()
             # adding all from the previous years (all till 01.01.THIS YEAR 'minus 1 second')
-            if self._static_TOTAL_SUMS_PREV_YEARS is not None:
-                data = app_summ_total_dict_values(self._static_TOTAL_SUMS_PREV_YEARS, data)
+            a_series.add(MeasurementSeries.load(self._static_TOTAL_SUMS_PREV_YEARS))
             # adding all from this year till this-month minus 1 (from 01.01 THIS YEAR)
-            if self._static_TOTAL_SUMS_PREV_MONTHS is not None:
-                data = app_summ_total_dict_values(self._static_TOTAL_SUMS_PREV_MONTHS, data)
-            if self._static_TOTAL_SUMS_PREV_DAYS is not None:
-                data = app_summ_total_dict_values(self._static_TOTAL_SUMS_PREV_DAYS, data)
+            a_series.add(MeasurementSeries.load(self._static_TOTAL_SUMS_PREV_MONTHS))
+            a_series.add(MeasurementSeries.load(self._static_TOTAL_SUMS_PREV_DAYS))
 
+            data = a_series.to_dict()
             self._app_raw_total = data
 
+            # the combined response (with the wallbox UUIDs) contains the WALLBOX_CONSUMPTION of all wallboxes - with
+            # a single wallbox this is the total of this wallbox, so the separate wallbox requests are not required
+            if wb_uuids is not None and self._app_wallbox_num_max == 1:
+                a_wb_total = app_extract_total_measurement(data, "WALLBOX_CONSUMPTION")
+                if a_wb_total is not None:
+                    self._app_raw_wb_total[0] = a_wb_total
+                    self._app_wb_total_from_total = True
+
             # filename = f"./{start}.json"
             # directory = os.path.dirname(filename)
             # if not os.path.exists(directory):
@@ -5153,13 +4806,28 @@ class SenecOnline:
 
     async def app_update_total_all_wallboxes(self):
         _LOGGER.debug(f"APP-API app_update_total_all_wallboxes for '{self._app_wallbox_num_max}' wallboxes")
-        for idx in range(0, self._app_wallbox_num_max):
-            if self._app_wallbox_num_max > idx:
-                await self._app_update_single_wallbox_total(idx)
+        if self._app_wb_total_from_total:
+            _LOGGER.debug(f"app_update_total_all_wallboxes(): wallbox total already taken from the total response")
+            return self.wallbox_consumption_total
+
+        fetched_before = [(a_storage.get("years"), a_storage.get("months"), a_storage.get("days")) for a_storage in self._static_TOTAL_WALLBOX_DATA]
+
+        # the requests of all wallboxes share the same (backfill) limit - so they can run concurrently - but
+        # the storage will be written only once (after all wallboxes are done)
+        results = await asyncio.gather(*(self._app_update_single_wallbox_total(idx, persist=False) for idx in range(0, self._app_wallbox_num_max)), return_exceptions=True)
+        for idx, a_result in enumerate(results):
+            if isinstance(a_result, BaseException):
+                if isinstance(a_result, asyncio.CancelledError):
+                    raise a_result
+                _LOGGER.warning(f"app_update_total_all_wallboxes(): wallbox index {idx} - Exception: {type(a_result).__name__} - {a_result}")
+
+        fetched_after = [(a_storage.get("years"), a_storage.get("months"), a_storage.get("days")) for a_storage in self._static_TOTAL_WALLBOX_DATA]
+        if fetched_before != fetched_after:
+            await self._app_on_new_token_data_received(self._app_token_object)
 
         return self.wallbox_consumption_total
 
-    async def _app_update_single_wallbox_total(self, idx:int):
+    async def _app_update_single_wallbox_total(self, idx:int, persist:bool=True):
         if self.is_app_master_plant_id_none:
             await self.app_get_master_plant_id()
 
@@ -5192,8 +4860,17 @@ class SenecOnline:
         local_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_DAYS   = storage.get("days",       self._static_TOTAL_WALLBOX_DATA[idx].get("days"))
         local_TOTAL_SUMS_PREV_DAYS                   = storage.get("days_data",  self._static_TOTAL_WALLBOX_DATA[idx].get("days_data"))
 
+        def a_wb_total_url(res_type:str, from_val:str, to_val:str) -> str:
+            return self.APP_MEASURE_WB_TOTAL.format(master_plant_id=self._app_master_plant_id,
+                                                    wb_uuid   =the_wb_uuid,
+                                                    res_type  =res_type,
+                                                    from_val  =quote(from_val, safe=''),
+                                                    to_val    =quote(to_val, safe=''))
+
         # getting PREVIOUS_YEARS - only ONCE
-        if local_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_YEARS != current_year_local:
+        a_year_urls = {}
+        fetch_prev_years = local_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_YEARS != current_year_local
+        if fetch_prev_years:
             # we MUST delete all our previous collected data, when we switch over to a new year!
             local_TOTAL_SUMS_PREV_YEARS = None
             local_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_YEARS = None
@@ -5206,61 +4883,64 @@ class SenecOnline:
                 _LOGGER.debug(f"_app_update_single_wallbox_total() - data start year is set to {start_year} [{self._app_data_start_ts}]")
 
             for a_year in range(start_year, current_year_local):
-                _LOGGER.debug(f"_app_update_single_wallbox_total() - fetching data for year {a_year}")
-                a_url = self.APP_MEASURE_WB_TOTAL.format(master_plant_id=self._app_master_plant_id,
-                                                         wb_uuid=the_wb_uuid,
-                                                         res_type="MONTH",
-                                                         from_val=quote(app_get_utc_date_start(a_year, 1), safe=''),
-                                                         to_val=quote(app_get_utc_date_end(a_year, 12), safe=''))
-
-                data = await self._app_do_get_request(a_url=a_url)
-                if data is not None and app_has_dict_timeseries_with_values(data, ts_key_name="timeseries"):
-                    data = app_aggregate_timeseries_data_if_needed(data, ts_key_name="timeseries")
-                    _LOGGER.debug(f"_app_update_single_wallbox_total(): aggregated data for year {a_year} -> {data}")
-                    if local_TOTAL_SUMS_PREV_YEARS is None:
-                        local_TOTAL_SUMS_PREV_YEARS = data
-                    else:
-                        local_TOTAL_SUMS_PREV_YEARS = app_summ_total_dict_values(data, local_TOTAL_SUMS_PREV_YEARS, ts_key_name="timeseries")
-
-            local_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_YEARS = current_year_local
+                a_year_urls[a_year] = a_wb_total_url("MONTH", app_get_utc_date_start(a_year, 1), app_get_utc_date_end(a_year, 12))
 
         # getting PREVIOUS_MONTH - only ONCE
-        if local_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_MONTHS != current_month_local:
+        a_months_url = None
+        fetch_prev_months = local_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_MONTHS != current_month_local
+        if fetch_prev_months:
             do_persist = True
             if current_month_local == 1:
                 local_TOTAL_SUMS_PREV_MONTHS = None
             else:
-                _LOGGER.debug(f"***** APP-API: _app_update_single_wallbox_total() - fetching data for year {current_year_local} month 01 - {(current_month_local-1):02d}")
-                a_url = self.APP_MEASURE_WB_TOTAL.format(master_plant_id=self._app_master_plant_id,
-                                                      wb_uuid   =the_wb_uuid,
-                                                      res_type  ="MONTH",
-                                                      from_val  =quote(app_get_utc_date_start(current_year_local, 1), safe=''),
-                                                      to_val    =quote(app_get_utc_date_end(current_year_local, current_month_local - 1), safe=''))
-
-                data = await self._app_do_get_request(a_url=a_url)
-                if data is not None and app_has_dict_timeseries_with_values(data, ts_key_name="timeseries"):
-                    local_TOTAL_SUMS_PREV_MONTHS = app_aggregate_timeseries_data_if_needed(data, ts_key_name="timeseries")
-                    _LOGGER.debug(f"_app_update_single_wallbox_total(): aggregated data for year {current_year_local} month 01 - {(current_month_local-1):02d} -> {local_TOTAL_SUMS_PREV_MONTHS}")
-
-            local_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_MONTHS = current_month_local
+                a_months_url = a_wb_total_url("MONTH", app_get_utc_date_start(current_year_local, 1),
+                                              app_get_utc_date_end(current_year_local, current_month_local - 1))
 
         # getting CURRENT_MONTH - only ONCE
-        if local_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_DAYS != current_day_local:
+        a_days_url = None
+        fetch_prev_days = local_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_DAYS != current_day_local
+        if fetch_prev_days:
             do_persist = True
             if current_day_local == 1:
                 local_TOTAL_SUMS_PREV_DAYS = None
             else:
-                _LOGGER.debug(f"***** APP-API: _app_update_single_wallbox_total() - fetching data for year {current_year_local} month {current_month_local} - till day: {(current_day_local-1):02d}")
-                a_url = self.APP_MEASURE_WB_TOTAL.format(master_plant_id=self._app_master_plant_id,
-                                                         wb_uuid   =the_wb_uuid,
-                                                         res_type  ="MONTH",
-                                                         from_val  =quote(app_get_utc_date_start(current_year_local, current_month_local, 1), safe=''),
-                                                         to_val    =quote(app_get_utc_date_end(current_year_local, current_month_local, current_day_local - 1), safe=''))
+                a_days_url = a_wb_total_url("MONTH", app_get_utc_date_start(current_year_local, current_month_local, 1),
+                                            app_get_utc_date_end(current_year_local, current_month_local, current_day_local - 1))
+
+        # getting TODAY
+        a_today_url = a_wb_total_url("DAY", app_get_utc_date_start(current_year_local, current_month_local, current_day_local),
+                                     (now_utc + timedelta(hours=24)).strftime(STRFTIME_DATE_FORMAT))
+
+        # all windows will be fetched concurrently - and merged when all are in
+        _LOGGER.debug(f"_app_update_single_wallbox_total() - fetching data for years {list(a_year_urls)} prev_months: {a_months_url is not None} prev_days: {a_days_url is not None}")
+        results = await self._app_do_get_requests([*a_year_urls.values(), a_months_url, a_days_url, a_today_url])
+        months_data, days_data, data = results[-3:]
+
+        # the historic data is kept (and persisted) in the compact columnar structure of MeasurementSeries
+        a_prev_years = None
+        for a_year, a_year_data in zip(a_year_urls, results):
+            if a_year_data is not None and app_has_dict_timeseries_with_values(a_year_data, ts_key_name="timeseries"):
+                a_year_series = MeasurementSeries.from_dict(a_year_data, ts_key_name="timeseries")
+                if a_year_series is not None:
+                    a_year_series = a_year_series.aggregated()
+                    _LOGGER.debug(f"_app_update_single_wallbox_total(): aggregated data for year {a_year} -> {a_year_series}")
+                    a_prev_years = a_year_series if a_prev_years is None else a_prev_years.add(a_year_series)
+        if a_prev_years is not None:
+            local_TOTAL_SUMS_PREV_YEARS = a_prev_years.compact()
+        if fetch_prev_years:
+            local_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_YEARS = current_year_local
 
-                data = await self._app_do_get_request(a_url=a_url)
-                if data is not None and app_has_dict_timeseries_with_values(data, ts_key_name="timeseries"):
-                    local_TOTAL_SUMS_PREV_DAYS = app_aggregate_timeseries_data_if_needed(data, ts_key_name="timeseries")
+        a_months_series = MeasurementSeries.from_dict(months_data, ts_key_name="timeseries") if months_data is not None and app_has_dict_timeseries_with_values(months_data, ts_key_name="timeseries") else None
+        if a_months_series is not None:
+            local_TOTAL_SUMS_PREV_MONTHS = a_months_series.aggregated().compact()
+            _LOGGER.debug(f"_app_update_single_wallbox_total(): aggregated data for year {current_year_local} month 01 - {(current_month_local-1):02d} -> {local_TOTAL_SUMS_PREV_MONTHS}")
+        if fetch_prev_months:
+            local_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_MONTHS = current_month_local
 
+        a_days_series = MeasurementSeries.from_dict(days_data, ts_key_name="timeseries") if days_data is not None and app_has_dict_timeseries_with_values(days_data, ts_key_name="timeseries") else None
+        if a_days_series is not None:
+            local_TOTAL_SUMS_PREV_DAYS = a_days_series.aggregated().compact()
+        if fetch_prev_days:
             local_TOTAL_SUMS_WAS_FETCHED_FOR_PREV_DAYS = current_day_local
 
         if do_persist:
@@ -5277,27 +4957,19 @@ class SenecOnline:
                 "days_data":    local_TOTAL_SUMS_PREV_DAYS
             }
             self._static_TOTAL_WALLBOX_DATA[idx] = copy.deepcopy(self._app_token_object[CONF_APP_TOTAL_DATA]["wallbox"][idx])
-            await self._app_on_new_token_data_received(self._app_token_object)
+            if persist:
+                await self._app_on_new_token_data_received(self._app_token_object)
 
-        # getting TODAY
-        a_url = self.APP_MEASURE_WB_TOTAL.format(master_plant_id=self._app_master_plant_id,
-                                                 wb_uuid    =the_wb_uuid,
-                                                 res_type   ="DAY",
-                                                 from_val   =quote(app_get_utc_date_start(current_year_local, current_month_local, current_day_local), safe=''),
-                                                 to_val     =quote((now_utc + timedelta(hours=24)).strftime(STRFTIME_DATE_FORMAT), safe=''))
-
-        data = await self._app_do_get_request(a_url=a_url)
-        if app_has_dict_timeseries_with_values(data, ts_key_name="timeseries"):
-            data = app_aggregate_timeseries_data_if_needed(data, ts_key_name="timeseries")
+        a_series = MeasurementSeries.from_dict(data, ts_key_name="timeseries") if app_has_dict_timeseries_with_values(data, ts_key_name="timeseries") else None
+        if a_series is not None:
+            a_series = a_series.aggregated()
             # adding all from the previous years (all till 01.01.THIS YEAR 'minus 1 second')
-            if local_TOTAL_SUMS_PREV_YEARS is not None:
-                data = app_summ_total_dict_values(local_TOTAL_SUMS_PREV_YEARS, data, ts_key_name="timeseries")
+            a_series.add(MeasurementSeries.load(local_TOTAL_SUMS_PREV_YEARS, ts_key_name="timeseries"))
             # adding all from this year till this-month minus 1 (from 01.01 THIS YEAR)
-            if local_TOTAL_SUMS_PREV_MONTHS is not None:
-                data = app_summ_total_dict_values(local_TOTAL_SUMS_PREV_MONTHS, data, ts_key_name="timeseries")
-            if local_TOTAL_SUMS_PREV_DAYS is not None:
-                data = app_summ_total_dict_values(local_TOTAL_SUMS_PREV_DAYS, data, ts_key_name="timeseries")
+            a_series.add(MeasurementSeries.load(local_TOTAL_SUMS_PREV_MONTHS, ts_key_name="timeseries"))
+            a_series.add(MeasurementSeries.load(local_TOTAL_SUMS_PREV_DAYS, ts_key_name="timeseries"))
 
+            data = a_series.to_dict(ts_key_name="timeseries")
             self._app_raw_wb_total[idx] = data
 
         else:
@@ -5722,7 +5394,7 @@ class SenecOnline:
                     data = await self._app_do_get_request(wb_url, do_as_patch=True)
                     if data is not None:
                         self._app_set_wallbox_object_at_index(idx, data)
-                        _LOGGER.debug(f"app_set_wallbox_mode_legacy(): set wallbox {wallbox_num} to LOCK: {util.mask_map(data)}")
+                        _LOGGER.debug("app_set_wallbox_mode_legacy(): set wallbox %s to LOCK: %s", wallbox_num, util.lazy_mask_map(data))
                         success = True
                     else:
                         _LOGGER.debug(f"app_set_wallbox_mode_legacy(): set wallbox {wallbox_num} LOCK FAILED")
@@ -5738,7 +5410,7 @@ class SenecOnline:
                         data = await self._app_do_get_request(wb_url, do_as_patch=True)
                         if data is not None:
                             self._app_set_wallbox_object_at_index(idx, data)
-                            _LOGGER.debug(f"app_set_wallbox_mode_legacy(): set wallbox {wallbox_num} to UNLOCK: {util.mask_map(data)}")
+                            _LOGGER.debug("app_set_wallbox_mode_legacy(): set wallbox %s to UNLOCK: %s", wallbox_num, util.lazy_mask_map(data))
                         else:
                             _LOGGER.debug(f"app_set_wallbox_mode_legacy(): set wallbox {wallbox_num} UNLOCK FAILED")
                             return False
@@ -5936,7 +5608,7 @@ class SenecOnline:
                     data = await self._app_do_get_request(wb_url, do_as_patch=True)
                     if data is not None:
                         self._app_set_wallbox_object_at_index(idx, data)
-                        _LOGGER.debug(f"app_set_wallbox_mode_2026(): set wallbox {wallbox_num} to LOCK: {util.mask_map(data)}")
+                        _LOGGER.debug("app_set_wallbox_mode_2026(): set wallbox %s to LOCK: %s", wallbox_num, util.lazy_mask_map(data))
                         success = True
                     else:
                         _LOGGER.debug(f"app_set_wallbox_mode_2026(): set wallbox {wallbox_num} LOCK FAILED")
@@ -5952,7 +5624,7 @@ class SenecOnline:
                         data = await self._app_do_get_request(wb_url, do_as_patch=True)
                         if data is not None:
                             self._app_set_wallbox_object_at_index(idx, data)
-                            _LOGGER.debug(f"app_set_wallbox_mode_2026(): set wallbox {wallbox_num} to UNLOCK: {util.mask_map(data)}")
+                            _LOGGER.debug("app_set_wallbox_mode_2026(): set wallbox %s to UNLOCK: %s", wallbox_num, util.lazy_mask_map(data))
                         else:
                             _LOGGER.debug(f"app_set_wallbox_mode_2026(): set wallbox {wallbox_num} UNLOCK FAILED")
                             return False
@@ -6049,7 +5721,7 @@ class SenecOnline:
             data = await self._app_do_post_request(wb_url, post_data=None, read_response=True)
             if data is not None:
                 self._app_set_wallbox_object_at_index(idx, data)
-                _LOGGER.debug(f"app_switch_wallbox_mode(): set wallbox {wallbox_num} to {mode}: {util.mask_map(data)}")
+                _LOGGER.debug("app_switch_wallbox_mode(): set wallbox %s to %s: %s", wallbox_num, mode, util.lazy_mask_map(data))
                 return True
             else:
                 _LOGGER.debug(f"app_switch_wallbox_mode(): set wallbox {wallbox_num} to {mode} FAILED")
@@ -6066,7 +5738,7 @@ class SenecOnline:
             data = await self._app_do_post_request(wb_url, post_data=the_post_data, read_response=True)
             if data is not None:
                 self._app_set_wallbox_object_at_index(idx, data)
-                _LOGGER.debug(f"app_update_wallbox_mode_setting(): set wallbox {wallbox_num} {mode} settings: {util.mask_map(data)}")
+                _LOGGER.debug("app_update_wallbox_mode_setting(): set wallbox %s %s settings: %s", wallbox_num, mode, util.lazy_mask_map(data))
                 return True
             else:
                 _LOGGER.debug(f"app_update_wallbox_mode_setting(): set wallbox {wallbox_num} {mode} settings FAILED")
@@ -7892,6 +7564,7 @@ class SenecOnline:
 
     async def trigger_delete_cache(self, payload:str):
         await self._write_token_to_storage(token_dict=None)
+        self.app_cancel_token_refresh()
         # reset all our internal objects…
         self._LAST_UPDATE_TS = 0
         self._QUERY_TOTALS_TS = 0
@@ -8126,7 +7799,7 @@ class SenecConnect:
                 if res.status in [200, 201, 202]:
                     try:
                         data = await res.json()
-                        _LOGGER.debug(f"SENEC.Connect response: {util.mask_map(data)}")
+                        _LOGGER.debug("SENEC.Connect response: %s", util.lazy_mask_map(data))
                         return self._handle_json_response(data)
 
                     except JSONDecodeError as jexc:
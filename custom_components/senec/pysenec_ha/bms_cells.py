@@ -0,0 +1,103 @@
+from collections.abc import Mapping
+from operator import mul
+from typing import Final, NamedTuple
+
+from custom_components.senec.pysenec_ha.constants import SENEC_SECTION_BMS
+
+_BMS_MODULES: Final = ("A", "B", "C", "D")
+
+# the lala.cgi field prefix & the name of the analytics (used as key prefix of the generated properties)
+_CELL_KINDS: Final = (("CELL_VOLTAGES_MODULE_", "bms_cell_volt"), ("CELL_TEMPERATURES_MODULE_", "bms_cell_temp"))
+
+
+class CellStats(NamedTuple):
+    count: int
+    total: float
+    total_sq: float
+    min: float
+    max: float
+    # the label of the cell with the lowest/highest value (e.g. 'B7')
+    min_cell: str
+    max_cell: str
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count
+
+    @property
+    def std(self) -> float:
+        # population standard deviation (from the sums - so module stats can be combined to pack stats)
+        return max(self.total_sq / self.count - self.mean ** 2, 0.0) ** 0.5
+
+    @property
+    def spread(self) -> float:
+        return self.max - self.min
+
+    def attributes(self) -> dict:
+        return {"min": self.min, "max": self.max, "mean": round(self.mean, 3), "std": round(self.std, 3),
+                "min_cell": self.min_cell, "max_cell": self.max_cell}
+
+
+def module_stats(module: str, values) -> CellStats | None:
+    # min/max/sum & sum of squares are all C-level passes over the (array) values
+    if isinstance(values, str) or not hasattr(values, "__len__") or len(values) == 0:
+        return None
+    a_min = min(values)
+    a_max = max(values)
+    return CellStats(len(values), float(sum(values)), float(sum(map(mul, values, values))), a_min, a_max,
+                     f"{module}{values.index(a_min) + 1}", f"{module}{values.index(a_max) + 1}")
+
+
+def pack_stats(modules: list[CellStats]) -> CellStats | None:
+    if len(modules) == 0:
+        return None
+    a_min = min(modules, key=lambda a_stats: a_stats.min)
+    a_max = max(modules, key=lambda a_stats: a_stats.max)
+    return CellStats(sum(a_stats.count for a_stats in modules), sum(a_stats.total for a_stats in modules),
+                     sum(a_stats.total_sq for a_stats in modules), a_min.min, a_max.max, a_min.min_cell, a_max.max_cell)
+
+
+def _kind_keys(a_name: str) -> tuple:
+    return (f"{a_name}_min", f"{a_name}_max", f"{a_name}_mean", f"{a_name}_std", f"{a_name}_spread",
+            f"{a_name}_min_cell", f"{a_name}_max_cell",
+            *(f"{a_name}_spread_{a_module.lower()}" for a_module in _BMS_MODULES),
+            *(f"{a_name}_spread_{a_module.lower()}_attr" for a_module in _BMS_MODULES))
+
+BMS_CELL_ANALYTICS_KEYS: Final = tuple(a_key for _, a_name in _CELL_KINDS for a_key in _kind_keys(a_name))
+
+
+def analyze(raw: dict | None) -> dict:
+    """Per module & per pack statistics of the BMS cell voltages and temperatures of one poll."""
+    values = {}
+    a_bms = raw.get(SENEC_SECTION_BMS, None) if raw is not None else None
+    if not isinstance(a_bms, Mapping):
+        return values
+
+    for a_field_prefix, a_name in _CELL_KINDS:
+        a_modules = []
+        for a_module in _BMS_MODULES:
+            a_stats = module_stats(a_module, a_bms.get(f"{a_field_prefix}{a_module}", None))
+            if a_stats is not None:
+                a_modules.append(a_stats)
+                values[f"{a_name}_spread_{a_module.lower()}"] = a_stats.spread
+                values[f"{a_name}_spread_{a_module.lower()}_attr"] = a_stats.attributes()
+
+        a_pack = pack_stats(a_modules)
+        if a_pack is not None:
+            values[f"{a_name}_min"] = a_pack.min
+            values[f"{a_name}_max"] = a_pack.max
+            values[f"{a_name}_mean"] = a_pack.mean
+            values[f"{a_name}_std"] = a_pack.std
+            values[f"{a_name}_spread"] = a_pack.spread
+            values[f"{a_name}_min_cell"] = a_pack.min_cell
+            values[f"{a_name}_max_cell"] = a_pack.max_cell
+    return values
+
+
+def accessors(cls):
+    """Class decorator: adds a read only property for every analytics value (read from '_bms_cell_analytics')."""
+    for a_key in BMS_CELL_ANALYTICS_KEYS:
+        if a_key in cls.__dict__:
+            raise TypeError(f"{cls.__name__}.{a_key} already exists - can't be generated for the BMS cell analytics")
+        setattr(cls, a_key, property(lambda self, _key=a_key: self._bms_cell_analytics.get(_key, None)))
+    return cls
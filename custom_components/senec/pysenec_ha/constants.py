@@ -603,6 +603,37 @@ WALLBOX_CHARGING_MODES_LEGACY_P4 : Final = {
     8: LOCAL_WB_MODE_LEGACY_COMFORT_NIGHT_ON_DAY_OFF,
 }
 
+# refresh tiers of the lala.cgi data - 'fast' data will be requested with every poll, the 'medium'
+# and 'slow' data only when the (configurable) tier interval has passed
+LALA_TIER_FAST: Final   = "fast"
+LALA_TIER_MEDIUM: Final = "medium"
+LALA_TIER_SLOW: Final   = "slow"
+
+SENEC_LALA_SECTION_TIERS: Final = {
+    SENEC_SECTION_TEMPMEASURE: LALA_TIER_MEDIUM,
+    SENEC_SECTION_STATISTIC: LALA_TIER_MEDIUM,
+    SENEC_SECTION_FAN_SPEED: LALA_TIER_MEDIUM,
+    SENEC_SECTION_BAT1: LALA_TIER_SLOW,
+}
+
+SENEC_LALA_FIELD_TIERS: Final = {
+    SENEC_SECTION_BMS: {
+        "SOH": LALA_TIER_SLOW,
+        "CYCLES": LALA_TIER_SLOW,
+        **{f"CELL_TEMPERATURES_MODULE_{a_letter}": LALA_TIER_MEDIUM for a_letter in ['A', 'B', 'C', 'D']},
+        **{f"CELL_VOLTAGES_MODULE_{a_letter}": LALA_TIER_MEDIUM for a_letter in ['A', 'B', 'C', 'D']},
+    },
+    SENEC_SECTION_ENERGY: {
+        "STAT_HOURS_OF_OPERATION": LALA_TIER_SLOW,
+    },
+    # only the configuration of the sockets - the state (POWER_ON, ALREADY_SWITCHED & TIME_REM) is 'fast'
+    SENEC_SECTION_SOCKETS: {
+        **{a_field: LALA_TIER_SLOW for a_field in ["LOWER_LIMIT", "UPPER_LIMIT", "TIME_LIMIT", "SWITCH_ON_HOUR",
+                                                   "SWITCH_ON_MINUTE", "POWER_ON_TIME", "USE_TIME", "ENABLE",
+                                                   "FORCE_ON", "PRIORITY"]},
+    },
+}
+
 NO_LIMIT: Final         = "no_limit"
 EVERY_MINUTE: Final     = "one_minute"
 EVERY_5_MINUTES: Final  = "five_minutes"
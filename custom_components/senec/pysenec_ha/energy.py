@@ -0,0 +1,45 @@
+from collections.abc import Mapping
+
+
+class EnergyIntegrator:
+    """Trapezoidal integration of power values (W) into energy totals (kWh) - one counter per power value.
+
+    Intervals that are longer than 'max_gap' seconds (or where one of the two power values is missing) will
+    be skipped - so an outage of the SENEC.Home (or HA) will not produce any energy. When the clock steps
+    backwards, the integration continues from the new timestamp."""
+
+    def __init__(self, counters: tuple, max_gap: float):
+        self.counters = counters
+        self.max_gap = max_gap
+        self._totals = {a_counter: 0.0 for a_counter in counters}
+        self._last_ts = None
+        self._last_powers = {}
+
+    def add(self, ts: float, powers: Mapping):
+        a_last_ts = self._last_ts
+        if a_last_ts is not None:
+            a_delta = ts - a_last_ts
+            if 0 < a_delta <= self.max_gap:
+                for a_counter in self.counters:
+                    a_last_power = self._last_powers.get(a_counter, None)
+                    a_power = powers.get(a_counter, None)
+                    if a_last_power is not None and a_power is not None:
+                        # Ws -> kWh
+                        self._totals[a_counter] += (a_last_power + a_power) * a_delta / 7_200_000
+            # else: a gap (or the clock went backwards) - no energy for this interval, the current sample will
+            # be the new base
+        self._last_ts = ts
+        self._last_powers = {a_counter: powers.get(a_counter, None) for a_counter in self.counters}
+
+    def total(self, counter: str) -> float | None:
+        return self._totals.get(counter, None)
+
+    def checkpoint(self) -> dict:
+        return {"totals": dict(self._totals)}
+
+    def restore(self, data: dict | None):
+        # the energy that has been integrated before the restore will be added to the stored totals
+        if data is not None and isinstance(data.get("totals", None), dict):
+            for a_counter, a_total in data["totals"].items():
+                if a_counter in self._totals and isinstance(a_total, (int, float)):
+                    self._totals[a_counter] += a_total
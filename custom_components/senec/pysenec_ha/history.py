@@ -0,0 +1,80 @@
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from math import fsum, isnan, nan
+
+
+class LalaHistory:
+    """Fixed size ring buffer with the numeric values of the last polls (one array('d') column per field) - so
+    short horizon trend queries (mean/min/max/integral of the last minutes) don't need the recorder. The
+    timestamps must be ascending (time.monotonic()) - the windows are found by a binary search."""
+
+    def __init__(self, fields: tuple, depth: int):
+        self.fields = fields
+        self.depth = max(2, int(depth))
+        self._ts = array("d", bytes(8 * self.depth))
+        self._columns = {a_field: array("d", bytes(8 * self.depth)) for a_field in fields}
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear(self):
+        self._next = 0
+        self._count = 0
+
+    def append(self, ts: float, values: Mapping):
+        if self._count > 0 and ts < self._ts[(self._next - 1) % self.depth]:
+            # the buffer would not be sorted any longer - so we start again
+            self.clear()
+        idx = self._next
+        self._ts[idx] = ts
+        for a_field, a_column in self._columns.items():
+            a_value = values.get(a_field, None)
+            a_column[idx] = a_value if isinstance(a_value, (int, float)) and not isinstance(a_value, bool) else nan
+        self._next = (idx + 1) % self.depth
+        self._count = min(self._count + 1, self.depth)
+
+    def _chronological(self, a_column: array) -> array:
+        a_start = (self._next - self._count) % self.depth
+        if a_start + self._count <= self.depth:
+            return a_column[a_start:a_start + self._count]
+        return a_column[a_start:] + a_column[:self._next]
+
+    def window(self, field: str, seconds: float, now: float = None) -> tuple[array, array]:
+        """The (timestamps, values) of the field within the last 'seconds' (relative to 'now' or to the
+        newest entry) - in chronological order, values of polls without the field are NaN."""
+        if self._count == 0 or field not in self._columns:
+            return array("d"), array("d")
+        a_ts = self._chronological(self._ts)
+        if now is None:
+            now = a_ts[-1]
+        a_from = bisect_left(a_ts, now - seconds)
+        return a_ts[a_from:], self._chronological(self._columns[field])[a_from:]
+
+    def _values(self, field: str, seconds: float, now: float = None) -> list:
+        return [a_value for a_value in self.window(field, seconds, now)[1] if not isnan(a_value)]
+
+    def mean(self, field: str, seconds: float, now: float = None) -> float | None:
+        a_values = self._values(field, seconds, now)
+        return fsum(a_values) / len(a_values) if len(a_values) > 0 else None
+
+    def min(self, field: str, seconds: float, now: float = None) -> float | None:
+        a_values = self._values(field, seconds, now)
+        return min(a_values) if len(a_values) > 0 else None
+
+    def max(self, field: str, seconds: float, now: float = None) -> float | None:
+        a_values = self._values(field, seconds, now)
+        return max(a_values) if len(a_values) > 0 else None
+
+    def integral(self, field: str, seconds: float, now: float = None) -> float | None:
+        """Trapezoidal integral over the window in value * hours (so Wh for a power in W) - intervals with a
+        missing value at one of their ends will be skipped."""
+        a_ts, a_values = self.window(field, seconds, now)
+        if len(a_ts) < 2:
+            return None
+        a_sum = fsum((a_ts[idx + 1] - a_ts[idx]) * (a_values[idx] + a_values[idx + 1])
+                     for idx in range(len(a_ts) - 1)
+                     if not isnan(a_values[idx]) and not isnan(a_values[idx + 1]))
+        return a_sum / 7200
@@ -0,0 +1,161 @@
+from collections.abc import Mapping
+from typing import Final, Callable, NamedTuple, Any
+
+from custom_components.senec.pysenec_ha.constants import (
+    SENEC_SECTION_BAT1,
+    SENEC_SECTION_BMS,
+    SENEC_SECTION_ENERGY,
+    SENEC_SECTION_FAN_SPEED,
+    SENEC_SECTION_PM1OBJ1,
+    SENEC_SECTION_PM1OBJ2,
+    SENEC_SECTION_PV1,
+    SENEC_SECTION_SOCKETS,
+    SENEC_SECTION_STATISTIC,
+    SENEC_SECTION_TEMPMEASURE,
+    SENEC_SECTION_WALLBOX,
+)
+
+
+class LalaField(NamedTuple):
+    # name of the generated (read only) property of SenecLocal
+    name: str
+    section: str
+    key: str
+    # position in the array value ('None' = the value itself)
+    index: int | None = None
+    transform: Callable[[Any], Any] | None = None
+
+
+def _is_one(value) -> bool:
+    return value == 1
+
+def _is_positive(value) -> bool:
+    return value > 0
+
+
+_BMS_MODULES: Final = ("a", "b", "c", "d")
+_PHASES: Final = ((0, "p1"), (1, "p2"), (2, "p3"))
+
+SENEC_LALA_FIELDS: Final = (
+    LalaField("house_power", SENEC_SECTION_ENERGY, "GUI_HOUSE_POW"),
+    LalaField("battery_charge_percent", SENEC_SECTION_ENERGY, "GUI_BAT_DATA_FUEL_CHARGE"),
+    LalaField("battery_state_power", SENEC_SECTION_ENERGY, "GUI_BAT_DATA_POWER"),
+    LalaField("battery_state_current", SENEC_SECTION_ENERGY, "GUI_BAT_DATA_CURRENT"),
+    LalaField("battery_state_voltage", SENEC_SECTION_ENERGY, "GUI_BAT_DATA_VOLTAGE"),
+    LalaField("grid_state_power", SENEC_SECTION_ENERGY, "GUI_GRID_POW"),
+
+    LalaField("house_total_consumption", SENEC_SECTION_STATISTIC, "LIVE_HOUSE_CONS"),
+    LalaField("solar_total_generated", SENEC_SECTION_STATISTIC, "LIVE_PV_GEN"),
+    LalaField("battery_total_charged", SENEC_SECTION_STATISTIC, "LIVE_BAT_CHARGE"),
+    LalaField("battery_total_discharged", SENEC_SECTION_STATISTIC, "LIVE_BAT_DISCHARGE"),
+
+    LalaField("battery_temp", SENEC_SECTION_TEMPMEASURE, "BATTERY_TEMP"),
+    LalaField("case_temp", SENEC_SECTION_TEMPMEASURE, "CASE_TEMP"),
+    LalaField("mcu_temp", SENEC_SECTION_TEMPMEASURE, "MCU_TEMP"),
+
+    *(LalaField(f"solar_mpp{idx + 1}_{a_name}", SENEC_SECTION_PV1, a_key, idx)
+      for idx in range(3)
+      for a_name, a_key in (("potential", "MPP_VOL"), ("current", "MPP_CUR"), ("power", "MPP_POWER"))),
+
+    # enfluri: PM1OBJ1 = net, PM1OBJ2 = usage
+    *(a_field
+      for a_prefix, a_section in (("enfluri_net", SENEC_SECTION_PM1OBJ1), ("enfluri_usage", SENEC_SECTION_PM1OBJ2))
+      for a_field in (
+          LalaField(f"{a_prefix}_freq", a_section, "FREQ"),
+          LalaField(f"{a_prefix}_power_total", a_section, "P_TOTAL"),
+          *(LalaField(f"{a_prefix}_{a_name}_{a_phase}", a_section, a_key, idx)
+            for idx, a_phase in _PHASES
+            for a_name, a_key in (("potential", "U_AC"), ("current", "I_AC"), ("power", "P_AC"))),
+      )),
+
+    *(LalaField(f"bms_cell_temp_{a_module}{idx + 1}", SENEC_SECTION_BMS, f"CELL_TEMPERATURES_MODULE_{a_module.upper()}", idx)
+      for a_module in _BMS_MODULES for idx in range(6)),
+    *(LalaField(f"bms_cell_volt_{a_module}{idx + 1}", SENEC_SECTION_BMS, f"CELL_VOLTAGES_MODULE_{a_module.upper()}", idx)
+      for a_module in _BMS_MODULES for idx in range(16)),
+    *(LalaField(f"bms_{a_name}_{a_module}", SENEC_SECTION_BMS, a_key, idx)
+      for idx, a_module in enumerate(_BMS_MODULES)
+      for a_name, a_key in (("soc", "SOC"), ("soh", "SOH"), ("voltage", "VOLTAGE"), ("current", "CURRENT"),
+                            ("cycles", "CYCLES"), ("fw", "FW"))),
+
+    *(a_field
+      for idx in range(4)
+      for a_field in (
+          LalaField(f"wallbox_{idx + 1}_power_alt", SENEC_SECTION_WALLBOX, "APPARENT_CHARGING_POWER", idx),
+          LalaField(f"wallbox_{idx + 1}_ev_connected", SENEC_SECTION_WALLBOX, "EV_CONNECTED", idx),
+          LalaField(f"wallbox_{idx + 1}_energy", SENEC_SECTION_STATISTIC, "LIVE_WB_ENERGY", idx),
+          *(LalaField(f"wallbox_{idx + 1}_l{a_phase}_used", SENEC_SECTION_WALLBOX, f"L{a_phase}_USED", idx, _is_one)
+            for a_phase in range(1, 4)),
+          *(LalaField(f"wallbox_{idx + 1}_l{a_phase}_charging_current", SENEC_SECTION_WALLBOX, f"L{a_phase}_CHARGING_CURRENT", idx)
+            for a_phase in range(1, 4)),
+      )),
+
+    LalaField("fan_inv_lv", SENEC_SECTION_FAN_SPEED, "INV_LV", transform=_is_positive),
+    LalaField("fan_inv_hv", SENEC_SECTION_FAN_SPEED, "INV_HV", transform=_is_positive),
+    LalaField("spare_capacity", SENEC_SECTION_BAT1, "SPARE_CAPACITY"),
+    LalaField("sockets_already_switched", SENEC_SECTION_SOCKETS, "ALREADY_SWITCHED"),
+    LalaField("sockets_power_on", SENEC_SECTION_SOCKETS, "POWER_ON"),
+    LalaField("sockets_priority", SENEC_SECTION_SOCKETS, "PRIORITY"),
+    LalaField("sockets_time_rem", SENEC_SECTION_SOCKETS, "TIME_REM"),
+)
+
+
+class LalaFieldTable:
+    """Resolves all fields of the table in one step (per poll) into a flat slot list - the generated
+    properties are then just an indexed load from that list."""
+
+    def __init__(self, fields: tuple):
+        self.fields = fields
+        self.slots = {a_field.name: idx for idx, a_field in enumerate(fields)}
+        if len(self.slots) != len(fields):
+            raise ValueError("LalaFieldTable: the field names must be unique")
+
+        # section -> key -> [(slot, index, transform)] - so every lala.cgi value will be looked up only once
+        plan = {}
+        for idx, a_field in enumerate(fields):
+            plan.setdefault(a_field.section, {}).setdefault(a_field.key, []).append((idx, a_field.index, a_field.transform))
+        self._plan = tuple((a_section, tuple((a_key, tuple(a_targets)) for a_key, a_targets in a_keys.items()))
+                           for a_section, a_keys in plan.items())
+
+    def empty(self) -> list:
+        return [None] * len(self.fields)
+
+    def resolve(self, raw: dict | None) -> list:
+        slots = self.empty()
+        if raw is None:
+            return slots
+
+        for a_section, a_keys in self._plan:
+            a_section_data = raw.get(a_section, None)
+            if not isinstance(a_section_data, Mapping):
+                continue
+            for a_key, a_targets in a_keys:
+                a_value = a_section_data.get(a_key, None)
+                if a_value is None:
+                    continue
+                for a_slot, a_index, a_transform in a_targets:
+                    if a_index is not None:
+                        # 'VARIABLE_NOT_FOUND' is not an array
+                        if isinstance(a_value, str) or not hasattr(a_value, "__len__") or len(a_value) <= a_index:
+                            continue
+                        a_item = a_value[a_index]
+                    else:
+                        a_item = a_value
+                    if a_transform is None:
+                        slots[a_slot] = a_item
+                    else:
+                        try:
+                            slots[a_slot] = a_transform(a_item)
+                        except (TypeError, ValueError):
+                            pass
+        return slots
+
+    def accessors(self, cls):
+        """Class decorator: adds a read only property for every field of the table."""
+        for a_name, a_slot in self.slots.items():
+            if a_name in cls.__dict__:
+                raise TypeError(f"{cls.__name__}.{a_name} already exists - can't be generated from the field table")
+            setattr(cls, a_name, property(lambda self, _slot=a_slot: self._lala_slots[_slot]))
+        return cls
+
+
+SENEC_LALA_FIELD_TABLE: Final = LalaFieldTable(SENEC_LALA_FIELDS)
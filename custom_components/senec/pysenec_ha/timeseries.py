@@ -0,0 +1,96 @@
+from array import array
+from collections.abc import Mapping
+
+
+class MeasurementSeries:
+    """Columnar representation of an app-API measurement response - one array('d') per measurement and the
+    dates/durations of the rows. The sums & the aggregation are C-level passes over the columns (and not per
+    element loops over the nested response dicts)."""
+
+    __slots__ = ("measurements", "dates", "durations", "columns")
+
+    def __init__(self, measurements, dates=None, durations=None, columns: dict = None):
+        self.measurements = tuple(measurements)
+        self.dates = list(dates) if dates is not None else []
+        self.durations = array("d", durations) if durations is not None else array("d")
+        self.columns = columns if columns is not None else {a_name: array("d") for a_name in self.measurements}
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __repr__(self) -> str:
+        return f"MeasurementSeries({self.compact()})"
+
+    @classmethod
+    def from_dict(cls, data, ts_key_name: str = "timeSeries"):
+        """From the response structure - 'None' when there is no usable time series."""
+        if not isinstance(data, Mapping) or not isinstance(data.get("measurements", None), list):
+            return None
+        rows = data.get(ts_key_name, None)
+        if not isinstance(rows, list) or len(rows) == 0:
+            return None
+        try:
+            a_series = cls(data["measurements"],
+                           [a_row.get("date", None) for a_row in rows],
+                           [a_row["measurements"].get("durationInSeconds", 0) or 0 for a_row in rows])
+            # transpose the rows into the columns - a short row (or a missing value) counts as 0, so all
+            # columns will have the same length as the dates
+            a_columns = [a_series.columns[a_name] for a_name in a_series.measurements]
+            a_count = len(a_columns)
+            for a_row in rows:
+                a_values = a_row["measurements"]["values"]
+                for idx in range(a_count):
+                    a_columns[idx].append((a_values[idx] or 0) if idx < len(a_values) else 0)
+            return a_series
+        except (KeyError, TypeError, AttributeError):
+            return None
+
+    @classmethod
+    def load(cls, data, ts_key_name: str = "timeSeries"):
+        """From the compact (stored) structure - or from the response structure (stored by older versions)."""
+        if isinstance(data, Mapping) and isinstance(data.get("columns", None), Mapping):
+            try:
+                return cls(data["measurements"], data["dates"], data["durations"],
+                           {a_name: array("d", data["columns"][a_name]) for a_name in data["measurements"]})
+            except (KeyError, TypeError):
+                return None
+        return cls.from_dict(data, ts_key_name)
+
+    def compact(self) -> dict:
+        return {"measurements": list(self.measurements), "dates": self.dates, "durations": self.durations.tolist(),
+                "columns": {a_name: a_column.tolist() for a_name, a_column in self.columns.items()}}
+
+    def to_dict(self, ts_key_name: str = "timeSeries") -> dict:
+        """Back to the response structure."""
+        rows = zip(*(self.columns[a_name] for a_name in self.measurements))
+        return {
+            "measurements": list(self.measurements),
+            ts_key_name: [{
+                "date": a_date,
+                "measurements": {
+                    "durationInSeconds": a_duration,
+                    "values": list(a_values)
+                }
+            } for a_date, a_duration, a_values in zip(self.dates, self.durations, rows)]
+        }
+
+    def aggregated(self):
+        """A single row with the sums of all rows (and the date of the first row)."""
+        if len(self) <= 1:
+            return self
+        return MeasurementSeries(self.measurements, self.dates[:1], (sum(self.durations),),
+                                 {a_name: array("d", (sum(a_column),)) for a_name, a_column in self.columns.items()})
+
+    def add(self, other):
+        """Adds the first row of 'other' to the first row of this series (matched by the measurement name)."""
+        if other is None or len(other) == 0 or len(self) == 0:
+            return self
+        for a_name, a_column in self.columns.items():
+            a_other_column = other.columns.get(a_name, None)
+            if a_other_column is not None and len(a_other_column) > 0 and len(a_column) > 0:
+                a_column[0] += a_other_column[0]
+        return self
+
+    def total(self, measurement: str) -> float | None:
+        a_column = self.columns.get(measurement, None)
+        return sum(a_column) if a_column is not None else None
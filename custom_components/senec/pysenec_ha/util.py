@@ -1,6 +1,14 @@
-import copy
+import json
 import logging
-from struct import unpack, pack
+import re
+import sys
+from array import array
+from collections.abc import Mapping, MutableMapping
+from functools import lru_cache
+from itertools import repeat
+from struct import unpack, pack, Struct
+from types import MappingProxyType
+from typing import Final, Iterable
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -10,45 +18,132 @@ _MASKED_VALUES = ["host", "username", "password", "street", "email", "phonenumbe
                   "device_id", "controllerid", "systemid", "app_master_plant_id", "controlunitnumber",
                   "senec_connect_key", "serial_number", "system_id"]
 
+_MASKED: Final = "<MASKED>"
+# the (lower-case) keys that will be masked
+_MASKED_KEYS = frozenset(_MASKED_VALUES)
+# list entries (without a key) will be masked when they contain any of the masked values
+_MASKED_PATTERN = re.compile("|".join(re.escape(a_value) for a_value in _MASKED_VALUES), re.IGNORECASE)
+
+# the values that can be taken over as they are
+_LEAF_TYPES = frozenset((str, int, float, bool, type(None)))
+
+def _is_masked_key(key) -> bool:
+    return isinstance(key, str) and key.lower() in _MASKED_KEYS
+
 def mask_map(d: (dict, list)) -> dict:
-    if isinstance(d, dict):
-        return mask_map_internal(copy.deepcopy(d))
+    if isinstance(d, Mapping):
+        return mask_map_internal(d)
     elif isinstance(d, list):
-        return mask_list_internal(copy.deepcopy(d))
+        return mask_list_internal(d)
     else:
         _LOGGER.info(f"mask_map expects a dictionary or list, got '{type(d).__name__}'")
         return d
 
+class LazyMask:
+    """Log argument that masks the data only when the message will be really logged - use it with the
+    %-style of the logger: _LOGGER.debug("read: %s", lazy_mask_map(data))"""
+    __slots__ = ("_data", "_as_json")
+
+    def __init__(self, data, as_json: bool = False):
+        self._data = data
+        self._as_json = as_json
+
+    def __str__(self) -> str:
+        if self._as_json:
+            return "".join(iter_masked_json(self._data))
+        return str(mask_map(self._data))
+
+    __repr__ = __str__
+
+def lazy_mask_map(d: (dict, list), as_json: bool = False) -> LazyMask:
+    return LazyMask(d, as_json)
+
 def mask_list_internal(lst: list) -> list:
-    masked_list = []
-    for item in lst:
-        if isinstance(item, dict):
-            masked_list.append(mask_map_internal(item))
-        elif isinstance(item, list):
-            masked_list.append(mask_list_internal(item))
-        elif isinstance(item, str) and any(masked_key in item.lower() for masked_key in _MASKED_VALUES):
-            masked_list.append("<MASKED>")
+    # a list without a key - a string entry will be masked, when it contains any of the masked values
+    return [_mask_value(item, False, False) for item in lst]
+
+def mask_map_internal(d: Mapping) -> dict:
+    """Builds the masked copy of the dict in a single pass (the source will not be modified)."""
+    masked = {}
+    for k, v in d.items():
+        a_type = type(v)
+        if a_type in _LEAF_TYPES:
+            masked[k] = _MASKED if type(k) is str and k.lower() in _MASKED_KEYS else v
+        elif a_type is list:
+            a_masked_key = _is_masked_key(k)
+            masked[k] = [_mask_value(item, a_masked_key, True) for item in v]
+        elif isinstance(v, Mapping):
+            masked[k] = mask_map_internal(v)
+        elif _is_masked_key(k):
+            masked[k] = _MASKED
         else:
-            masked_list.append(item)
-    return masked_list
-
-def mask_map_internal(d: dict) -> dict:
-    for k, v in d.copy().items():
-        if isinstance(v, dict):
-            d.pop(k)
-            d[k] = v
-            mask_map_internal(v)
-        elif isinstance(v, list):
-            d.pop(k)
-            d[k] = [mask_map_internal(item) if isinstance(item, dict) else
-                    ("<MASKED>" if isinstance(item, str) and k.lower() in _MASKED_VALUES else item)
-                    for item in v]
+            # the typed lala.cgi arrays will be converted to lists
+            masked[k] = v.tolist() if a_type is array else v
+    return masked
+
+def _mask_value(item, masked: bool, keyed: bool):
+    # a list entry: when the list is the value of a dict ('keyed'), the string entries will be masked, when the
+    # key is masked - without a key, a string will be masked, when it contains any of the masked values
+    a_type = type(item)
+    if a_type is str:
+        if (masked if keyed else _MASKED_PATTERN.search(item) is not None):
+            return _MASKED
+        return item
+    elif a_type in _LEAF_TYPES:
+        return item
+    elif a_type is list:
+        return [_mask_value(a_sub_item, masked, keyed) for a_sub_item in item]
+    elif isinstance(item, Mapping):
+        return mask_map_internal(item)
+    return item.tolist() if a_type is array else item
+
+_JSON_ENCODER = json.JSONEncoder(default=str)
+
+def iter_masked_json(d: (dict, list)):
+    """Streaming variant of mask_map(): yields the masked data as JSON chunks - the nested dicts & lists are
+    walked element by element, so the masked copy of the data will never be built."""
+    if isinstance(d, Mapping):
+        yield from _iter_masked_json_mapping(d)
+    elif isinstance(d, list):
+        yield from _iter_masked_json_list(d, False, False)
+    else:
+        yield _JSON_ENCODER.encode(d)
+
+def _iter_masked_json_mapping(d: Mapping):
+    # same rules as mask_map_internal()
+    yield "{"
+    first = True
+    for k, v in d.items():
+        a_key = k if isinstance(k, str) else str(k)
+        yield f"{_JSON_ENCODER.encode(a_key)}: " if first else f", {_JSON_ENCODER.encode(a_key)}: "
+        first = False
+        a_type = type(v)
+        if a_type in _LEAF_TYPES:
+            yield _JSON_ENCODER.encode(_MASKED if type(k) is str and k.lower() in _MASKED_KEYS else v)
+        elif a_type is list:
+            yield from _iter_masked_json_list(v, _is_masked_key(k), True)
+        elif isinstance(v, Mapping):
+            yield from _iter_masked_json_mapping(v)
+        elif _is_masked_key(k):
+            yield _JSON_ENCODER.encode(_MASKED)
         else:
-            if k.lower() in _MASKED_VALUES:
-                v = "<MASKED>"
-            d.pop(k)
-            d[k] = v
-    return d
+            yield _JSON_ENCODER.encode(v.tolist() if a_type is array else v)
+    yield "}"
+
+def _iter_masked_json_list(lst: list, masked: bool, keyed: bool):
+    # same rules as _mask_value()
+    yield "["
+    for idx, item in enumerate(lst):
+        if idx > 0:
+            yield ", "
+        a_type = type(item)
+        if a_type is list:
+            yield from _iter_masked_json_list(item, masked, keyed)
+        elif a_type not in _LEAF_TYPES and isinstance(item, Mapping):
+            yield from _iter_masked_json_mapping(item)
+        else:
+            yield _JSON_ENCODER.encode(_mask_value(item, masked, keyed))
+    yield "]"
 
 def mask_string(text: str, show_chars: int = 6) -> str:
     """Return a masked string showing only the first and last characters with dots in between"""
@@ -60,38 +155,88 @@ def mask_string(text: str, show_chars: int = 6) -> str:
 
     return f"{text[:show_chars]}…{text[-show_chars:]}"
 
+_FLOAT_STRUCT = Struct(">f")
+
+def _parse_int(value: str) -> int:
+    # Unsigned and signed int
+    return int(value, 16)
+
+def _parse_float(value: str) -> float:
+    # Float in hex IEEE 754
+    # sample: value = 43E26188
+    return _FLOAT_STRUCT.unpack(bytes.fromhex(value))[0]
+
+def _parse_string(value: str) -> str:
+    return value
+
+# the type prefixes that are used by the lala.cgi - any other prefix starting with 'u' or 'i' will
+# be added on the fly
+_VALUE_PARSERS = {
+    "fl": _parse_float,
+    "st": _parse_string,
+    "u1": _parse_int,
+    "u3": _parse_int,
+    "u6": _parse_int,
+    "u8": _parse_int,
+    "i1": _parse_int,
+    "i3": _parse_int,
+    "i8": _parse_int,
+}
+
+def _get_value_parser(key: str):
+    parser = _VALUE_PARSERS.get(key, None)
+    if parser is None and (key.startswith("u") or key.startswith("i")):
+        parser = _VALUE_PARSERS[key] = _parse_int
+    return parser
+
+_BULK_MIN_LENGTH = 6
+
+@lru_cache(maxsize=64)
+def _get_float_array_struct(length: int) -> Struct:
+    return Struct(f">{length}f")
+
 def parse_value(value: str):
     """Parses numeric values, Senec supplies them as hex."""
-
     try:
-        parts = value.split("_")
-        key = parts[0]
-        if len(parts) > 2:
-            value = '_'.join(parts[1:])
-        elif len(parts) > 1:
-            value = parts[1]
-        else:
-            # looks like the value is 'not encoded' - no '_' present...
-            return value
-
+        key, separator, payload = value.partition("_")
     except Exception as e:
         _LOGGER.warning(f"Error parsing value: {value} - {e}")
         return value
 
-    # if key == "u8":
-    #    return unpack(">B", bytes.fromhex(value))[0]
-    # el
-    if key.startswith("u") or key.startswith("i"):
-        # Unsigned and signed int
-        return int(value, 16)
-    elif key == "fl":
-        # Float in hex IEEE 754
-        # sample: value = 43E26188
-        return unpack(">f", bytes.fromhex(value))[0]
-    elif key == "st":
-        # String
+    if not separator:
+        # looks like the value is 'not encoded' - no '_' present...
         return value
-    return f"{key}_{value}"
+
+    parser = _VALUE_PARSERS.get(key, None)
+    if parser is _parse_int:
+        # the most common case - save the extra call
+        return int(payload, 16)
+    elif parser is None:
+        parser = _get_value_parser(key)
+        if parser is None:
+            return value
+    return parser(payload)
+
+def parse_list(values: list) -> list:
+    """Parses a list of values - homogeneous arrays (e.g. the BMS cell values) are decoded in bulk."""
+    count = len(values)
+    # for short arrays (e.g. the three phases) the homogeneity check costs more than it saves
+    if count >= _BULK_MIN_LENGTH and isinstance(values[0], str):
+        prefix = values[0][:3]
+        parser = _VALUE_PARSERS.get(prefix[:2], None) if prefix[2:] == "_" else None
+        try:
+            if parser is _parse_float:
+                # all values must be 'fl_' + 8 hex chars...
+                if {(a_value[:3], len(a_value)) for a_value in values} == {("fl_", 11)}:
+                    return list(_get_float_array_struct(count).unpack(bytes.fromhex("".join([a_value[3:] for a_value in values]))))
+            elif parser is _parse_int:
+                if {a_value[:3] for a_value in values} == {prefix}:
+                    return [int(a_value[3:], 16) for a_value in values]
+        except (TypeError, ValueError):
+            # at least one of the values is not a valid hex value - fallback to the single value parsing
+            pass
+
+    return [parse_value(a_value) for a_value in values]
 
 
 def parse(raw: dict):
@@ -101,10 +246,191 @@ def parse(raw: dict):
         elif isinstance(v, dict):
             raw[k] = parse(v)
         elif isinstance(v, list):
-            raw[k] = [parse_value(i) for i in v]
+            raw[k] = parse_list(v)
     return raw
 
 
+@lru_cache(maxsize=256)
+def _get_section_layout(fields: tuple) -> dict:
+    # the field -> position mapping is shared by all records with the same fields (so by all polls)
+    return {a_field: idx for idx, a_field in enumerate(fields)}
+
+class LalaSection(MutableMapping):
+    """A decoded lala.cgi section: the values are kept in a single list (homogeneous numeric arrays as
+    array('f') or array('Q')) - the field layout is shared between the polls. The record can be used like
+    the dict that parse() did return."""
+    __slots__ = ("_layout", "_values")
+
+    def __init__(self, fields: tuple = (), values: list = None):
+        self._layout = _get_section_layout(fields)
+        self._values = values if values is not None else []
+
+    def __getitem__(self, key):
+        return self._values[self._layout[key]]
+
+    def __setitem__(self, key, value):
+        idx = self._layout.get(key, None)
+        if idx is None:
+            self._layout = _get_section_layout(tuple(self._layout) + (key,))
+            self._values.append(value)
+        else:
+            self._values[idx] = value
+
+    def __delitem__(self, key):
+        idx = self._layout[key]
+        self._layout = _get_section_layout(tuple(a_field for a_field in self._layout if a_field != key))
+        del self._values[idx]
+
+    def __contains__(self, key):
+        return key in self._layout
+
+    def __iter__(self):
+        return iter(self._layout)
+
+    def __len__(self):
+        return len(self._values)
+
+    def get(self, key, default=None):
+        idx = self._layout.get(key, None)
+        return default if idx is None else self._values[idx]
+
+    def to_dict(self) -> dict:
+        return {a_field: (a_value.tolist() if isinstance(a_value, array) else
+                          a_value.to_dict() if isinstance(a_value, LalaSection) else a_value)
+                for a_field, a_value in zip(self._layout, self._values)}
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+_BIG_ENDIAN = sys.byteorder == "big"
+
+def _decode_array(values: list):
+    # homogeneous arrays will be decoded straight into the typed array - without the intermediate list (and
+    # the python float/int object per value)
+    count = len(values)
+    if count > 0 and type(values[0]) is str:
+        prefix = values[0][:3]
+        parser = _VALUE_PARSERS.get(prefix[:2], None) if prefix[2:] == "_" else None
+        try:
+            if parser is _parse_float or parser is _parse_int:
+                # the payloads can't contain a '_' - so the prefix can only be found at the start of the values
+                payloads = "".join(values).split(prefix)
+                if len(payloads) == count + 1 and payloads[0] == "":
+                    del payloads[0]
+                    if parser is _parse_int:
+                        return array("Q", [*map(int, payloads, repeat(16))])
+                    elif {*map(len, payloads)} == {8}:
+                        # IEEE 754 single precision (big endian) - so there is no loss when we store them as 'f'
+                        decoded = array("f", bytes.fromhex("".join(payloads)))
+                        if not _BIG_ENDIAN:
+                            decoded.byteswap()
+                        return decoded
+        except (TypeError, ValueError, OverflowError):
+            # at least one of the values is not a valid hex value (or a negative int) - fallback to the
+            # single value parsing
+            pass
+
+    decoded = parse_list(values)
+    if count > 0 and type(values[0]) is str:
+        try:
+            if values[0].startswith("fl_"):
+                return array("f", decoded)
+            elif isinstance(decoded[0], int):
+                return array("Q", decoded)
+        except (TypeError, OverflowError):
+            # mixed content (e.g. 'VARIABLE_NOT_FOUND' entries) - keep the list
+            pass
+    return decoded
+
+def _decode_any(value):
+    a_type = type(value)
+    if a_type is str:
+        return parse_value(value)
+    elif a_type is list:
+        return _decode_array(value)
+    elif isinstance(value, dict):
+        return decode_section(value)
+    return value
+
+def decode_section(raw: dict) -> LalaSection:
+    return LalaSection(tuple(raw), [_decode_any(a_value) for a_value in raw.values()])
+
+def decode(raw: dict) -> dict:
+    """Non mutating variant of parse() for the lala.cgi response - every section will be a LalaSection."""
+    return {a_section: _decode_any(a_values) for a_section, a_values in raw.items()}
+
+def to_dict(data: dict) -> dict:
+    """Plain dict (and list) view of a decoded lala.cgi response."""
+    if data is None:
+        return None
+    return {a_section: (a_values.to_dict() if isinstance(a_values, LalaSection) else
+                        a_values.tolist() if isinstance(a_values, array) else a_values)
+            for a_section, a_values in data.items()}
+
+
+_MISSING = object()
+
+def diff(previous: dict, current: dict) -> dict:
+    """The changed fields per section between two decoded lala.cgi responses - for a section that could not
+    be compared on field level (e.g. 'VARIABLE_NOT_FOUND' or a missing section) the value is None."""
+    changes = {}
+    for a_section in previous.keys() | current.keys():
+        a_previous = previous.get(a_section, _MISSING)
+        a_current = current.get(a_section, _MISSING)
+        if a_previous is a_current:
+            # a section from the cache (skipped tier)
+            continue
+
+        if isinstance(a_previous, LalaSection) and isinstance(a_current, LalaSection):
+            if a_previous._layout is a_current._layout:
+                a_fields = frozenset(a_field for a_field, a_old, a_new in
+                                     zip(a_current._layout, a_previous._values, a_current._values) if a_old != a_new)
+            else:
+                a_fields = frozenset(a_field for a_field in a_previous.keys() | a_current.keys()
+                                     if a_previous.get(a_field, _MISSING) != a_current.get(a_field, _MISSING))
+            if len(a_fields) > 0:
+                changes[a_section] = a_fields
+        elif a_previous != a_current:
+            changes[a_section] = None
+    return changes
+
+def merge_diffs(changes: dict, other: dict) -> dict:
+    for a_section, a_fields in other.items():
+        if a_section not in changes:
+            changes[a_section] = a_fields
+        elif changes[a_section] is not None:
+            changes[a_section] = None if a_fields is None else changes[a_section] | a_fields
+    return changes
+
+
+def get_value(api, attr: str, args: tuple | None = None):
+    # the value of a property - or the result of a method call (SENEC.Connect: system_id & wallbox_id)
+    value = getattr(api, attr)
+    return value if args is None else value(*args)
+
+# the sources that could not be resolved - every source will be logged only once as warning
+_SNAPSHOT_FAILED_SOURCES = set()
+
+def snapshot(api, sources: Iterable[tuple]) -> Mapping:
+    """All (derived) values of one poll - so they will be calculated only once and not for every entity
+    and state write. Keyed by the (attr, args) tuple of 'get_value()'. Arrays & lists are stored as tuple,
+    so the snapshot will not change, when the api modifies its (raw) data in place."""
+    values = {}
+    for a_source in sources:
+        try:
+            a_value = get_value(api, *a_source)
+            values[a_source] = tuple(a_value) if type(a_value) in (array, list) else a_value
+        except Exception as exc:
+            a_failed_key = (type(api).__name__, a_source[0])
+            if a_failed_key not in _SNAPSHOT_FAILED_SOURCES:
+                _SNAPSHOT_FAILED_SOURCES.add(a_failed_key)
+                _LOGGER.warning(f"snapshot(): could not resolve '{a_source[0]}' - {type(exc).__name__}: {exc}")
+            else:
+                _LOGGER.debug(f"snapshot(): could not resolve '{a_source[0]}' - {type(exc).__name__}: {exc}")
+            values[a_source] = None
+    return MappingProxyType(values)
+
+
 def get_as_hex(input, length: int) -> str:
     out = f'{input:X}'
     while len(out) < length:
@@ -101,9 +101,9 @@ class SenecSelect(SenecEntity, SelectEntity, RestoreEntity):
     def current_option(self) -> str | None:
         try:
             if self.entity_description.array_key is not None:
-                value = getattr(self.coordinator.senec, self.entity_description.array_key)[self.entity_description.array_pos]
+                value = self._api_value()[self.entity_description.array_pos]
             else:
-                value = getattr(self.coordinator.senec, self.entity_description.key)
+                value = self._api_value()
 
             # if value is not set or the unknown-wallbox value, then check, if we
             # have a previous value... and then use it - or reset it to None
@@ -1,11 +1,12 @@
 """Platform for Senec sensors."""
 import logging
 from dataclasses import replace
+from time import monotonic
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.core import State
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
@@ -95,6 +96,10 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry,
                 if 'require_stats_fields' in description.controls:
                     if coordinator._statistics_available:
                         add_entity = True
+                elif 'require_no_stats_fields' in description.controls:
+                    # the locally integrated totals are only required, when there are no STATISTIC data
+                    if not coordinator._statistics_available:
+                        add_entity = True
                 else:
                     add_entity = True
 
@@ -108,6 +113,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry,
 # class SenecSensor(SenecEntity, RestoreSensor, SensorEntity):
 class SenecSensor(SenecEntity, SensorEntity, RestoreEntity):
     """Sensor for the single values (e.g. pv power, ac power)."""
+    _skip_unchanged_lala_updates = True
 
     def __init__(
             self,
@@ -148,14 +154,46 @@ class SenecSensor(SenecEntity, SensorEntity, RestoreEntity):
         if self._is_total_increasing:
             a_coordinator.add_total_increasing_sensor(self)
 
+        # deadband: the last written value & when it has been written
+        self._has_deadband: bool = (isinstance(a_description, ExtSensorEntityDescription) and
+                                    (a_description.deadband is not None or a_description.deadband_relative is not None))
+        self._deadband_value: float | None = None
+        self._deadband_ts: float = 0
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if self._has_deadband and self._is_within_deadband():
+            return
+        super()._handle_coordinator_update()
+
+    def _is_within_deadband(self) -> bool:
+        # True, when the change (compared to the last written value) is insignificant - the 'max silence' and
+        # an unavailable coordinator will always cause a state write
+        value = self.native_value
+        now = monotonic()
+        if (self.coordinator.last_update_success and
+                isinstance(value, (int, float)) and not isinstance(value, bool) and
+                self._deadband_value is not None and
+                now - self._deadband_ts < self.entity_description.deadband_max_silence_in_sec):
+            threshold = max(self.entity_description.deadband or 0,
+                            abs(self._deadband_value) * (self.entity_description.deadband_relative or 0))
+            if abs(value - self._deadband_value) < threshold:
+                return True
+
+        self._deadband_value = value if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+        self._deadband_ts = now
+        return False
+
     @property
     def extra_state_attributes(self):
         if self.coordinator.data is None:
             return None
 
         # even if this is currently implemented generically, only the new WebAPI WALLBOX Sensor
-        # 'wallbox_status' is implementing attrs
-        if self.entity_description.key in ["wallbox_1_state", "wallbox_2_state", "wallbox_3_state", "wallbox_4_state"]:
+        # 'wallbox_status', the lala.cgi 'lala_response_time' and the per module BMS cell spreads are implementing attrs
+        if self.entity_description.key in ["wallbox_1_state", "wallbox_2_state", "wallbox_3_state", "wallbox_4_state", "lala_response_time",
+                                           "bms_cell_volt_spread_a", "bms_cell_volt_spread_b", "bms_cell_volt_spread_c", "bms_cell_volt_spread_d",
+                                           "bms_cell_temp_spread_a", "bms_cell_temp_spread_b", "bms_cell_temp_spread_c", "bms_cell_temp_spread_d"]:
             attr_func_name = f"{self.entity_description.key}_attr"
             if hasattr(self.coordinator.senec, attr_func_name):
                 return getattr(self.coordinator.senec, attr_func_name)
@@ -164,16 +202,14 @@ class SenecSensor(SenecEntity, SensorEntity, RestoreEntity):
     @property
     def native_value(self):
         """Return the current state."""
-        if self.system_id is not None:
-            value = getattr(self.coordinator.senec, self.entity_description.key)(self.system_id, self.wallbox_id)
-        elif self.entity_description.array_key is not None:
-            data = getattr(self.coordinator.senec, self.entity_description.array_key)
+        if self.system_id is None and self.entity_description.array_key is not None:
+            data = self._api_value()
             if data is not None and len(data) > self.entity_description.array_pos:
                 value = data[self.entity_description.array_pos]
             else:
                 value = None
         else:
-            value = getattr(self.coordinator.senec, self.entity_description.key)
+            value = self._api_value()
 
         # _LOGGER.debug( str(sensor)+' '+ str(type(value).__name__) +' '+str(value))
         if value is None:
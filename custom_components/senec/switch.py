@@ -125,10 +125,9 @@ class SenecSwitch(SenecEntity, SwitchEntity):
         # return self.coordinator.data.get("title", "") == "foo"
         try:
             if self.entity_description.array_key is not None:
-                value = getattr(self.coordinator.senec, self.entity_description.array_key)[
-                            self.entity_description.array_pos] == 1
+                value = self._api_value()[self.entity_description.array_pos] == 1
             else:
-                value = getattr(self.coordinator.senec, self.entity_description.key)
+                value = self._api_value()
 
             if value is not None and self.entity_description.inverted:
                 value = not value
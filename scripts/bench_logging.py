@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Micro-benchmark of the per poll debug logging cost (when DEBUG is NOT enabled).
+
+Compares the previous 'f-string + util.mask_map()' log call with the lazy 'util.lazy_mask_map()'
+variant - both with the coordinator data of a full BMS + wallbox lala.cgi payload.
+
+Usage: python3 scripts/bench_logging.py [number_of_iterations]
+"""
+import logging
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from bench_parse import CAPTURED_PAYLOAD, util
+
+_LOGGER = logging.getLogger("bench_logging")
+
+
+def log_eager(data: dict):
+    _LOGGER.debug(f"read: {util.mask_map(data)}")
+
+
+def log_lazy(data: dict):
+    _LOGGER.debug("read: %s", util.lazy_mask_map(data))
+
+
+def bench(log_func, data: dict, number: int, repeat: int = 7) -> float:
+    best = None
+    for _ in range(repeat):
+        start = perf_counter()
+        for _ in range(number):
+            log_func(data)
+        duration = (perf_counter() - start) / number
+        best = duration if best is None else min(best, duration)
+    return best
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    logging.basicConfig(level=logging.INFO)
+    # the same structure the coordinator will log with every poll
+    data = {"data": util.decode(CAPTURED_PAYLOAD), "version": None}
+
+    eager_time = bench(log_eager, data, number)
+    lazy_time = bench(log_lazy, data, number)
+
+    print(f"mask_map (eager): {eager_time * 1e6:10.2f} µs per poll")
+    print(f"lazy_mask_map:    {lazy_time * 1e6:10.2f} µs per poll")
+    print(f"speedup:          {eager_time / lazy_time:10.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Micro-benchmark of the lala.cgi response decoders (pysenec_ha.util.parse & pysenec_ha.util.decode).
+
+Usage: python3 scripts/bench_parse.py [number_of_iterations]
+"""
+import copy
+import importlib.util
+import sys
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+from struct import unpack, pack
+
+# load the util module directly (without the Home Assistant dependencies of the integration package)
+_UTIL_PATH = Path(__file__).resolve().parent.parent / "custom_components" / "senec" / "pysenec_ha" / "util.py"
+_spec = importlib.util.spec_from_file_location("senec_util", _UTIL_PATH)
+util = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(util)
+
+
+def _fl(value: float) -> str:
+    return f"fl_{pack('>f', value).hex().upper()}"
+
+
+def _u8(value: int) -> str:
+    return f"u8_{value:02X}"
+
+
+def _u3(value: int) -> str:
+    return f"u3_{value:08X}"
+
+
+# a full-section response of a SENEC.Home V3 (4 BMS modules & 4 wallboxes) - values anonymized
+CAPTURED_PAYLOAD = {
+    "ENERGY": {
+        "STAT_STATE": _u8(14),
+        "STAT_HOURS_OF_OPERATION": _u3(31532),
+        "GUI_GRID_POW": _fl(-1234.56),
+        "GUI_HOUSE_POW": _fl(456.78),
+        "GUI_INVERTER_POWER": _fl(2345.67),
+        "GUI_BAT_DATA_FUEL_CHARGE": _fl(87.5),
+        "GUI_BAT_DATA_POWER": _fl(654.32),
+        "GUI_BAT_DATA_VOLTAGE": _fl(52.1),
+        "GUI_BAT_DATA_CURRENT": _fl(12.55),
+        "SAFE_CHARGE_RUNNING": _u8(0),
+        "LI_STORAGE_MODE_RUNNING": _u8(0),
+    },
+    "TEMPMEASURE": {"BATTERY_TEMP": _fl(24.5), "CASE_TEMP": _fl(31.2), "MCU_TEMP": _fl(45.7)},
+    "PV1": {
+        "MPP_VOL": [_fl(412.3), _fl(398.1), _fl(0.0)],
+        "MPP_CUR": [_fl(3.12), _fl(2.98), _fl(0.0)],
+        "MPP_POWER": [_fl(1286.4), _fl(1186.3), _fl(0.0)],
+    },
+    "PM1OBJ1": {
+        "FREQ": _fl(50.01),
+        "U_AC": [_fl(231.2), _fl(229.8), _fl(232.4)],
+        "I_AC": [_fl(1.2), _fl(0.8), _fl(2.1)],
+        "P_AC": [_fl(-410.2), _fl(-380.3), _fl(-444.1)],
+        "P_TOTAL": _fl(-1234.56),
+    },
+    "PM1OBJ2": {
+        "FREQ": _fl(50.01),
+        "U_AC": [_fl(231.2), _fl(229.8), _fl(232.4)],
+        "I_AC": [_fl(1.2), _fl(0.8), _fl(2.1)],
+        "P_AC": [_fl(410.2), _fl(380.3), _fl(444.1)],
+        "P_TOTAL": _fl(1234.56),
+    },
+    "BAT1": {"SPARE_CAPACITY": _u8(10)},
+    "FAN_SPEED": {"INV_LV": _u8(0), "INV_HV": _u8(0)},
+    "SOCKETS": {a_key: [_u8(0), _u8(1)] for a_key in ["FORCE_ON", "ENABLE", "USE_TIME", "LOWER_LIMIT", "UPPER_LIMIT",
+                                                      "POWER_ON_TIME", "SWITCH_ON_HOUR", "SWITCH_ON_MINUTE", "TIME_LIMIT"]},
+    "BMS": {
+        "CURRENT": [_fl(3.1), _fl(3.2), _fl(3.0), _fl(3.1)],
+        "VOLTAGE": [_fl(52.1), _fl(52.2), _fl(52.0), _fl(52.1)],
+        "SOC": [_u8(87), _u8(88), _u8(86), _u8(87)],
+        "SOH": [_u8(97), _u8(98), _u8(96), _u8(97)],
+        "CYCLES": [_u3(1432), _u3(1433), _u3(1431), _u3(1432)],
+        **{f"CELL_TEMPERATURES_MODULE_{a_letter}": [_fl(24.0 + i * 0.1) for i in range(6)] for a_letter in "ABCD"},
+        **{f"CELL_VOLTAGES_MODULE_{a_letter}": [_u3(3251 + i) for i in range(16)] for a_letter in "ABCD"},
+    },
+    "WALLBOX": {
+        "APPARENT_CHARGING_POWER": [_fl(11000.0), _fl(0.0), _fl(0.0), _fl(0.0)],
+        "L1_CHARGING_CURRENT": [_fl(16.0), _fl(0.0), _fl(0.0), _fl(0.0)],
+        "L2_CHARGING_CURRENT": [_fl(16.0), _fl(0.0), _fl(0.0), _fl(0.0)],
+        "L3_CHARGING_CURRENT": [_fl(16.0), _fl(0.0), _fl(0.0), _fl(0.0)],
+        "L1_USED": [_u8(1), _u8(0), _u8(0), _u8(0)],
+        "L2_USED": [_u8(1), _u8(0), _u8(0), _u8(0)],
+        "L3_USED": [_u8(1), _u8(0), _u8(0), _u8(0)],
+        "EV_CONNECTED": [_u8(1), _u8(0), _u8(0), _u8(0)],
+        "MIN_CHARGING_CURRENT": [_fl(6.0), _fl(6.0), _fl(6.0), _fl(6.0)],
+        "ALLOW_INTERCHARGE": _u8(0),
+        "SET_ICMAX": [_fl(16.0), _fl(16.0), _fl(16.0), _fl(16.0)],
+        "SET_IDEFAULT": [_fl(6.0), _fl(6.0), _fl(6.0), _fl(6.0)],
+        "SMART_CHARGE_ACTIVE": [_u8(3), _u8(0), _u8(0), _u8(0)],
+        "STATE": [_u8(161), _u8(0), _u8(0), _u8(0)],
+        "PROHIBIT_USAGE": [_u8(0), _u8(0), _u8(0), _u8(0)],
+    },
+}
+
+
+def legacy_parse_value(value: str):
+    # the implementation before the lookup-table dispatch (for comparison)
+    parts = value.split("_")
+    key = parts[0]
+    if len(parts) > 2:
+        value = '_'.join(parts[1:])
+    elif len(parts) > 1:
+        value = parts[1]
+    else:
+        return value
+    if key.startswith("u") or key.startswith("i"):
+        return int(value, 16)
+    elif key == "fl":
+        return unpack(">f", bytes.fromhex(value))[0]
+    elif key == "st":
+        return value
+    return f"{key}_{value}"
+
+
+def legacy_parse(raw: dict):
+    for k, v in raw.items():
+        if isinstance(v, str):
+            raw[k] = legacy_parse_value(v)
+        elif isinstance(v, dict):
+            raw[k] = legacy_parse(v)
+        elif isinstance(v, list):
+            raw[k] = [legacy_parse_value(i) for i in v]
+    return raw
+
+
+def bench(parse_func, number: int, repeat: int = 7) -> float:
+    # parse() works in place - so every run needs its own copies of the payload (copying is not measured)
+    best = None
+    for _ in range(repeat):
+        batch = [copy.deepcopy(CAPTURED_PAYLOAD) for _ in range(number)]
+        start = perf_counter()
+        for a_payload in batch:
+            parse_func(a_payload)
+        duration = (perf_counter() - start) / number
+        best = duration if best is None else min(best, duration)
+    return best
+
+
+def retained_memory(decode_func, number: int = 100) -> float:
+    # the memory that is kept per decoded payload (parse() works in place - so the copy is the result)
+    tracemalloc.start()
+    results = [decode_func(CAPTURED_PAYLOAD) for _ in range(number)]
+    size = tracemalloc.get_traced_memory()[0] / number
+    tracemalloc.stop()
+    del results
+    return size
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    if legacy_parse(copy.deepcopy(CAPTURED_PAYLOAD)) != util.parse(copy.deepcopy(CAPTURED_PAYLOAD)):
+        raise SystemExit("decoders do not return the same result!")
+    if util.to_dict(util.decode(CAPTURED_PAYLOAD)) != util.parse(copy.deepcopy(CAPTURED_PAYLOAD)):
+        raise SystemExit("decode() does not return the same result as parse()!")
+
+    legacy_time = bench(legacy_parse, number)
+    current_time = bench(util.parse, number)
+
+    print(f"legacy parse: {legacy_time * 1e6:8.1f} µs")
+    print(f"parse:        {current_time * 1e6:8.1f} µs")
+    print(f"speedup:      {legacy_time / current_time:8.2f}x")
+
+    # decode() does not touch the payload - so there is no need for the copies
+    decode_time = bench(lambda a_payload: util.decode(a_payload), number)
+    parse_memory = retained_memory(lambda a_payload: util.parse(copy.deepcopy(a_payload)))
+    decode_memory = retained_memory(util.decode)
+    print(f"decode:       {decode_time * 1e6:8.1f} µs")
+    print(f"parse memory: {parse_memory / 1024:8.1f} KiB")
+    print(f"decode memory:{decode_memory / 1024:8.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+"""Load the pure python helper modules of pysenec_ha without the Home Assistant dependencies of the
+integration package (like scripts/bench_parse.py does)."""
+import importlib.util
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PYSENEC_HA = ROOT / "custom_components" / "senec" / "pysenec_ha"
+
+
+def load(path: Path, name: str):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_pysenec_ha(module_name: str):
+    return load(PYSENEC_HA / f"{module_name}.py", f"senec_{module_name}")
+
+
+def load_script(script_name: str):
+    return load(ROOT / "scripts" / f"{script_name}.py", f"senec_script_{script_name}")
@@ -0,0 +1,63 @@
+"""Test the integration of the power values into energy totals."""
+import pytest
+
+from tests.standalone import load_pysenec_ha
+
+energy = load_pysenec_ha("energy")
+
+
+def _integrator(max_gap: float = 60):
+    return energy.EnergyIntegrator(("a", "b"), max_gap)
+
+
+def test_trapezoidal_integration():
+    integrator = _integrator()
+    integrator.add(0, {"a": 1000, "b": 0})
+    integrator.add(36, {"a": 3000, "b": 0})
+    # (1000 W + 3000 W) / 2 * 36 s = 72000 Ws = 0.02 kWh
+    assert integrator.total("a") == pytest.approx(0.02)
+    assert integrator.total("b") == 0
+    assert integrator.total("unknown") is None
+
+
+def test_missing_values_are_skipped():
+    integrator = _integrator()
+    integrator.add(0, {"a": 1000})
+    integrator.add(36, {"a": None, "b": 1000})
+    integrator.add(72, {"a": 1000, "b": 1000})
+    assert integrator.total("a") == 0
+    assert integrator.total("b") == pytest.approx(0.01)
+
+
+def test_gap_produces_no_energy():
+    integrator = _integrator(max_gap=60)
+    integrator.add(0, {"a": 3600})
+    integrator.add(600, {"a": 3600})
+    assert integrator.total("a") == 0
+    # the sample after the gap is the new base
+    integrator.add(610, {"a": 3600})
+    assert integrator.total("a") == pytest.approx(0.01)
+
+
+def test_clock_step_backwards_rebases():
+    integrator = _integrator()
+    integrator.add(1000, {"a": 3600})
+    integrator.add(100, {"a": 3600})
+    assert integrator.total("a") == 0
+    # the integration continues from the new timestamp (and does not wait for the clock to catch up)
+    integrator.add(110, {"a": 3600})
+    assert integrator.total("a") == pytest.approx(0.01)
+
+
+def test_checkpoint_and_restore():
+    integrator = _integrator()
+    integrator.add(0, {"a": 3600})
+    integrator.add(10, {"a": 3600})
+
+    restored = _integrator()
+    restored.restore(integrator.checkpoint())
+    assert restored.total("a") == pytest.approx(0.01)
+    # invalid data is ignored
+    restored.restore(None)
+    restored.restore({"totals": {"a": "x", "unknown": 1}})
+    assert restored.total("a") == pytest.approx(0.01)
@@ -0,0 +1,78 @@
+"""Test the packing of the lala.cgi request into chunks (and the merge of the chunk responses)."""
+import copy
+import json
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.senec.pysenec_ha import SenecLocal  # noqa: E402
+
+MAX_LEN = 600
+
+FORM = {
+    "TEMPMEASURE": {"BATTERY_TEMP": "", "CASE_TEMP": "", "MCU_TEMP": ""},
+    "PV1": {"MPP_VOL": "", "MPP_CUR": "", "MPP_POWER": ""},
+    "PM1OBJ1": {"FREQ": "", "U_AC": "", "I_AC": "", "P_AC": "", "P_TOTAL": ""},
+    "PM1OBJ2": {"FREQ": "", "U_AC": "", "I_AC": "", "P_AC": "", "P_TOTAL": ""},
+    "ENERGY": {a_field: "" for a_field in ["STAT_STATE", "STAT_HOURS_OF_OPERATION", "GUI_BAT_DATA_POWER",
+                                           "GUI_BAT_DATA_VOLTAGE", "GUI_BAT_DATA_CURRENT", "GUI_BAT_DATA_FUEL_CHARGE",
+                                           "GUI_HOUSE_POW", "GUI_INVERTER_POWER", "GUI_GRID_POW",
+                                           "SAFE_CHARGE_RUNNING", "LI_STORAGE_MODE_RUNNING"]},
+    "BAT1": {"SPARE_CAPACITY": ""},
+    "FAN_SPEED": {},
+    "BMS": {
+        "CURRENT": "", "VOLTAGE": "", "SOC": "", "SOH": "", "CYCLES": "",
+        **{f"CELL_TEMPERATURES_MODULE_{a_letter}": "" for a_letter in "ABCD"},
+        **{f"CELL_VOLTAGES_MODULE_{a_letter}": "" for a_letter in "ABCD"},
+    },
+    "WALLBOX": {a_field: "" for a_field in ["APPARENT_CHARGING_POWER", "L1_CHARGING_CURRENT", "L1_USED",
+                                            "L2_CHARGING_CURRENT", "L2_USED", "L3_CHARGING_CURRENT", "L3_USED",
+                                            "EV_CONNECTED", "MIN_CHARGING_CURRENT", "ALLOW_INTERCHARGE",
+                                            "SET_ICMAX", "SET_IDEFAULT", "SMART_CHARGE_ACTIVE", "STATE",
+                                            "PROHIBIT_USAGE"]},
+    # a section that can only be requested in a chunk of its own
+    "WIZARD": {f"A_VERY_LONG_FIELD_NAME_OF_THE_WIZARD_SECTION_{idx:03d}": "" for idx in range(40)},
+}
+
+
+def _compact_len(data: dict) -> int:
+    return len(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+
+
+def test_chunks_are_not_larger_than_max_len():
+    chunks = SenecLocal._build_senec_lala_chunks(copy.deepcopy(FORM), MAX_LEN)
+    assert len(chunks) > 1
+    for a_chunk in chunks:
+        assert _compact_len(a_chunk) <= MAX_LEN
+
+
+def test_chunks_are_packed():
+    # first-fit-decreasing: fewer chunks than (split) sections
+    chunks = SenecLocal._build_senec_lala_chunks(copy.deepcopy(FORM), MAX_LEN)
+    assert len(chunks) < sum(len(a_chunk) for a_chunk in chunks)
+    assert _compact_len(FORM) // MAX_LEN + 1 <= len(chunks)
+
+
+def test_merged_chunks_are_lossless():
+    chunks = SenecLocal._build_senec_lala_chunks(copy.deepcopy(FORM), MAX_LEN)
+    merged = {}
+    for a_chunk in chunks:
+        SenecLocal._merge_senec_lala_response(merged, copy.deepcopy(a_chunk))
+    assert merged == FORM
+    # every field is requested only once
+    assert sum(len(a_fields) or 1 for a_chunk in chunks for a_fields in a_chunk.values()) == \
+           sum(len(a_fields) or 1 for a_fields in FORM.values())
+
+
+def test_split_section_responses_are_merged_field_by_field():
+    responses = {}
+    SenecLocal._merge_senec_lala_response(responses, {"BMS": {"SOC": "u8_01"}, "ENERGY": "VARIABLE_NOT_FOUND"})
+    SenecLocal._merge_senec_lala_response(responses, {"BMS": {"SOH": "u8_02"}})
+    assert responses == {"BMS": {"SOC": "u8_01", "SOH": "u8_02"}, "ENERGY": "VARIABLE_NOT_FOUND"}
+
+
+def test_request_plan_bytes():
+    for a_chunk, a_bytes in SenecLocal._build_senec_lala_request_plan(copy.deepcopy(FORM), MAX_LEN):
+        assert json.loads(a_bytes) == a_chunk
+        assert len(a_bytes) <= MAX_LEN
@@ -0,0 +1,90 @@
+"""Test the lala.cgi decoder & the diff of the decoded responses."""
+import copy
+from array import array
+
+from tests.standalone import load_pysenec_ha, load_script
+
+util = load_pysenec_ha("util")
+bench_parse = load_script("bench_parse")
+CAPTURED_PAYLOAD = bench_parse.CAPTURED_PAYLOAD
+
+
+def test_decode_matches_parse():
+    """decode() returns the same values as the old (in place) parse."""
+    expected = bench_parse.legacy_parse(copy.deepcopy(CAPTURED_PAYLOAD))
+    assert util.parse(copy.deepcopy(CAPTURED_PAYLOAD)) == expected
+    assert util.to_dict(util.decode(CAPTURED_PAYLOAD)) == expected
+
+
+def test_decode_does_not_modify_the_payload():
+    payload = copy.deepcopy(CAPTURED_PAYLOAD)
+    util.decode(payload)
+    assert payload == CAPTURED_PAYLOAD
+
+
+def test_decode_typed_arrays():
+    decoded = util.decode(CAPTURED_PAYLOAD)
+    assert isinstance(decoded["ENERGY"], util.LalaSection)
+    assert isinstance(decoded["BMS"]["CELL_TEMPERATURES_MODULE_A"], array)
+    assert decoded["BMS"]["CELL_TEMPERATURES_MODULE_A"].typecode == "f"
+    assert decoded["BMS"]["CELL_VOLTAGES_MODULE_A"].typecode == "Q"
+    assert decoded["BMS"]["CELL_VOLTAGES_MODULE_A"][0] == 3251
+    assert decoded["PM1OBJ1"]["U_AC"].typecode == "f"
+
+
+def test_decode_mixed_arrays():
+    """Arrays that can't be decoded in bulk fall back to the single value parsing."""
+    decoded = util.decode({"SECTION": {
+        "FL_NOT_FOUND": ["fl_43E26188", "VARIABLE_NOT_FOUND"],
+        "MIXED_INT": ["u8_01", "u3_00000002"],
+        "NEGATIVE": ["u1_-1", "u1_2"],
+        "STRINGS": ["st_a", "st_b"],
+        "EMPTY": [],
+    }})["SECTION"]
+    assert decoded["FL_NOT_FOUND"] == [util.parse_value("fl_43E26188"), "VARIABLE_NOT_FOUND"]
+    assert decoded["MIXED_INT"] == array("Q", [1, 2])
+    assert decoded["NEGATIVE"] == [-1, 2]
+    assert decoded["STRINGS"] == ["a", "b"]
+    assert decoded["EMPTY"] == []
+
+
+def test_lala_section_mapping():
+    section = util.decode({"ENERGY": {"A": "u8_01", "B": "st_x"}})["ENERGY"]
+    assert section.get("A") == 1
+    assert section.get("C", 5) == 5
+    section["C"] = 3
+    del section["A"]
+    assert section.to_dict() == {"B": "x", "C": 3}
+
+
+def test_diff():
+    previous = util.decode(CAPTURED_PAYLOAD)
+    payload = copy.deepcopy(CAPTURED_PAYLOAD)
+    payload["ENERGY"]["GUI_HOUSE_POW"] = bench_parse._fl(111.0)
+    payload["BMS"]["SOC"][0] = bench_parse._u8(50)
+    payload["TEMPMEASURE"] = "VARIABLE_NOT_FOUND"
+    del payload["BAT1"]
+    current = util.decode(payload)
+
+    assert util.diff(previous, current) == {
+        "ENERGY": frozenset({"GUI_HOUSE_POW"}),
+        "BMS": frozenset({"SOC"}),
+        "TEMPMEASURE": None,
+        "BAT1": None,
+    }
+    assert util.diff(current, util.decode(payload)) == {}
+
+
+def test_diff_skips_cached_sections():
+    previous = util.decode(CAPTURED_PAYLOAD)
+    current = {**util.decode(CAPTURED_PAYLOAD), "ENERGY": previous["ENERGY"]}
+    assert "ENERGY" not in util.diff(previous, current)
+
+
+def test_merge_diffs():
+    changes = {"ENERGY": frozenset({"A"}), "BMS": None}
+    util.merge_diffs(changes, {"ENERGY": frozenset({"B"}), "BMS": frozenset({"SOC"}), "PV1": frozenset({"X"})})
+    assert changes == {"ENERGY": frozenset({"A", "B"}), "BMS": None, "PV1": frozenset({"X"})}
+
+    util.merge_diffs(changes, {"ENERGY": None})
+    assert changes["ENERGY"] is None
@@ -0,0 +1,116 @@
+"""Test the columnar MeasurementSeries against the former dict based total calculation."""
+import copy
+
+from tests.standalone import load_pysenec_ha
+
+timeseries = load_pysenec_ha("timeseries")
+MeasurementSeries = timeseries.MeasurementSeries
+
+MEASUREMENTS = ["POWER_GENERATION", "POWER_CONSUMPTION", "GRID_IMPORT", "GRID_EXPORT"]
+
+
+def _response(rows: list, ts_key_name: str = "timeSeries") -> dict:
+    return {
+        "measurements": list(MEASUREMENTS),
+        ts_key_name: [{
+            "date": f"2026-0{idx + 1}-01T00:00:00Z",
+            "measurements": {"durationInSeconds": 86400 * (idx + 1), "values": a_values}
+        } for idx, a_values in enumerate(rows)]
+    }
+
+
+YEAR = _response([[10.5, 20.25, 3.0, 4.0], [1.5, 2.75, 0.0, 8.0], [100.0, 0.0, 7.5, 0.25]])
+TODAY = _response([[0.5, 1.0, 0.25, 0.0]])
+
+
+# the dict based implementation (before the MeasurementSeries) - as reference
+def legacy_summ_total_dict_values(src_dict, dest_dict, ts_key_name: str = "timeSeries"):
+    src_values = src_dict[ts_key_name][0]["measurements"]["values"]
+    dest_values = dest_dict[ts_key_name][0]["measurements"]["values"]
+    dest_dict[ts_key_name][0]["measurements"]["values"] = [src_val + dest_val for src_val, dest_val in zip(src_values, dest_values)]
+    return dest_dict
+
+
+def legacy_aggregate_timeseries_data_if_needed(data, ts_key_name: str = "timeSeries"):
+    if data is None or not data[ts_key_name] or len(data[ts_key_name]) == 1:
+        return data
+
+    total_duration = 0
+    total_values = [0] * len(data["measurements"])
+    for ts in data[ts_key_name]:
+        total_duration += ts["measurements"]["durationInSeconds"]
+        values = ts["measurements"]["values"]
+        for i in range(len(values)):
+            total_values[i] += values[i]
+
+    return {
+        "measurements": data["measurements"],
+        "totals": data["totals"] if "totals" in data else {},
+        ts_key_name: [{
+            "date": data[ts_key_name][0]["date"],
+            "measurements": {"durationInSeconds": total_duration, "values": total_values}
+        }]
+    }
+
+
+def _without_totals(data: dict) -> dict:
+    return {a_key: a_value for a_key, a_value in data.items() if a_key != "totals"}
+
+
+def test_from_dict_to_dict_round_trip():
+    assert MeasurementSeries.from_dict(YEAR).to_dict() == YEAR
+    assert MeasurementSeries.from_dict(_response([[1, 2, 3, 4]], "timeseries"), "timeseries").to_dict("timeseries") == _response([[1, 2, 3, 4]], "timeseries")
+
+
+def test_compact_load_round_trip():
+    series = MeasurementSeries.from_dict(YEAR)
+    loaded = MeasurementSeries.load(copy.deepcopy(series.compact()))
+    assert loaded.to_dict() == YEAR
+    # the response structure (stored by older versions) can be loaded too
+    assert MeasurementSeries.load(YEAR).to_dict() == YEAR
+
+
+def test_invalid_data():
+    assert MeasurementSeries.from_dict(None) is None
+    assert MeasurementSeries.from_dict({"measurements": MEASUREMENTS, "timeSeries": []}) is None
+    assert MeasurementSeries.from_dict({"measurements": MEASUREMENTS, "timeSeries": [{"date": "x"}]}) is None
+    assert MeasurementSeries.load({"measurements": MEASUREMENTS, "columns": {}}) is None
+
+
+def test_aggregated_matches_legacy():
+    expected = legacy_aggregate_timeseries_data_if_needed(copy.deepcopy(YEAR))
+    assert MeasurementSeries.from_dict(YEAR).aggregated().to_dict() == _without_totals(expected)
+    # a single row is returned as it is
+    single = MeasurementSeries.from_dict(TODAY)
+    assert single.aggregated() is single
+
+
+def test_add_matches_legacy():
+    expected = legacy_summ_total_dict_values(copy.deepcopy(TODAY), legacy_aggregate_timeseries_data_if_needed(copy.deepcopy(YEAR)))
+    series = MeasurementSeries.from_dict(YEAR).aggregated().add(MeasurementSeries.from_dict(TODAY))
+    assert series.to_dict() == _without_totals(expected)
+
+
+def test_add_matches_by_measurement_name():
+    other = MeasurementSeries.from_dict({
+        "measurements": ["GRID_EXPORT", "UNKNOWN"],
+        "timeSeries": [{"date": "x", "measurements": {"durationInSeconds": 1, "values": [1.0, 99.0]}}]
+    })
+    series = MeasurementSeries.from_dict(TODAY).add(other)
+    assert series.total("GRID_EXPORT") == 1.0
+    assert series.total("POWER_GENERATION") == 0.5
+    assert series.total("UNKNOWN") is None
+    assert series.add(None) is series
+
+
+def test_short_rows_are_padded():
+    series = MeasurementSeries.from_dict({
+        "measurements": MEASUREMENTS,
+        "timeSeries": [
+            {"date": "d1", "measurements": {"durationInSeconds": 60, "values": [1, 2, 3, 4]}},
+            {"date": "d2", "measurements": {"values": [5, None]}},
+        ]
+    })
+    assert len(series) == 2
+    assert all(len(a_column) == 2 for a_column in series.columns.values())
+    assert series.aggregated().to_dict()["timeSeries"][0]["measurements"] == {"durationInSeconds": 60, "values": [6, 2, 3, 4]}